@@ -4,4 +4,7 @@ setup(
     name="card_game_engine",
     version="0.1",
     packages=find_packages(),
+    entry_points={
+        'console_scripts': ['simulate=src.simulate:main', 'card-server=src.server:main'],
+    },
 ) 
\ No newline at end of file
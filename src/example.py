@@ -1,4 +1,4 @@
-from models.card import Card, CardEffect
+from models.card import Card, CardEffect, standard_deck
 from models.deck import Deck
 from models.game_state import GameState, GamePhase
 from models.player_state import PlayerState
@@ -6,21 +6,7 @@ from typing import List
 
 def create_standard_deck() -> List[Card]:
     """Create a standard 52-card deck"""
-    suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-    cards = []
-    
-    for suit in suits:
-        for rank in range(1, 14):
-            name = f"{rank if rank not in {1,11,12,13} else {1:'Ace',11:'Jack',12:'Queen',13:'King'}[rank]} of {suit}"
-            cards.append(Card(
-                id=f"{suit}-{rank}",
-                name=name,
-                suit=suit,
-                rank=rank,
-                type='standard'
-            ))
-    
-    return cards
+    return standard_deck()
 
 def main():
     # Create game instance
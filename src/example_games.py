@@ -42,6 +42,7 @@ def play_poker_gui(num_players: int, initial_bankroll: int) -> None:
     ui = PygameUI()
     view = PokerView(ui)
     game = Poker(num_players, initial_bankroll)
+    game.subscribe(view)
     
     while view.running:
         current_player = game.game_state.get_current_player()
@@ -73,6 +74,7 @@ def play_blackjack_gui(num_players: int) -> None:
     ui = PygameUI()
     view = BlackjackView(ui)
     game = Blackjack(num_players)
+    game.subscribe(view)
     
     while view.running:
         current_player = game.game_state.get_current_player()
@@ -82,7 +84,7 @@ def play_blackjack_gui(num_players: int) -> None:
                 'dealer_hand': game.dealer_hand,
                 'hide_hole_card': True,
                 'player': current_player,
-                'hand_value': game.calculate_hand_value(current_player.get_hand())
+                'hand_value': game.hands[current_player.id].value
             }
             
             action = view.run_frame(game_state)
@@ -100,12 +102,13 @@ def play_blackjack_gui(num_players: int) -> None:
                 'dealer_hand': game.dealer_hand,
                 'hide_hole_card': False,
                 'player': winner,
-                'hand_value': game.calculate_hand_value(winner.get_hand())
+                'hand_value': game.hands[winner.id].value
             }
             view.draw(game_state)
             pygame.time.wait(3000)  # Show final state for 3 seconds
             # Reset for next round instead of ending
             game = Blackjack(num_players)
+            game.subscribe(view)
             
     pygame.quit()
 
@@ -113,6 +116,7 @@ def play_rummy_gui(num_players: int) -> None:
     ui = PygameUI()
     view = RummyView(ui)
     game = Rummy(num_players)
+    game.subscribe(view)
     
     while view.running:
         current_player = game.game_state.get_current_player()
@@ -139,6 +143,7 @@ def play_rummy_gui(num_players: int) -> None:
             pygame.time.wait(3000)  # Show final state for 3 seconds
             # Reset for next round instead of ending
             game = Rummy(num_players)
+            game.subscribe(view)
             
     pygame.quit()
 
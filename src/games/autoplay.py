@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from src.models.events import EventSink, GameEvent, GameEventType
+from src.models.hand_history import HandHistoryWriter
+from src.models.player_state import PlayerState
+from src.games.session import BlackjackSession, GameSession, PokerSession, RummySession
+
+GAME_TYPES = ("poker", "blackjack", "rummy")
+
+@dataclass
+class GameResult:
+    """Outcome of one headless game"""
+    game_type: str
+    index: int
+    seed: int
+    winner: Optional[str] = None
+    rounds: int = 0
+    turns: int = 0
+    # Seat ids in order, and each seat's bankroll (Poker) or score (Blackjack) after every round
+    seats: Tuple[str, ...] = ()
+    trajectory: List[Tuple[int, ...]] = field(default_factory=list)
+    round_wins: Dict[str, int] = field(default_factory=dict)
+
+class _RoundWinCounter(EventSink):
+    def __init__(self, result: GameResult):
+        self.result = result
+
+    def handle_event(self, event: GameEvent) -> None:
+        if event.event_type == GameEventType.ROUND_WON:
+            wins = self.result.round_wins
+            wins[event.player.id] = wins.get(event.player.id, 0) + 1
+
+def _play(session: GameSession, result: GameResult,
+          value: Optional[Callable[[PlayerState], int]] = None) -> GameResult:
+    """Run an AI-only session to the end, recording each seat's value after every round"""
+    game = session.game
+    seats = game.game_state.players
+    result.seats = tuple(player.id for player in seats)
+    game.subscribe(_RoundWinCounter(result))
+    while not session.over:
+        session.step()
+        if value and session.rounds > len(result.trajectory):
+            result.trajectory.append(tuple(value(seat) for seat in seats))
+    result.rounds = session.rounds
+    result.turns = session.turns
+    if session.winner:
+        result.winner = session.winner.id
+    return result
+
+def play_poker(result: GameResult, num_players: int, max_rounds: int,
+               sinks: Sequence[EventSink] = (), initial_bankroll: int = 1000) -> GameResult:
+    """Play AI-only Poker until one player has all the money or max_rounds hands are dealt"""
+    session = PokerSession.create(num_players, max_rounds, result.seed, sinks=sinks,
+                                  initial_bankroll=initial_bankroll)
+    return _play(session, result, PlayerState.get_bankroll)
+
+def play_blackjack(result: GameResult, num_players: int, max_rounds: int,
+                   sinks: Sequence[EventSink] = ()) -> GameResult:
+    """Play max_rounds AI-only Blackjack rounds from one shoe"""
+    session = BlackjackSession.create(num_players, max_rounds, result.seed, sinks=sinks)
+    _play(session, result, PlayerState.get_score)
+    if result.round_wins:
+        result.winner = max(result.round_wins, key=result.round_wins.get)
+    return result
+
+def play_rummy(result: GameResult, num_players: int, max_rounds: int,
+               sinks: Sequence[EventSink] = ()) -> GameResult:
+    """Play AI-only Rummy until someone goes out or the stock runs dry"""
+    return _play(RummySession.create(num_players, max_rounds, result.seed, sinks=sinks), result)
+
+_PLAYERS: Dict[str, Callable[..., GameResult]] = {
+    "poker": play_poker,
+    "blackjack": play_blackjack,
+    "rummy": play_rummy,
+}
+
+def play_game(game_type: str, index: int, seed: int, num_players: int, max_rounds: int,
+              history: Optional[HandHistoryWriter] = None) -> GameResult:
+    """Play one AI-only game of the given type (see GAME_TYPES) to completion, logging it to history if given"""
+    if game_type not in _PLAYERS:
+        raise ValueError(f"Unknown game type: {game_type}")
+    recorder = history.recorder() if history else None
+    result = _PLAYERS[game_type](GameResult(game_type, index, seed), num_players, max_rounds,
+                                 [recorder] if recorder else [])
+    if recorder:
+        history.end_game(recorder)
+    return result
@@ -0,0 +1,33 @@
+import numpy as np
+from src.games.hand_evaluator import FLUSH_TABLE, RANK_TABLE, _RANK_BIT, _RANK_KEY, _SUIT_OF
+
+# NumPy mirrors of the scalar evaluator's lookup tables
+_KEY_OF = np.array(_RANK_KEY, dtype=np.int64)
+_BIT_OF = np.array(_RANK_BIT, dtype=np.int64)
+_SUIT_OF_CODE = np.array(_SUIT_OF, dtype=np.int8)
+
+_sorted_keys = sorted(RANK_TABLE)
+_RANK_KEYS = np.array(_sorted_keys, dtype=np.int64)
+_RANK_VALUES = np.array([RANK_TABLE[key] for key in _sorted_keys], dtype=np.int32)
+
+# Dense flush table indexed by suit mask; 0 means "no flush in this suit"
+_FLUSH_VALUES = np.zeros(1 << 13, dtype=np.int32)
+for _mask, _rank in FLUSH_TABLE.items():
+    _FLUSH_VALUES[_mask] = _rank
+
+def evaluate_batch(codes: np.ndarray) -> np.ndarray:
+    """Rank an (N, k) array of encoded cards (k <= 7), one hand per row"""
+    codes = np.asarray(codes, dtype=np.intp)
+    if codes.ndim != 2 or codes.shape[1] > 7:
+        raise ValueError("Expected an (N, k) array of card codes with k <= 7")
+
+    keys = _KEY_OF[codes].sum(axis=1)
+    ranks = _RANK_VALUES[np.searchsorted(_RANK_KEYS, keys)]
+
+    # Cards in a hand are distinct, so summing rank bits per suit is an OR
+    bits = _BIT_OF[codes]
+    suits = _SUIT_OF_CODE[codes]
+    for suit in range(4):
+        flush = _FLUSH_VALUES[np.where(suits == suit, bits, 0).sum(axis=1)]
+        ranks = np.where(flush > 0, flush, ranks)
+    return ranks
@@ -1,137 +1,199 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from src.models.base_game import BaseGame
-from src.models.card import Card
+from src.models.card import Card, standard_deck
 from src.models.player_state import PlayerState
 from src.models.game_state import GamePhase
 from src.models.deck import Deck
+from src.models.shoe import Shoe
 from ..ui.terminal_ui import TerminalUI
-from ..models.player_action import PlayerActionType
+from ..models.player_action import PlayerAction, PlayerActionType
+from ..models.events import EventSink, GameEventType
+from .dealer_odds import DEALER_STANDS_ON, DEALER_TOTALS, NUM_CATEGORIES, card_category, dealer_distribution
+from .blackjack_strategy import StrategyTable, get_strategy_table
+from .blackjack_hand import BlackjackHand
+
+class BlackjackSnapshot(NamedTuple):
+    round_number: int
+    dealer_cards: Tuple[Card, ...]
 
 class Blackjack(BaseGame):
-    def __init__(self, num_players: int):
+    game_type = "Blackjack"
+    
+    def __init__(self, num_players: int, seed: Optional[int] = None, headless: bool = False,
+                 sinks: Iterable[EventSink] = ()):
         if num_players > 7:
             raise ValueError("Maximum 7 players allowed in Blackjack")
-        super().__init__(num_players)
-        self.dealer_hand: List[Card] = []
+        self.round_number = 0
+        super().__init__(num_players, seed, headless, sinks)
+        self.configure()
+        self.dealer_hand = BlackjackHand()
+        # Running totals of each player's hand, kept alongside PlayerState's cards
+        self.hands: Dict[str, BlackjackHand] = {player.id: BlackjackHand() for player in self.game_state.players}
         self.deal_initial_cards()
         
+    def configure(self) -> None:
+        # Precomputed hit/stand decisions the AI looks up each turn
+        self.strategy: StrategyTable = get_strategy_table()
+        
+    def snapshot_fields(self) -> BlackjackSnapshot:
+        return BlackjackSnapshot(self.round_number, tuple(self.dealer_hand))
+        
+    def restore_fields(self, fields: BlackjackSnapshot) -> None:
+        self.round_number = fields.round_number
+        self.dealer_hand = BlackjackHand(fields.dealer_cards)
+        # Hand totals follow from the players' restored cards
+        self.hands = {player.id: BlackjackHand(player.hand) for player in self.game_state.players}
+        
     def setup_deck(self) -> None:
         """Setup a standard 52-card deck"""
-        from ..example import create_standard_deck
-        # Typically uses multiple decks
-        deck = Deck('main', create_standard_deck() * 6)  # 6 decks
+        # Typically uses multiple decks: 6 decks, cut card at 75%
+        deck = Shoe('main', standard_deck() * 6, penetration=0.75, rng=self.child_rng('deck', 'main'))
         deck.shuffle()
         self.game_state.add_deck(deck)
         
     def deal_initial_cards(self) -> None:
         """Deal 2 cards to each player and dealer"""
+        self.round_number += 1
+        self.emit(GameEventType.ROUND_STARTED, details={'round': self.round_number})
         deck = self.game_state.get_deck('main')
         if deck:
+            if deck.needs_reshuffle:
+                deck.reshuffle()
+                
             # Deal first card to all players
-            for player in self.game_state.get_players():
-                player.add_to_hand(deck.draw(1))
-            self.dealer_hand.extend(deck.draw(1))
+            for player in self.game_state.players:
+                self._deal(deck, player)
+            self._deal(deck, None)
             
-            # Deal second card
-            for player in self.game_state.get_players():
-                player.add_to_hand(deck.draw(1))
-            self.dealer_hand.extend(deck.draw(1))
+            # Deal second card; the dealer's is the face-down hole card
+            for player in self.game_state.players:
+                self._deal(deck, player)
+            self._deal(deck, None, hole=True)
             
         self.game_state.set_phase(GamePhase.IN_PROGRESS)
         
+    def _deal(self, deck: Deck, player: Optional[PlayerState], hole: bool = False) -> List[Card]:
+        """Deal one card to a player, or to the dealer when player is None"""
+        cards = deck.draw(1)
+        if player is None:
+            self.dealer_hand.extend(cards)
+            self.emit(GameEventType.CARDS_DEALT, cards=cards,
+                      details={'target': 'dealer', 'hole': True} if hole else {'target': 'dealer'})
+        else:
+            player.add_to_hand(cards)
+            self.hands[player.id].extend(cards)
+            self.emit(GameEventType.CARDS_DEALT, player=player, cards=cards, details={'target': 'player'})
+        return cards
+        
+    def new_round(self) -> None:
+        """Return every hand to the shoe's discard pile and deal the next round"""
+        deck = self.game_state.get_deck('main')
+        for player in self.game_state.players:
+            if deck:
+                deck.add_to_discard(player.hand)
+            player.clear_hand()
+            self.hands[player.id] = BlackjackHand()
+        if deck:
+            deck.add_to_discard(self.dealer_hand)
+        self.dealer_hand = BlackjackHand()
+        self.deal_initial_cards()
+        
     def calculate_hand_value(self, cards: List[Card]) -> int:
         """Calculate the value of a blackjack hand"""
-        value = 0
-        aces = 0
-        
-        for card in cards:
-            if card.rank == 1:  # Ace
-                aces += 1
-            elif card.rank > 10:  # Face cards
-                value += 10
-            else:
-                value += card.rank
-                
-        # Add aces
-        for _ in range(aces):
-            if value + 11 <= 21:
-                value += 11
-            else:
-                value += 1
-                
-        return value
+        return BlackjackHand(cards).value
         
-    def play_turn(self, player: PlayerState) -> None:
-        """Execute a turn for the given player"""
-        if player.id == 'p0':  # Human player
+    def play_turn(self, player: PlayerState, action: Optional[PlayerAction] = None) -> None:
+        """Execute a turn for the given player, applying action instead of asking if one is given"""
+        if action:  # Replayed or remote action, for any seat
+            self._handle_player_action(player, action)
+        elif self.is_human(player):  # Human player
             self._play_human_turn(player)
         else:  # AI player
             self._play_ai_turn(player)
             
+    def _handle_player_action(self, player: PlayerState, action: PlayerAction) -> bool:
+        """Apply one action; returns whether the player's turn is over"""
+        if action.action_type == PlayerActionType.QUIT:
+            self.game_state.set_phase(GamePhase.COMPLETE)
+            return True
+            
+        if action.action_type == PlayerActionType.HIT:
+            deck = self.game_state.get_deck('main')
+            if deck:
+                self.emit(GameEventType.PLAYER_ACTED, player=player, action=action)
+                self._deal(deck, player)
+                hand = self.hands[player.id]
+                if hand.is_bust:
+                    self.emit(GameEventType.PLAYER_BUSTED, player=player, amount=hand.value)
+                    return True
+        elif action.action_type == PlayerActionType.STAND:
+            self.emit(GameEventType.PLAYER_ACTED, player=player, action=action)
+            return True
+        return False
+            
     def _play_human_turn(self, player: PlayerState) -> None:
         """Handle human player's turn"""
         while True:
             TerminalUI.display_blackjack_state(player, self.dealer_hand)
             action = TerminalUI.get_blackjack_action()
-            
-            if action.action_type == PlayerActionType.QUIT:
-                self.game_state.set_phase(GamePhase.COMPLETE)
-                return
-                
-            if action.action_type == PlayerActionType.HIT:
-                deck = self.game_state.get_deck('main')
-                if deck:
-                    player.add_to_hand(deck.draw(1))
-                    if self.calculate_hand_value(player.get_hand()) > 21:
-                        print("Bust!")
-                        return
-            elif action.action_type == PlayerActionType.STAND:
+            if self._handle_player_action(player, action):
                 return
                 
     def _play_ai_turn(self, player: PlayerState) -> None:
         """Handle AI player's turn"""
-        hand_value = self.calculate_hand_value(player.get_hand())
+        hand = self.hands[player.id]
+        up_card = card_category(self.dealer_hand[0])
         
-        if hand_value < 17:  # Basic AI strategy
+        if self.strategy.should_hit(hand.value, hand.soft, up_card):  # Basic strategy table lookup
             deck = self.game_state.get_deck('main')
             if deck:
-                player.add_to_hand(deck.draw(1))
+                self.emit_action(player, PlayerActionType.HIT)
+                self._deal(deck, player)
+        else:
+            self.emit_action(player, PlayerActionType.STAND)
                 
     def play_dealer_turn(self) -> None:
         """Execute the dealer's turn"""
         deck = self.game_state.get_deck('main')
-        while deck and self.calculate_hand_value(self.dealer_hand) < 17:
-            self.dealer_hand.extend(deck.draw(1))
+        while deck and self.dealer_hand.value < DEALER_STANDS_ON:
+            self._deal(deck, None)
             
-    def check_win_condition(self) -> Optional[PlayerState]:
-        """Check for winners against the dealer"""
-        dealer_value = self.calculate_hand_value(self.dealer_hand)
+    def dealer_odds(self) -> Dict[int, float]:
+        """Exact chance of each final dealer total (see DEALER_TOTALS) as the players see it.
+
+        Counts the undealt shoe plus the dealer's hidden hole card as unseen.
+        """
+        deck = self.game_state.get_deck('main')
+        unseen = deck.composition if deck else [0] * NUM_CATEGORIES
+        for card in self.dealer_hand[1:]:
+            unseen[card_category(card)] += 1
+        up_card = card_category(self.dealer_hand[0])
+        return dict(zip(DEALER_TOTALS, dealer_distribution(up_card, unseen)))
         
-        if dealer_value > 21:  # Dealer busts
-            # All players who haven't busted win
-            for player in self.game_state.get_players():
-                player_value = self.calculate_hand_value(player.get_hand())
-                if player_value <= 21:
-                    player.update_score(1)  # Award 1 point for winning
-                    TerminalUI.display_winner(player, "Blackjack", 
-                                           dealer_hand=self.dealer_hand,
-                                           hand_value=player_value)
-                    return player
-                    
-        # Find highest hand that beats dealer
+    def check_win_condition(self) -> Optional[PlayerState]:
+        """Score every player who beats the dealer; returns the best of them, if any"""
+        dealer_value = self.dealer_hand.value
+        dealer_bust = self.dealer_hand.is_bust
         best_player = None
-        best_value = dealer_value
+        best_value = 0
         
-        for player in self.game_state.get_players():
-            player_value = self.calculate_hand_value(player.get_hand())
-            if player_value <= 21 and player_value > best_value:
-                best_value = player_value
-                best_player = player
+        # Each seat plays the dealer on its own: a live hand wins if the dealer
+        # busts or it beats the dealer's total
+        for player in self.game_state.players:
+            player_value = self.hands[player.id].value
+            if player_value <= 21 and (dealer_bust or player_value > dealer_value):
+                player.update_score(1)  # Award 1 point for winning
+                self._emit_round_won(player, player_value, dealer_value)
+                if player_value > best_value:
+                    best_value = player_value
+                    best_player = player
                 
-        if best_player:
-            best_player.update_score(1)  # Award 1 point for winning
-            TerminalUI.display_winner(best_player, "Blackjack", 
-                                    dealer_hand=self.dealer_hand,
-                                    hand_value=best_value)
-            
-        return best_player
\ No newline at end of file
+        self.emit(GameEventType.ROUND_ENDED, player=best_player, cards=list(self.dealer_hand),
+                  details={'results': {p.id: self.hands[p.id].value for p in self.game_state.players},
+                           'dealer_value': dealer_value})
+        return best_player
+        
+    def _emit_round_won(self, winner: PlayerState, hand_value: int, dealer_value: int) -> None:
+        self.emit(GameEventType.ROUND_WON, player=winner, cards=winner.get_hand(), amount=hand_value,
+                  details={'dealer_hand': self.dealer_hand, 'hand_value': hand_value,
+                           'dealer_value': dealer_value})
\ No newline at end of file
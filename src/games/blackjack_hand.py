@@ -0,0 +1,68 @@
+from typing import Iterable, Iterator, List, Union
+from src.models.card import Card
+
+class BlackjackHand:
+    """Cards in a blackjack hand plus its running totals.
+
+    Behaves like a list of cards for reading and appending, and keeps the
+    hard total (aces as 1) and ace count up to date as cards are added, so
+    the value, soft, bust and blackjack flags are O(1) reads.
+    """
+    __slots__ = ('_cards', 'hard_total', 'aces')
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        self._cards: List[Card] = []
+        self.hard_total = 0
+        self.aces = 0
+        self.extend(cards)
+
+    def append(self, card: Card) -> None:
+        self._cards.append(card)
+        if card.rank == 1:  # Ace
+            self.aces += 1
+            self.hard_total += 1
+        else:
+            self.hard_total += min(card.rank, 10)
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        for card in cards:
+            self.append(card)
+
+    def clear(self) -> None:
+        self._cards.clear()
+        self.hard_total = 0
+        self.aces = 0
+
+    @property
+    def soft(self) -> bool:
+        """Whether an ace counts as 11"""
+        return self.aces > 0 and self.hard_total + 10 <= 21
+
+    @property
+    def value(self) -> int:
+        """Best total: at most one ace counts as 11 without busting"""
+        return self.hard_total + 10 if self.soft else self.hard_total
+
+    @property
+    def is_bust(self) -> bool:
+        return self.hard_total > 21
+
+    @property
+    def is_blackjack(self) -> bool:
+        """An ace and a ten-valued card as the first two cards"""
+        return len(self._cards) == 2 and self.value == 21
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self) -> Iterator[Card]:
+        return iter(self._cards)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Card, List[Card]]:
+        return self._cards[index]
+
+    def __bool__(self) -> bool:
+        return bool(self._cards)
+
+    def __repr__(self) -> str:
+        return f"BlackjackHand({self._cards!r}, value={self.value})"
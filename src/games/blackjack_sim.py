@@ -0,0 +1,169 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+import numpy as np
+from src.models.rng import new_seed
+from src.games.equity import Z_95
+from src.games.dealer_odds import DEALER_STANDS_ON, NUM_CATEGORIES
+from src.games.blackjack_strategy import get_strategy_table
+
+# Hit/stand tables are indexed [soft, total, dealer up-card category]
+MAX_TOTAL = 31
+
+def shoe_composition(decks: int = 6) -> np.ndarray:
+    """Cards per value category in a fresh shoe"""
+    composition = np.full(NUM_CATEGORIES, 4 * decks, dtype=np.int64)
+    composition[9] = 16 * decks
+    return composition
+
+def threshold_table(stand_on: int = 17) -> np.ndarray:
+    """Hit/stand table for "hit below stand_on", the dealer's rule; a baseline to compare strategies against"""
+    table = np.zeros((2, MAX_TOTAL + 1, NUM_CATEGORIES), dtype=bool)
+    table[:, :stand_on, :] = True
+    return table
+
+@dataclass
+class SimulationStats:
+    """Per-seat results of simulated rounds at one unit staked per hand"""
+    rounds: int
+    wins: np.ndarray
+    losses: np.ndarray
+    pushes: np.ndarray
+    # Sum of squared results, for confidence intervals
+    sum_sq: np.ndarray
+
+    @property
+    def ev(self) -> np.ndarray:
+        """Expected result per unit staked, per seat"""
+        return (self.wins - self.losses) / max(self.rounds, 1)
+
+    @property
+    def house_edge(self) -> float:
+        """Casino advantage over all seats, as a fraction of the amount staked"""
+        return -float(self.ev.mean())
+
+    @property
+    def margin(self) -> np.ndarray:
+        """Half-width of the 95% confidence interval of each seat's EV"""
+        if self.rounds < 2:
+            return np.ones_like(self.ev)
+        variance = (self.sum_sq - self.rounds * self.ev ** 2) / (self.rounds - 1)
+        return Z_95 * np.sqrt(np.maximum(variance, 0.0) / self.rounds)
+
+    def merged(self, other: 'SimulationStats') -> 'SimulationStats':
+        return SimulationStats(self.rounds + other.rounds, self.wins + other.wins,
+                               self.losses + other.losses, self.pushes + other.pushes,
+                               self.sum_sq + other.sum_sq)
+
+class BlackjackSimulator:
+    """Plays many Blackjack rounds at once as NumPy arrays.
+
+    Uses the rules of the Blackjack game: one ace may count as 11, the
+    dealer draws to 17 and stands on every 17, a player wins by beating the
+    dealer without busting and ties push. Every round is dealt from its own
+    freshly shuffled shoe (or from a given partial shoe composition), drawing
+    cards without replacement, so rounds are independent samples.
+
+    Players follow hit_table, by default the strategy table Blackjack's AI
+    plays (blackjack_strategy.get_strategy_table).
+    """
+
+    def __init__(self, decks: int = 6, num_players: int = 1, seed: Optional[int] = None,
+                 hit_table: Optional[np.ndarray] = None, dealer_stands_on: int = DEALER_STANDS_ON,
+                 batch_size: int = 1_000_000):
+        if not 1 <= num_players <= 7:
+            raise ValueError("Between 1 and 7 players allowed in Blackjack")
+        self.composition = shoe_composition(decks)
+        self.num_players = num_players
+        if hit_table is None:
+            hit_table = get_strategy_table().as_array()
+        self.hit_table = np.asarray(hit_table, dtype=bool)
+        if self.hit_table.shape != (2, MAX_TOTAL + 1, NUM_CATEGORIES):
+            raise ValueError(f"hit_table must have shape (2, {MAX_TOTAL + 1}, {NUM_CATEGORIES})")
+        self.dealer_stands_on = dealer_stands_on
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(new_seed() if seed is None else seed)
+
+    def play(self, rounds: int, composition: Optional[Sequence[int]] = None) -> SimulationStats:
+        """Simulate rounds, batch_size at a time, starting each from composition (default a full shoe)"""
+        shoe = self.composition if composition is None else np.asarray(composition, dtype=np.int64)
+        if shoe.shape != (NUM_CATEGORIES,):
+            raise ValueError(f"Expected a composition of {NUM_CATEGORIES} category counts")
+        if (shoe < 0).any():
+            raise ValueError("Category counts can't be negative")
+        zeros = np.zeros(self.num_players, dtype=np.int64)
+        stats = SimulationStats(0, zeros, zeros, zeros, zeros)
+        while stats.rounds < rounds:
+            stats = stats.merged(self._play_batch(min(self.batch_size, rounds - stats.rounds), shoe))
+        return stats
+
+    def _play_batch(self, n: int, shoe: np.ndarray) -> SimulationStats:
+        counts = np.tile(shoe, (n, 1))
+        players = np.zeros((self.num_players, n), dtype=np.int64)  # Hard totals, aces as 1
+        player_aces = np.zeros((self.num_players, n), dtype=bool)
+        dealer = np.zeros(n, dtype=np.int64)
+        dealer_aces = np.zeros(n, dtype=bool)
+        everyone = np.ones(n, dtype=bool)
+
+        # Deal in the game's order: a card to each player then the dealer, twice
+        for deal in range(2):
+            for seat in range(self.num_players):
+                self._hit(counts, players[seat], player_aces[seat], everyone)
+            card = self._hit(counts, dealer, dealer_aces, everyone)
+            if deal == 0:
+                up_card = card  # Every hand draws, so categories line up with rounds
+
+        for seat in range(self.num_players):
+            total, aces = players[seat], player_aces[seat]
+            while True:
+                value, soft = self._value(total, aces)
+                drawing = self.hit_table[soft.astype(np.intp), np.minimum(value, MAX_TOTAL), up_card]
+                drawing &= value < 21
+                if not drawing.any():
+                    break
+                self._hit(counts, total, aces, drawing)
+
+        while True:
+            value, _ = self._value(dealer, dealer_aces)
+            drawing = value < self.dealer_stands_on
+            if not drawing.any():
+                break
+            self._hit(counts, dealer, dealer_aces, drawing)
+
+        dealer_value, _ = self._value(dealer, dealer_aces)
+        wins = np.empty(self.num_players, dtype=np.int64)
+        losses = np.empty(self.num_players, dtype=np.int64)
+        pushes = np.empty(self.num_players, dtype=np.int64)
+        for seat in range(self.num_players):
+            value, _ = self._value(players[seat], player_aces[seat])
+            won = (value <= 21) & ((dealer_value > 21) | (value > dealer_value))
+            lost = (value > 21) | ((dealer_value <= 21) & (value < dealer_value))
+            wins[seat] = np.count_nonzero(won)
+            losses[seat] = np.count_nonzero(lost)
+            pushes[seat] = n - wins[seat] - losses[seat]
+        return SimulationStats(n, wins, losses, pushes, wins + losses)
+
+    def _hit(self, counts: np.ndarray, total: np.ndarray, aces: np.ndarray,
+             drawing: np.ndarray) -> np.ndarray:
+        """Draw one card without replacement into every hand where drawing is set.
+
+        Returns the drawn categories of those hands. Raises ValueError if any
+        of their shoes is empty: a round never reshuffles, so a composition
+        must hold enough cards for a whole round.
+        """
+        rows = np.flatnonzero(drawing)
+        shoes = counts[rows]
+        cumulative = np.cumsum(shoes, axis=1)
+        if (cumulative[:, -1] == 0).any():
+            raise ValueError("The shoe ran out of cards mid-round; use a larger composition")
+        u = self.rng.random(len(rows)) * cumulative[:, -1]
+        category = (cumulative <= u[:, None]).sum(axis=1)
+        counts[rows, category] -= 1
+        total[rows] += category + 1
+        aces[rows] |= category == 0
+        return category
+
+    @staticmethod
+    def _value(total: np.ndarray, aces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Best hand values and whether each counts an ace as 11"""
+        soft = aces & (total + 10 <= 21)
+        return np.where(soft, total + 10, total), soft
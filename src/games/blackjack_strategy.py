@@ -0,0 +1,161 @@
+import argparse
+import os
+import struct
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from src.games.dealer_odds import DEALER_STANDS_ON, DEALER_TOTALS, NUM_CATEGORIES, dealer_distribution
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# File layout: header, then one byte per (soft, total, up-card) entry,
+# 1 meaning hit, in the same row-major order as StrategyTable's lookup.
+MAGIC = b'BJST'
+VERSION = 1
+HEADER = struct.Struct('<4sHHH')  # magic, version, decks, dealer stands on
+MAX_TOTAL = 31
+TABLE_SIZE = 2 * (MAX_TOTAL + 1) * NUM_CATEGORIES
+
+DEFAULT_DECKS = 6
+DEFAULT_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                             '..', '..', 'assets', 'blackjack_strategy.bin'))
+
+def full_shoe(decks: int) -> List[int]:
+    """Cards per value category in a fresh shoe"""
+    return [4 * decks] * (NUM_CATEGORIES - 1) + [16 * decks]
+
+def _stand_evs(distribution: Sequence[float]) -> List[float]:
+    """Expected result of standing on each total 0..21 against a dealer distribution"""
+    evs = []
+    for value in range(22):
+        ev = 0.0
+        for total, p in zip(DEALER_TOTALS, distribution):
+            if total > 21 or total < value:
+                ev += p
+            elif total > value:
+                ev -= p
+        evs.append(ev)
+    return evs
+
+def solve(composition: Sequence[int], up_card: int,
+          stands_on: int = DEALER_STANDS_ON) -> Tuple[Dict[int, float], Dict[int, float], Dict[int, bool], Dict[int, bool]]:
+    """Optimal hit/stand play against one up-card, drawing from composition (up-card removed).
+
+    Returns the expected results of hard and soft totals under optimal play,
+    and whether each hard and soft total should hit. Draws are weighted by
+    the composition, treating the shoe as large next to one hand.
+    """
+    remaining = sum(composition)
+    probs = [count / remaining for count in composition]
+    stand = _stand_evs(dealer_distribution(up_card, composition, stands_on))
+    hard: Dict[int, float] = {}
+    soft: Dict[int, float] = {}
+    hard_hits: Dict[int, bool] = {}
+    soft_hits: Dict[int, bool] = {}
+
+    def settle(evs: Dict[int, float], hits: Dict[int, bool], value: int, hit_ev: float) -> None:
+        hits[value] = value < 21 and hit_ev > stand[value]
+        evs[value] = hit_ev if hits[value] else stand[value]
+
+    def hard_after(value: int, category: int) -> float:
+        """Value of a hard total after drawing one card"""
+        if category == 0 and value + 11 <= 21:
+            return soft[value + 11]
+        drawn = value + category + 1
+        return -1.0 if drawn > 21 else hard[drawn]
+
+    def soft_after(value: int, category: int) -> float:
+        drawn = value + category + 1
+        return soft[drawn] if drawn <= 21 else hard[drawn - 10]
+
+    # Each total only depends on totals it can draw into: high hard totals
+    # first, then soft totals, then hard totals low enough to turn soft
+    for value in range(21, 10, -1):
+        settle(hard, hard_hits, value, sum(p * hard_after(value, c) for c, p in enumerate(probs)))
+    for value in range(21, 11, -1):
+        settle(soft, soft_hits, value, sum(p * soft_after(value, c) for c, p in enumerate(probs)))
+    for value in range(10, 1, -1):
+        settle(hard, hard_hits, value, sum(p * hard_after(value, c) for c, p in enumerate(probs)))
+    return hard, soft, hard_hits, soft_hits
+
+class StrategyTable:
+    """Hit/stand decisions indexed by soft flag, hand value and dealer up-card category"""
+
+    def __init__(self, hits: bytes, decks: int = DEFAULT_DECKS, stands_on: int = DEALER_STANDS_ON):
+        if len(hits) != TABLE_SIZE:
+            raise ValueError(f"Expected {TABLE_SIZE} table entries")
+        self._hits = bytes(hits)
+        self.decks = decks
+        self.stands_on = stands_on
+
+    @classmethod
+    def compute(cls, decks: int = DEFAULT_DECKS, composition: Optional[Sequence[int]] = None,
+                stands_on: int = DEALER_STANDS_ON) -> 'StrategyTable':
+        """Solve every up-card for a fresh shoe of decks, or for a given shoe composition"""
+        shoe = list(composition) if composition is not None else full_shoe(decks)
+        hits = bytearray(TABLE_SIZE)
+        for up_card in range(NUM_CATEGORIES):
+            if not shoe[up_card]:
+                continue
+            remaining = shoe.copy()
+            remaining[up_card] -= 1
+            _, _, hard_hits, soft_hits = solve(remaining, up_card, stands_on)
+            for soft, decisions in ((0, hard_hits), (1, soft_hits)):
+                for value, hit in decisions.items():
+                    hits[cls._index(soft, value, up_card)] = hit
+        return cls(bytes(hits), decks, stands_on)
+
+    @staticmethod
+    def _index(soft: int, value: int, up_card: int) -> int:
+        return (soft * (MAX_TOTAL + 1) + value) * NUM_CATEGORIES + up_card
+
+    def should_hit(self, value: int, soft: bool, up_card: int) -> bool:
+        """Whether to hit a hand value (soft if an ace counts as 11) against a dealer up-card category"""
+        if value > 21:
+            return False
+        return self._hits[(soft * (MAX_TOTAL + 1) + value) * NUM_CATEGORIES + up_card] == 1
+
+    def as_array(self) -> "np.ndarray":
+        """The table as a (2, MAX_TOTAL + 1, NUM_CATEGORIES) bool array, the BlackjackSimulator hit_table layout"""
+        import numpy as np
+        return np.frombuffer(self._hits, dtype=np.uint8).reshape(2, MAX_TOTAL + 1, NUM_CATEGORIES).astype(bool)
+
+    def save(self, path: str = DEFAULT_PATH) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.decks, self.stands_on))
+            f.write(self._hits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PATH) -> 'StrategyTable':
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) != HEADER.size + TABLE_SIZE:
+            raise ValueError(f"{path} is not a version {VERSION} blackjack strategy table")
+        magic, version, decks, stands_on = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} blackjack strategy table")
+        return cls(data[HEADER.size:], decks, stands_on)
+
+_default_table: Optional[StrategyTable] = None
+
+def get_strategy_table() -> StrategyTable:
+    """The shared table for the default shoe, loaded (and built if needed) on first use"""
+    global _default_table
+    if _default_table is None:
+        if not os.path.exists(DEFAULT_PATH):
+            StrategyTable.compute().save(DEFAULT_PATH)
+        _default_table = StrategyTable.load(DEFAULT_PATH)
+    return _default_table
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the Blackjack hit/stand strategy table")
+    parser.add_argument('--output', default=DEFAULT_PATH)
+    parser.add_argument('--decks', type=int, default=DEFAULT_DECKS)
+    args = parser.parse_args()
+    StrategyTable.compute(args.decks).save(args.output)
+    print(f"Wrote the {args.decks}-deck strategy table to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple
+from src.models.card import Card
+
+# Cards are grouped by blackjack value: category 0 is the ace, 1-8 are
+# deuces through nines and 9 holds tens and face cards.
+NUM_CATEGORIES = 10
+
+# The dealer draws until reaching this total (soft totals included)
+DEALER_STANDS_ON = 17
+
+# Final dealer totals, in the order dealer_distribution reports them. 16
+# stands for "stopped below 17", which only happens when the shoe runs out.
+BUST = 22
+DEALER_TOTALS = (16, 17, 18, 19, 20, 21, BUST)
+
+# Bound on memoized (hand, composition) states; each entry is a few hundred bytes
+CACHE_SIZE = 1 << 18
+
+def card_category(card: Card) -> int:
+    """Value category (0 = ace ... 9 = ten-valued) of a card"""
+    return min(card.rank, 10) - 1
+
+def composition_of(cards: Iterable[Card]) -> List[int]:
+    """Count cards per value category"""
+    composition = [0] * NUM_CATEGORIES
+    for card in cards:
+        composition[card_category(card)] += 1
+    return composition
+
+def _outcome_index(value: int) -> int:
+    if value > 21:
+        return len(DEALER_TOTALS) - 1
+    return max(value - 16, 0)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _dealer_outcomes(total: int, has_ace: bool, composition: Tuple[int, ...],
+                     stands_on: int) -> Tuple[float, ...]:
+    """Final-total distribution of a dealer holding a hard total (aces as 1) drawing from composition"""
+    value = total + 10 if has_ace and total + 10 <= 21 else total
+    remaining = sum(composition)
+    if value >= stands_on or remaining == 0:
+        outcome = [0.0] * len(DEALER_TOTALS)
+        outcome[_outcome_index(value)] = 1.0
+        return tuple(outcome)
+
+    result = [0.0] * len(DEALER_TOTALS)
+    for category, count in enumerate(composition):
+        if not count:
+            continue
+        child = list(composition)
+        child[category] -= 1
+        branch = _dealer_outcomes(total + category + 1, has_ace or category == 0, tuple(child), stands_on)
+        weight = count / remaining
+        for i, p in enumerate(branch):
+            result[i] += weight * p
+    return tuple(result)
+
+def dealer_distribution(up_card: int, composition: Sequence[int],
+                        stands_on: int = DEALER_STANDS_ON) -> Tuple[float, ...]:
+    """Exact probability of each DEALER_TOTALS outcome.
+
+    up_card is the dealer's up-card category (see card_category) and
+    composition counts the cards the dealer can still draw per category,
+    the unseen hole card included.
+    """
+    return _dealer_outcomes(up_card + 1, up_card == 0, tuple(int(count) for count in composition), stands_on)
+
+def bust_probability(up_card: int, composition: Sequence[int]) -> float:
+    """Chance the dealer busts from this up-card and shoe"""
+    return dealer_distribution(up_card, composition)[-1]
+
+def cache_info():
+    """Hit/miss statistics of the memoized dealer states"""
+    return _dealer_outcomes.cache_info()
+
+def clear_cache() -> None:
+    _dealer_outcomes.cache_clear()
@@ -0,0 +1,152 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Optional, Sequence, Set, Tuple
+from src.games.hand_evaluator import evaluate_codes
+
+# z-score for a two-sided 95% confidence interval
+Z_95 = 1.96
+
+@dataclass
+class EquityEstimate:
+    equity: float
+    margin: float
+    samples: int
+
+    @property
+    def low(self) -> float:
+        return max(0.0, self.equity - self.margin)
+
+    @property
+    def high(self) -> float:
+        return min(1.0, self.equity + self.margin)
+
+def run_rollouts(hole: Sequence[int], board: Sequence[int], num_opponents: int,
+                 samples: int, seed: int) -> Tuple[float, float, int]:
+    """Play out random boards and opponent hands; returns (sum, sum of squares, count) of pot shares"""
+    rng = random.Random(seed)
+    hole = list(hole)
+    board = list(board)
+    dead: Set[int] = set(hole) | set(board)
+    live = [code for code in range(52) if code not in dead]
+    board_needed = 5 - len(board)
+    needed = board_needed + 2 * num_opponents
+
+    total = 0.0
+    total_sq = 0.0
+    for _ in range(samples):
+        drawn = rng.sample(live, needed)
+        runout = board + drawn[:board_needed]
+        hero = evaluate_codes(hole + runout)
+        share = 1.0
+        tied = 1
+        for i in range(board_needed, needed, 2):
+            villain = evaluate_codes(drawn[i:i + 2] + runout)
+            if villain > hero:
+                share = 0.0
+                break
+            if villain == hero:
+                tied += 1
+        if share:
+            share = 1.0 / tied
+        total += share
+        total_sq += share * share
+    return total, total_sq, samples
+
+class EquityEstimator:
+    """Monte Carlo hand equity with a time budget and confidence-interval early stopping.
+
+    With processes=0 rollouts run inline; otherwise batches are spread over a
+    lazily started process pool that is reused between estimates.
+    """
+
+    def __init__(self, processes: Optional[int] = None, batch_size: int = 250):
+        self.processes = processes
+        self._workers = processes or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state['_pool'] = None  # Worker processes don't travel; a copy starts its own
+        return state
+
+    def estimate(self, hole: Sequence[int], board: Sequence[int], num_opponents: int,
+                 time_budget: float = 0.1, target_margin: float = 0.01,
+                 max_samples: int = 200000, seed: Optional[int] = None) -> EquityEstimate:
+        """Estimate the equity of encoded hole cards against num_opponents random hands"""
+        if num_opponents < 1:
+            return EquityEstimate(1.0, 0.0, 0)
+        if len(hole) != 2 or len(board) > 5:
+            raise ValueError("Expected 2 hole cards and at most 5 community cards")
+
+        # Batches never overshoot a sample cap smaller than one batch
+        batch_size = min(self.batch_size, max_samples)
+        seeds = random.Random(seed)
+        deadline = time.perf_counter() + time_budget
+        stats = [0.0, 0.0, 0]
+
+        def done() -> bool:
+            if stats[2] >= max_samples or time.perf_counter() >= deadline:
+                return stats[2] > 0
+            return stats[2] >= batch_size and self._margin(*stats) <= target_margin
+
+        def add(result: Tuple[float, float, int]) -> None:
+            stats[0] += result[0]
+            stats[1] += result[1]
+            stats[2] += result[2]
+
+        args = (tuple(hole), tuple(board), num_opponents, batch_size)
+        if self.processes == 0:
+            while not done():
+                add(run_rollouts(*args, seeds.getrandbits(64)))
+        else:
+            pool = self._get_pool()
+            in_flight: Set[Future] = {
+                pool.submit(run_rollouts, *args, seeds.getrandbits(64))
+                for _ in range(2 * self._workers)
+            }
+            while True:
+                # Always wait for at least one batch, then only until the deadline
+                timeout = max(0.0, deadline - time.perf_counter()) if stats[2] else None
+                finished, in_flight = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    add(future.result())
+                if done():
+                    break
+                for _ in finished:
+                    in_flight.add(pool.submit(run_rollouts, *args, seeds.getrandbits(64)))
+            for future in in_flight:
+                future.cancel()
+
+        equity = stats[0] / stats[2]
+        return EquityEstimate(equity, self._margin(*stats), stats[2])
+
+    @staticmethod
+    def _margin(total: float, total_sq: float, count: int) -> float:
+        """Half-width of the 95% confidence interval of the mean share"""
+        if count < 2:
+            return 1.0
+        mean = total / count
+        variance = max(0.0, (total_sq - count * mean * mean) / (count - 1))
+        return Z_95 * math.sqrt(variance / count)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._workers)
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> 'EquityEstimator':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
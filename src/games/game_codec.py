@@ -0,0 +1,121 @@
+import struct
+from typing import Callable, Dict, List, Tuple, Type
+from src.models.base_game import BaseGame
+from src.models.game_state import GameState
+from src.models.hand_history import GAME_CODES
+from src.models.rng import join_seed_words, seed_words
+from src.models.state_codec import (read_cards, read_game_state, read_player, read_rng_state, write_cards,
+                                   write_game_state, write_player, write_rng_state)
+from src.games.poker import Poker, PokerSnapshot
+from src.games.blackjack import Blackjack, BlackjackSnapshot
+from src.games.rummy import Rummy, RummySnapshot
+from src.games.hand_evaluator import HandAccumulator
+
+# Layout of an encoded game (all little-endian):
+#   GAME_HEADER: magic, version, game code (hand_history.GAME_CODES), seed
+#     as signed high and unsigned low 64-bit words (rng.seed_words),
+#     headless flag
+#   the game's generator state and GameState, as in state_codec
+#   the game's own fields:
+#     Poker     POKER, the community cards, then the seat count and per
+#               seat its index among the GameState players, or FOLDED and
+#               the whole player as in state_codec
+#     Blackjack BLACKJACK, then the dealer's hand
+#     Rummy     RUMMY, then the discard pile
+# Decoding hands the game's fields to BaseGame.restored(), which rebuilds
+# the caches kept beside them (evaluator accumulators, hand totals) and the
+# AI helpers the same way the constructor does.
+MAGIC = b'CGGM'
+VERSION = 2
+GAME_HEADER = struct.Struct('<4sHBqQ?')
+POKER = struct.Struct('<iiiIIB?')  # initial bankroll, pot, current bet, round, AI samples, betting round, active
+BLACKJACK = struct.Struct('<I')    # round number
+RUMMY = struct.Struct('<?')        # has drawn
+SEAT = struct.Struct('<B')
+FOLDED = 255
+
+def _write_poker(parts: List[bytes], game: Poker) -> None:
+    parts.append(POKER.pack(game.initial_bankroll, game.pot, game.current_bet, game.round_number,
+                            game.ai_max_samples, game.betting_round, game.round_active))
+    write_cards(parts, game.community_cards)
+    # Players who folded this hand are only in seats
+    in_hand = {player.id: index for index, player in enumerate(game.game_state.players)}
+    parts.append(SEAT.pack(len(game.seats)))
+    for player in game.seats:
+        index = in_hand.get(player.id)
+        if index is None:
+            parts.append(SEAT.pack(FOLDED))
+            write_player(parts, player, player.snapshot())
+        else:
+            parts.append(SEAT.pack(index))
+
+def _read_poker(data: bytes, pos: int, game_state: GameState) -> Tuple[PokerSnapshot, dict, int]:
+    (initial_bankroll, pot, current_bet, round_number,
+     ai_max_samples, betting_round, round_active) = POKER.unpack_from(data, pos)
+    community_cards, pos = read_cards(data, pos + POKER.size)
+    in_hand = game_state.players
+    seats, folded = [], []
+    num_seats, = SEAT.unpack_from(data, pos)
+    pos += SEAT.size
+    for _ in range(num_seats):
+        index, = SEAT.unpack_from(data, pos)
+        pos += SEAT.size
+        if index == FOLDED:
+            player, snapshot, pos = read_player(data, pos)
+            folded.append((player, snapshot))
+        else:
+            player = in_hand[index]
+        seats.append(player)
+    hole_states = {player.id: HandAccumulator(card.code for card in player.hand) for player in in_hand}
+    fields = PokerSnapshot(tuple(seats), tuple(folded), pot, current_bet, betting_round, round_active,
+                           round_number, tuple(community_cards), hole_states)
+    return fields, {'initial_bankroll': initial_bankroll, 'ai_max_samples': ai_max_samples}, pos
+
+def _write_blackjack(parts: List[bytes], game: Blackjack) -> None:
+    parts.append(BLACKJACK.pack(game.round_number))
+    write_cards(parts, game.dealer_hand)
+
+def _read_blackjack(data: bytes, pos: int, game_state: GameState) -> Tuple[BlackjackSnapshot, dict, int]:
+    round_number, = BLACKJACK.unpack_from(data, pos)
+    dealer_cards, pos = read_cards(data, pos + BLACKJACK.size)
+    return BlackjackSnapshot(round_number, tuple(dealer_cards)), {}, pos
+
+def _write_rummy(parts: List[bytes], game: Rummy) -> None:
+    parts.append(RUMMY.pack(game.has_drawn))
+    write_cards(parts, game.discard_pile)
+
+def _read_rummy(data: bytes, pos: int, game_state: GameState) -> Tuple[RummySnapshot, dict, int]:
+    has_drawn, = RUMMY.unpack_from(data, pos)
+    discard_pile, pos = read_cards(data, pos + RUMMY.size)
+    return RummySnapshot(has_drawn, tuple(discard_pile)), {}, pos
+
+_CODECS: Dict[Type[BaseGame], Tuple[Callable, Callable]] = {
+    Poker: (_write_poker, _read_poker),
+    Blackjack: (_write_blackjack, _read_blackjack),
+    Rummy: (_write_rummy, _read_rummy),
+}
+_CLASSES = {GAME_CODES[cls.game_type]: cls for cls in _CODECS}
+
+def serialize_game(game: BaseGame) -> bytes:
+    """Encode a game's full state: seed, generators, players, decks and the game's own fields"""
+    codec = _CODECS.get(type(game))
+    if codec is None:
+        raise ValueError(f"Cannot serialize a {type(game).__name__}")
+    parts = [GAME_HEADER.pack(MAGIC, VERSION, GAME_CODES[game.game_type], *seed_words(game.seed), game.headless)]
+    write_rng_state(parts, game.rng.getstate())
+    write_game_state(parts, game.game_state)
+    codec[0](parts, game)
+    return b''.join(parts)
+
+def deserialize_game(data: bytes) -> BaseGame:
+    """Rebuild a game from serialize_game output. Like a copy, it starts with no event sinks."""
+    magic, version, code, seed_high, seed_low, headless = GAME_HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} serialized game")
+    if code not in _CLASSES:
+        raise ValueError(f"Unknown game code {code}")
+    cls = _CLASSES[code]
+    rng_state, pos = read_rng_state(data, GAME_HEADER.size)
+    game_state, pos = read_game_state(data, pos)
+    fields, config, pos = _CODECS[cls][1](data, pos, game_state)
+    return cls.restored(join_seed_words(seed_high, seed_low), headless, rng_state, game_state, fields, **config)
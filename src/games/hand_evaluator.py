@@ -0,0 +1,172 @@
+from typing import Dict, Iterable, List, Optional
+from src.models.card import CATEGORY_SHIFT, Card
+
+class PokerHand:
+    HIGH_CARD = 0
+    PAIR = 1
+    TWO_PAIR = 2
+    THREE_OF_A_KIND = 3
+    STRAIGHT = 4
+    FLUSH = 5
+    FULL_HOUSE = 6
+    FOUR_OF_A_KIND = 7
+    STRAIGHT_FLUSH = 8
+    ROYAL_FLUSH = 9
+
+# Cards are identified by Card.code (suit_index * 13 + rank - 1).
+# Internally ranks are "high indexes": 0 for a deuce up to 12 for an ace.
+_ACE = 12
+_WHEEL_MASK = (1 << _ACE) | 0b1111  # A-2-3-4-5
+
+def _high_index(code: int) -> int:
+    """Ace-high rank index (0 = deuce, 12 = ace) of a card code"""
+    rank = code % 13
+    return _ACE if rank == 0 else rank - 1
+
+# Per-card lookup tables so evaluation is a few integer ops per card
+_RANK_KEY = [5 ** _high_index(code) for code in range(52)]
+_RANK_BIT = [1 << _high_index(code) for code in range(52)]
+_SUIT_OF = [code // 13 for code in range(52)]
+
+def _straight_high(mask: int) -> int:
+    """Highest card index of the best straight in a rank mask, or -1"""
+    for high in range(_ACE, 3, -1):
+        window = 0b11111 << (high - 4)
+        if mask & window == window:
+            return high
+    if mask & _WHEEL_MASK == _WHEEL_MASK:
+        return 3  # Five-high wheel
+    return -1
+
+_STRAIGHT_HIGH = [_straight_high(mask) for mask in range(1 << 13)]
+
+def _pack(category: int, ranks: List[int]) -> int:
+    """Pack a category and up to five kicker indexes into a hand rank"""
+    value = category
+    for r in ranks:
+        value = (value << 4) | (r + 1)
+    return value << 4 * (5 - len(ranks))
+
+def _rank_counts(counts: List[int]) -> int:
+    """Best hand rank for a multiset of ranks with no flush available"""
+    # Group rank indexes by multiplicity, each group highest first
+    groups: List[List[int]] = [[], [], [], [], []]
+    mask = 0
+    for r in range(_ACE, -1, -1):
+        n = counts[r]
+        if n:
+            groups[n].append(r)
+            mask |= 1 << r
+    quads, trips, pairs, singles = groups[4], groups[3], groups[2], groups[1]
+
+    if quads:
+        kickers = sorted(quads[1:] + trips + pairs + singles, reverse=True)[:1]
+        return _pack(PokerHand.FOUR_OF_A_KIND, quads[:1] + kickers)
+    if trips and len(trips) + len(pairs) >= 2:
+        return _pack(PokerHand.FULL_HOUSE, [trips[0], max(trips[1:] + pairs)])
+    straight = _STRAIGHT_HIGH[mask]
+    if straight >= 0:
+        return _pack(PokerHand.STRAIGHT, [straight])
+    if trips:
+        return _pack(PokerHand.THREE_OF_A_KIND, trips[:1] + singles[:2])
+    if len(pairs) >= 2:
+        kickers = sorted(pairs[2:] + singles, reverse=True)[:1]
+        return _pack(PokerHand.TWO_PAIR, pairs[:2] + kickers)
+    if pairs:
+        return _pack(PokerHand.PAIR, pairs[:1] + singles[:3])
+    return _pack(PokerHand.HIGH_CARD, singles[:5])
+
+def _rank_flush(mask: int) -> int:
+    """Best hand rank for the cards of a single suit holding five or more"""
+    straight = _STRAIGHT_HIGH[mask]
+    if straight == _ACE:
+        return _pack(PokerHand.ROYAL_FLUSH, [straight])
+    if straight >= 0:
+        return _pack(PokerHand.STRAIGHT_FLUSH, [straight])
+    ranks = [r for r in range(_ACE, -1, -1) if mask & (1 << r)]
+    return _pack(PokerHand.FLUSH, ranks[:5])
+
+def _build_rank_table(max_cards: int = 7) -> Dict[int, int]:
+    """Rank every multiset of up to max_cards ranks, keyed by base-5 digits"""
+    table: Dict[int, int] = {}
+    counts = [0] * 13
+    powers = [5 ** rank for rank in range(13)]
+
+    def fill(rank: int, remaining: int, key: int) -> None:
+        if rank == 13:
+            table[key] = _rank_counts(counts)
+            return
+        for n in range(min(4, remaining) + 1):
+            counts[rank] = n
+            fill(rank + 1, remaining - n, key + n * powers[rank])
+        counts[rank] = 0
+
+    fill(0, max_cards, 0)
+    return table
+
+def _build_flush_table() -> Dict[int, int]:
+    """Rank every suit mask holding at least five cards"""
+    return {mask: _rank_flush(mask) for mask in range(1 << 13) if mask.bit_count() >= 5}
+
+RANK_TABLE = _build_rank_table()
+FLUSH_TABLE = _build_flush_table()
+
+def evaluate_codes(codes: Iterable[int]) -> int:
+    """Rank up to 7 encoded cards; higher ranks beat lower ranks"""
+    key = 0
+    suit_masks = [0, 0, 0, 0]
+    for code in codes:
+        key += _RANK_KEY[code]
+        suit_masks[_SUIT_OF[code]] |= _RANK_BIT[code]
+    for mask in suit_masks:
+        if mask in FLUSH_TABLE:
+            # With at most 7 cards a flush rules out quads and full houses
+            return FLUSH_TABLE[mask]
+    return RANK_TABLE[key]
+
+def evaluate_cards(cards: Iterable[Card]) -> int:
+    """Rank up to 7 cards; higher ranks beat lower ranks"""
+    return evaluate_codes(card.code for card in cards)
+
+def hand_category(hand_rank: int) -> int:
+    """The PokerHand category of a hand rank"""
+    return hand_rank >> CATEGORY_SHIFT
+
+class HandAccumulator:
+    """Evaluator state for a growing set of cards.
+
+    Keeps the rank-table key and per-suit masks so adding a card is O(1) and
+    the rank is a cached table lookup. Accumulators for disjoint cards (hole
+    cards and a board) merge in O(1).
+    """
+    __slots__ = ('key', 'suit_masks', '_rank')
+
+    def __init__(self, codes: Iterable[int] = ()):
+        self.key = 0
+        self.suit_masks = [0, 0, 0, 0]
+        self._rank: Optional[int] = None
+        self.add(codes)
+
+    def add(self, codes: Iterable[int]) -> None:
+        """Add encoded cards"""
+        for code in codes:
+            self.key += _RANK_KEY[code]
+            self.suit_masks[_SUIT_OF[code]] |= _RANK_BIT[code]
+        self._rank = None
+
+    def merged(self, other: 'HandAccumulator') -> 'HandAccumulator':
+        """A new accumulator holding the cards of both"""
+        result = HandAccumulator()
+        result.key = self.key + other.key
+        result.suit_masks = [a | b for a, b in zip(self.suit_masks, other.suit_masks)]
+        return result
+
+    def rank(self) -> int:
+        """Hand rank of the accumulated cards (at most 7)"""
+        if self._rank is None:
+            self._rank = RANK_TABLE[self.key]
+            for mask in self.suit_masks:
+                if mask in FLUSH_TABLE:
+                    self._rank = FLUSH_TABLE[mask]
+                    break
+        return self._rank
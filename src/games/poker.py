@@ -1,43 +1,109 @@
-from typing import List, Dict, Optional
+import math
+from typing import TYPE_CHECKING, Iterable, List, Dict, NamedTuple, Optional, Tuple
 from src.models.base_game import BaseGame
-from src.models.card import Card
-from src.models.player_state import PlayerState
+from src.models.card import Card, standard_deck
+from src.models.player_state import PlayerSnapshot, PlayerState
 from src.models.game_state import GamePhase
 from src.models.deck import Deck
 from src.ui.terminal_ui import TerminalUI
 from src.models.player_action import PlayerAction, PlayerActionType
+from src.models.events import HAND_NOT_SHOWN, EventSink, GameEventType
+from src.games.hand_evaluator import HandAccumulator, evaluate_cards
+from src.games.equity import EquityEstimate, EquityEstimator
+from src.games.preflop_table import get_preflop_table
 
-class PokerHand:
-    HIGH_CARD = 0
-    PAIR = 1
-    TWO_PAIR = 2
-    THREE_OF_A_KIND = 3
-    STRAIGHT = 4
-    FLUSH = 5
-    FULL_HOUSE = 6
-    FOUR_OF_A_KIND = 7
-    STRAIGHT_FLUSH = 8
-    ROYAL_FLUSH = 9
+if TYPE_CHECKING:
+    import numpy as np
+
+class PokerSnapshot(NamedTuple):
+    seats: Tuple[PlayerState, ...]
+    folded: Tuple[Tuple[PlayerState, PlayerSnapshot], ...]  # Seats out of the hand, so not in GameState
+    pot: int
+    current_bet: int
+    betting_round: int
+    round_active: bool
+    round_number: int
+    community_cards: Tuple[Card, ...]
+    hole_states: Dict[str, HandAccumulator]
 
 class Poker(BaseGame):
-    def __init__(self, num_players: int, initial_bankroll: int):
+    game_type = "Poker"
+    
+    def __init__(self, num_players: int, initial_bankroll: int, seed: Optional[int] = None,
+                 headless: bool = False, sinks: Iterable[EventSink] = ()):
         if num_players > 10:
             raise ValueError("Maximum 10 players allowed in Poker")
-        self.initial_bankroll = initial_bankroll
-        super().__init__(num_players)
+        self.configure(initial_bankroll)
+        self.round_number = 0
+        super().__init__(num_players, seed, headless, sinks)
+        # Everyone still at the table in seat order; game_state holds only the
+        # players in the current hand, since folding removes a player from it
+        self.seats: List[PlayerState] = list(self.game_state.players)
         self.reset_round()
+        
+    def configure(self, initial_bankroll: int, ai_max_samples: int = 1000) -> None:
+        self.initial_bankroll = initial_bankroll
+        # AI equity rollouts run inline so a turn never waits on a worker pool
+        self.equity_estimator = EquityEstimator(processes=0)
+        # A fixed rollout cap (not a time budget) keeps AI decisions reproducible
+        self.ai_max_samples = ai_max_samples
+        
+    def game_config(self) -> dict:
+        return {'initial_bankroll': self.initial_bankroll, 'ai_max_samples': self.ai_max_samples}
+
+    def snapshot_fields(self) -> PokerSnapshot:
+        in_hand = self.game_state.players
+        return PokerSnapshot(tuple(self.seats),
+                             tuple((player, player.snapshot()) for player in self.seats if player not in in_hand),
+                             self.pot, self.current_bet, self.betting_round, self.round_active, self.round_number,
+                             tuple(self.community_cards), dict(self._hole_states))
+
+    def restore_fields(self, fields: PokerSnapshot) -> None:
+        self.seats = list(fields.seats)
+        for player, player_state in fields.folded:
+            player.restore(player_state)
+        self.pot = fields.pot
+        self.current_bet = fields.current_bet
+        self.betting_round = fields.betting_round
+        self.round_active = fields.round_active
+        self.round_number = fields.round_number
+        self.community_cards = list(fields.community_cards)
+        # Hole accumulators are never changed once dealt; the board's is rebuilt
+        self._hole_states = dict(fields.hole_states)
+        self._board_state = HandAccumulator(card.code for card in self.community_cards)
+        self._hand_ranks = {}
 
     def reset_round(self) -> None:
         """Reset the state for a new round of poker"""
+        # Return the previous round's cards to the deck, folded hands included
+        deck = self.game_state.get_deck('main')
+        if deck:
+            deck.add_to_discard(getattr(self, 'community_cards', []))
+            for player in self.seats:
+                deck.add_to_discard(player.hand)
+                
+        # Deal back in everyone who folded; players with no money left are out
+        for player in [p for p in self.seats if p.get_bankroll() <= 0]:
+            self.seats.remove(player)
+            self.emit(GameEventType.PLAYER_ELIMINATED, player=player)
+        self.game_state.seat_players(self.seats)
+                
         self.pot = 0
-        self.community_cards = []
+        self.community_cards: List[Card] = []
+        # Incremental evaluator state: hole cards per player, the shared board,
+        # and hand ranks cached until the next community cards arrive
+        self._hole_states: Dict[str, HandAccumulator] = {}
+        self._board_state = HandAccumulator()
+        self._hand_ranks: Dict[str, int] = {}
         self.current_bet = 0
         self.betting_round = 0  # 0: pre-flop, 1: flop, 2: turn, 3: river
         self.round_active = True
+        self.round_number += 1
+        self.emit(GameEventType.ROUND_STARTED, details={'round': self.round_number})
         
         # Clear hands
-        for player in self.game_state.get_players():
-            player._hand = []
+        for player in self.seats:
+            player.clear_hand()
             player._score = 0  # Reset current round's bet tracking
             
         # Deal new hands
@@ -45,8 +111,7 @@ class Poker(BaseGame):
 
     def setup_deck(self) -> None:
         """Setup a standard 52-card deck"""
-        from ..example import create_standard_deck
-        deck = Deck('main', create_standard_deck())
+        deck = Deck('main', standard_deck(), rng=self.child_rng('deck', 'main'))
         deck.shuffle()
         self.game_state.add_deck(deck)
         
@@ -54,83 +119,73 @@ class Poker(BaseGame):
         """Deal 2 cards to each player"""
         deck = self.game_state.get_deck('main')
         if deck:
-            for player in self.game_state.get_players():
-                player.add_to_hand(deck.draw(2))
+            for player in self.game_state.players:
+                cards = deck.draw(2)
+                player.add_to_hand(cards)
+                self._hole_states[player.id] = HandAccumulator(card.code for card in cards)
+                self.emit(GameEventType.CARDS_DEALT, player=player, cards=cards, details={'target': 'player'})
+        self._hand_ranks.clear()
         self.game_state.set_phase(GamePhase.IN_PROGRESS)
         
-    def deal_community_cards(self, count: int) -> None:
+    def deal_community_cards(self, count: int, stage: str = '') -> None:
         """Deal community cards (flop, turn, or river)"""
         deck = self.game_state.get_deck('main')
         if deck:
-            self.community_cards.extend(deck.draw(count))
+            cards = deck.draw(count)
+            self.community_cards.extend(cards)
+            self._board_state.add(card.code for card in cards)
+            self._hand_ranks.clear()
+            self.emit(GameEventType.CARDS_DEALT, cards=cards,
+                      details={'target': 'board', 'stage': stage, 'board': tuple(self.community_cards)})
             
     def evaluate_hand(self, player: PlayerState) -> int:
-        """Evaluate the poker hand strength"""
-        all_cards = player.get_hand() + self.community_cards
-        
-        # Sort cards by rank
-        sorted_cards = sorted(all_cards, key=lambda x: x.rank)
+        """Evaluate the poker hand strength as a totally ordered hand rank"""
+        rank = self._hand_ranks.get(player.id)
+        if rank is None:
+            hole = self._hole_states.get(player.id)
+            if hole is None:
+                return evaluate_cards(player.get_hand() + self.community_cards)
+            rank = hole.merged(self._board_state).rank()
+            self._hand_ranks[player.id] = rank
+        return rank
         
-        # Check for flush
-        suits = {}
-        for card in all_cards:
-            suits[card.suit] = suits.get(card.suit, 0) + 1
-        has_flush = any(count >= 5 for count in suits.values())
+    def estimate_equity(self, player: PlayerState, time_budget: float = 0.1,
+                        max_samples: int = 200000) -> EquityEstimate:
+        """Estimate the player's share of the pot against the other players still in the hand"""
+        hole = [card.code for card in player.hand]
+        board = [card.code for card in self.community_cards]
+        opponents = len(self.game_state.players) - 1
+        if not board and len(hole) == 2:
+            # Preflop equities are precomputed, no rollouts needed
+            table = get_preflop_table()
+            equity = table.equity(hole, opponents)
+            return EquityEstimate(equity, table.margin(equity), table.samples)
+        return self.equity_estimator.estimate(hole, board, opponents, time_budget=time_budget,
+                                              target_margin=0.03, max_samples=max_samples,
+                                              seed=self.rng.getrandbits(64))
         
-        # Check for straight
-        has_straight = False
-        for i in range(len(sorted_cards) - 4):
-            if sorted_cards[i+4].rank - sorted_cards[i].rank == 4:
-                has_straight = True
-                break
-                
-        # Count ranks
-        rank_counts = {}
-        for card in all_cards:
-            rank_counts[card.rank] = rank_counts.get(card.rank, 0) + 1
-            
-        # Check for various hands
-        has_four = any(count == 4 for count in rank_counts.values())
-        has_three = any(count == 3 for count in rank_counts.values())
-        pairs = sum(1 for count in rank_counts.values() if count == 2)
-        
-        # Determine hand value
-        if has_straight and has_flush:
-            if max(card.rank for card in all_cards) == 13:  # Ace high
-                return PokerHand.ROYAL_FLUSH
-            return PokerHand.STRAIGHT_FLUSH
-        elif has_four:
-            return PokerHand.FOUR_OF_A_KIND
-        elif has_three and pairs >= 1:
-            return PokerHand.FULL_HOUSE
-        elif has_flush:
-            return PokerHand.FLUSH
-        elif has_straight:
-            return PokerHand.STRAIGHT
-        elif has_three:
-            return PokerHand.THREE_OF_A_KIND
-        elif pairs == 2:
-            return PokerHand.TWO_PAIR
-        elif pairs == 1:
-            return PokerHand.PAIR
-        else:
-            return PokerHand.HIGH_CARD
+    @staticmethod
+    def evaluate_batch(codes: "np.ndarray") -> "np.ndarray":
+        """Evaluate an (N, 7) array of encoded cards into an (N,) array of hand ranks"""
+        from src.games.batch_evaluator import evaluate_batch
+        return evaluate_batch(codes)
         
     def play_turn(self, player: PlayerState, action: Optional[PlayerAction] = None) -> None:
-        """Execute a betting round for the player"""
-        if not self.round_active or player.get_bankroll() <= 0:
+        """Execute a betting round for the player, applying action instead of asking if one is given"""
+        if not self.round_active:
             return
 
-        if player.id == 'p0':  # Human player
-            if action:
+        # A player who is all in skips betting but can still close the round
+        if player.get_bankroll() > 0:
+            if action:  # Replayed or remote action, for any seat
                 self._handle_player_action(player, action)
-            else:
+            elif self.is_human(player):  # Human player
                 self._play_human_turn(player)
-        else:  # AI player
-            self._play_ai_turn(player)
+            else:  # AI player
+                self._play_ai_turn(player)
             
         # After each round of betting, check if betting is complete
-        active_players = [p for p in self.game_state.get_players() if p.get_bankroll() > 0]
+        active_players = [p for p in self.game_state.players if p.get_bankroll() > 0]
         if all(p.get_score() == self.current_bet for p in active_players):
             self._advance_betting_round()
 
@@ -141,52 +196,54 @@ class Poker(BaseGame):
             return
             
         if action.action_type == PlayerActionType.FOLD:
-            self.game_state._players.remove(player)
-            print(f"{player.name} folds")
+            self.game_state.remove_player(player)
+            self.emit(GameEventType.PLAYER_ACTED, player=player, action=action)
         elif action.action_type == PlayerActionType.CALL:
             call_amount = self.current_bet - player.get_score()
             if call_amount > player.get_bankroll():
-                print("Not enough funds to call!")
+                self._reject(player, action, "Not enough funds to call!")
                 return
             self.pot += call_amount
             player.update_score(call_amount)
             player.update_bankroll(-call_amount)
-            print(f"{player.name} calls ${call_amount}")
+            self.emit(GameEventType.PLAYER_ACTED, player=player, action=action, amount=call_amount)
         elif action.action_type == PlayerActionType.RAISE:
             raise_total = action.amount
             if raise_total <= self.current_bet:
-                print("Raise must be greater than current bet")
+                self._reject(player, action, "Raise must be greater than current bet")
                 return
             if raise_total > player.get_bankroll() + player.get_score():
-                print("Not enough funds to raise!")
+                self._reject(player, action, "Not enough funds to raise!")
                 return
             raise_amount = raise_total - player.get_score()
             self.pot += raise_amount
             self.current_bet = raise_total
             player.update_score(raise_amount)
             player.update_bankroll(-raise_amount)
-            print(f"{player.name} raises to ${raise_total}")
+            self.emit(GameEventType.PLAYER_ACTED, player=player, action=action, amount=raise_total)
+            
+    def _reject(self, player: PlayerState, action: PlayerAction, reason: str) -> None:
+        self.emit(GameEventType.ACTION_REJECTED, player=player, action=action, details={'reason': reason})
 
     def _play_human_turn(self, player: PlayerState) -> None:
         """Handle human player's turn through terminal"""
         TerminalUI.display_poker_state(player, self.community_cards, self.pot)
         print(f"Your bankroll: ${player.get_bankroll()}")
         print(f"Current bet: ${self.current_bet}")
+        equity = self.estimate_equity(player)
+        print(f"Your equity: {equity.equity:.0%} (±{equity.margin:.0%})")
         action = TerminalUI.get_poker_action()
         self._handle_player_action(player, action)
 
     def _play_ai_turn(self, player: PlayerState) -> None:
         """Handle AI player's turn"""
-        hand_value = self.evaluate_hand(player)
-        
-        if player.get_bankroll() <= 0:
-            self.game_state._players.remove(player)
-            print(f"{player.name} is eliminated due to insufficient funds!")
-            return
-
+        equity = self.estimate_equity(player, math.inf, self.ai_max_samples).equity
         call_amount = self.current_bet - player.get_score()
+        # Raise with well above a fair share of the pot, call when the price is right
+        fair_share = 1 / len(self.game_state.players)
+        pot_odds = call_amount / (self.pot + call_amount) if call_amount > 0 else 0.0
         
-        if hand_value >= PokerHand.THREE_OF_A_KIND:
+        if equity >= min(0.9, 1.5 * fair_share):
             # Strong hand - raise
             raise_amount = min(self.current_bet + 10, player.get_bankroll() + player.get_score())
             if raise_amount > self.current_bet:
@@ -194,43 +251,39 @@ class Poker(BaseGame):
                 self.current_bet = raise_amount
                 player.update_bankroll(-(raise_amount - player.get_score()))
                 player.update_score(raise_amount - player.get_score())
-                print(f"{player.name} raises to ${raise_amount}")
+                self.emit_action(player, PlayerActionType.RAISE, raise_amount)
             else:
                 # Not enough to raise, just call
                 self.pot += call_amount
                 player.update_score(call_amount)
                 player.update_bankroll(-call_amount)
-                print(f"{player.name} calls ${call_amount}")
-        elif hand_value >= PokerHand.PAIR:
+                self.emit_action(player, PlayerActionType.CALL, call_amount)
+        elif equity >= pot_odds:
             # Medium hand - call
             if call_amount <= player.get_bankroll():
                 self.pot += call_amount
                 player.update_score(call_amount)
                 player.update_bankroll(-call_amount)
-                print(f"{player.name} calls ${call_amount}")
+                self.emit_action(player, PlayerActionType.CALL, call_amount)
             else:
-                self.game_state._players.remove(player)
-                print(f"{player.name} folds")
+                self.game_state.remove_player(player)
+                self.emit_action(player, PlayerActionType.FOLD)
         else:
             # Weak hand - fold
-            self.game_state._players.remove(player)
-            print(f"{player.name} folds")
+            self.game_state.remove_player(player)
+            self.emit_action(player, PlayerActionType.FOLD)
 
     def _advance_betting_round(self) -> None:
         """Deal community cards based on betting round"""
         if self.betting_round == 0:  # Deal flop
-            self.deal_community_cards(3)
-            print("\nDealing the flop:")
-            TerminalUI.display_cards(self.community_cards)
+            self.deal_community_cards(3, 'flop')
         elif self.betting_round in [1, 2]:  # Deal turn or river
-            self.deal_community_cards(1)
-            print("\nDealing the " + ("turn" if self.betting_round == 1 else "river") + ":")
-            TerminalUI.display_cards(self.community_cards)
+            self.deal_community_cards(1, "turn" if self.betting_round == 1 else "river")
             
         self.betting_round += 1
         # Reset current bets for new betting round
         self.current_bet = 0
-        for player in self.game_state.get_players():
+        for player in self.game_state.players:
             player._score = 0
 
         if self.betting_round > 3:  # End of hand
@@ -238,11 +291,11 @@ class Poker(BaseGame):
 
     def check_win_condition(self) -> Optional[PlayerState]:
         """Check for a winner"""
-        # Check if only one player has money left
-        active_players = [p for p in self.game_state.get_players() if p.get_bankroll() > 0]
-        if len(active_players) == 1:
+        # Check if only one player at the table has money left
+        active_players = [p for p in self.seats if p.get_bankroll() > 0]
+        if len(active_players) == 1 and not self.pot:
             winner = active_players[0]
-            print(f"\nGame Over! {winner.name} wins with ${winner.get_bankroll()}!")
+            self.emit(GameEventType.GAME_OVER, player=winner, amount=winner.get_bankroll())
             return winner
 
         # If round is still active, no winner yet
@@ -250,33 +303,44 @@ class Poker(BaseGame):
             return None
 
         # End of round, determine winner
-        if len(self.game_state.get_players()) == 1:
-            winner = self.game_state.get_players()[0]
+        hand_ranks: Dict[str, int] = {}
+        if len(self.game_state.players) == 1:
+            winner = self.game_state.players[0]
             winner.update_bankroll(self.pot)
-            TerminalUI.display_winner(winner, "Poker", community_cards=self.community_cards, pot=self.pot)
+            self._emit_round_won(winner, self.pot, hand_ranks)
         else:
             # Compare hands of remaining players
-            best_hand = -1
-            winner = None
-            
-            for player in self.game_state.get_players():
-                hand_value = self.evaluate_hand(player)
-                if hand_value > best_hand:
-                    best_hand = hand_value
-                    winner = player
-                    
-            if winner:
-                winner.update_bankroll(self.pot)
-                TerminalUI.display_winner(winner, "Poker", community_cards=self.community_cards, pot=self.pot)
+            for player in self.game_state.players:
+                hand_ranks[player.id] = self.evaluate_hand(player)
+            best_hand = max(hand_ranks.values())
+            # Equal ranks split the pot; odd chips go one each to the tied
+            # players earliest in seat order
+            winners = [p for p in self.game_state.players if hand_ranks[p.id] == best_hand]
+            share, odd_chips = divmod(self.pot, len(winners))
+            for index, player in enumerate(winners):
+                amount = share + 1 if index < odd_chips else share
+                player.update_bankroll(amount)
+                self._emit_round_won(player, amount, hand_ranks)
+            winner = winners[0]
 
+        # Every seat was dealt in; those who folded are out of game_state
+        results = {player.id: hand_ranks.get(player.id, HAND_NOT_SHOWN) for player in self.seats}
+        self.emit(GameEventType.ROUND_ENDED, player=winner, cards=list(self.community_cards),
+                  amount=self.pot, details={'results': results})
+        
         # Start new round if game should continue
-        active_players = [p for p in self.game_state.get_players() if p.get_bankroll() > 0]
+        active_players = [p for p in self.seats if p.get_bankroll() > 0]
         if len(active_players) > 1:
-            print("\nStarting new round...")
             self.reset_round()
             return None
             
         # Game is over, return overall winner
         winner = max(active_players, key=lambda p: p.get_bankroll())
-        print(f"\nGame Over! {winner.name} wins with ${winner.get_bankroll()}!")
-        return winner
\ No newline at end of file
+        self.emit(GameEventType.GAME_OVER, player=winner, amount=winner.get_bankroll())
+        return winner
+        
+    def _emit_round_won(self, winner: PlayerState, amount: int, hand_ranks: Dict[str, int]) -> None:
+        """Announce a round winner and what they took from the pot; hand_ranks holds every showdown hand by player id"""
+        self.emit(GameEventType.ROUND_WON, player=winner, cards=winner.get_hand(), amount=amount,
+                  details={'community_cards': self.community_cards, 'pot': self.pot,
+                           'hand_ranks': hand_ranks, 'showdown': len(self.game_state.players) > 1})
\ No newline at end of file
@@ -0,0 +1,141 @@
+import argparse
+import math
+import mmap
+import os
+import random
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+from src.games.equity import Z_95
+from src.games.hand_evaluator import _high_index, evaluate_codes
+
+# File layout: header, then NUM_HANDS * MAX_OPPONENTS little-endian uint16
+# equities scaled by EQUITY_SCALE, row-major by canonical hand index.
+MAGIC = b'PFEQ'
+VERSION = 1
+HEADER = struct.Struct('<4sHHHI')  # magic, version, hands, max opponents, samples per hand
+NUM_HANDS = 169
+MAX_OPPONENTS = 9
+EQUITY_SCALE = 65535
+
+DEFAULT_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                             '..', '..', 'assets', 'preflop_equity.bin'))
+
+def hand_index(first: int, second: int) -> int:
+    """Canonical starting-hand index (0-168) of two card codes.
+
+    Cells of a 13x13 rank grid: pairs on the diagonal, suited hands above it
+    and offsuit hands below it.
+    """
+    high, low = sorted((_high_index(first), _high_index(second)), reverse=True)
+    if first // 13 == second // 13:
+        return low * 13 + high
+    return high * 13 + low
+
+def _representative(index: int) -> List[int]:
+    """Concrete card codes for a canonical starting hand"""
+    def code(high: int, suit: int) -> int:
+        return suit * 13 + (0 if high == 12 else high + 1)
+
+    row, col = divmod(index, 13)
+    if row < col:  # Suited: row is the low card
+        return [code(col, 0), code(row, 0)]
+    return [code(row, 0), code(col, 1)]
+
+def simulate_hand(index: int, samples: int, seed: int) -> List[float]:
+    """Average pot share of a starting hand against 1..MAX_OPPONENTS random hands"""
+    rng = random.Random(seed)
+    hole = _representative(index)
+    live = [code for code in range(52) if code not in hole]
+    needed = 5 + 2 * MAX_OPPONENTS
+    totals = [0.0] * MAX_OPPONENTS
+
+    for _ in range(samples):
+        drawn = rng.sample(live, needed)
+        board = drawn[:5]
+        hero = evaluate_codes(hole + board)
+        # One deal scores every table size: opponents are seated in order
+        best = -1
+        tied = 1
+        for k in range(MAX_OPPONENTS):
+            villain = evaluate_codes(drawn[5 + 2 * k:7 + 2 * k] + board)
+            if villain > best:
+                best = villain
+                if best > hero:
+                    break  # Beaten: no share at this or any larger table
+                tied = 2 if best == hero else 1
+            elif villain == best == hero:
+                tied += 1
+            totals[k] += 1.0 / tied
+    return [total / samples for total in totals]
+
+def build_table(path: str = DEFAULT_PATH, samples: int = 20000,
+                processes: Optional[int] = None, seed: int = 0) -> None:
+    """Simulate every canonical starting hand and write the equity table to path"""
+    seeds = [seed * NUM_HANDS + index for index in range(NUM_HANDS)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        rows = list(pool.map(simulate_hand, range(NUM_HANDS), [samples] * NUM_HANDS, seeds))
+
+    values = [round(equity * EQUITY_SCALE) for row in rows for equity in row]
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, NUM_HANDS, MAX_OPPONENTS, samples))
+        f.write(struct.pack(f'<{len(values)}H', *values))
+    os.replace(tmp_path, path)
+
+class PreflopTable:
+    """Memory-mapped preflop equity table with O(1) lookups"""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, hands, max_opponents, samples = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or hands != NUM_HANDS or max_opponents != MAX_OPPONENTS:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} preflop equity table")
+        self.samples = samples
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PATH, samples: int = 20000) -> 'PreflopTable':
+        """Open the table at path, building it first if it does not exist yet"""
+        if not os.path.exists(path):
+            build_table(path, samples)
+        return cls(path)
+
+    def equity(self, hole: Sequence[int], num_opponents: int) -> float:
+        """Equity of two encoded hole cards against num_opponents random hands"""
+        if num_opponents < 1:
+            return 1.0
+        num_opponents = min(num_opponents, MAX_OPPONENTS)
+        offset = HEADER.size + 2 * (hand_index(hole[0], hole[1]) * MAX_OPPONENTS + num_opponents - 1)
+        return struct.unpack_from('<H', self._map, offset)[0] / EQUITY_SCALE
+
+    def margin(self, equity: float) -> float:
+        """Approximate 95% confidence half-width of a stored equity"""
+        return Z_95 * math.sqrt(equity * (1 - equity) / self.samples) if self.samples else 0.0
+
+    def close(self) -> None:
+        self._map.close()
+
+_default_table: Optional[PreflopTable] = None
+
+def get_preflop_table() -> PreflopTable:
+    """The shared default table, mapped (and built if needed) on first use"""
+    global _default_table
+    if _default_table is None:
+        _default_table = PreflopTable.load()
+    return _default_table
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the preflop equity table")
+    parser.add_argument('--output', default=DEFAULT_PATH)
+    parser.add_argument('--samples', type=int, default=20000, help="Deals per starting hand")
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    build_table(args.output, args.samples, args.processes, args.seed)
+    print(f"Wrote {NUM_HANDS} x {MAX_OPPONENTS} preflop equities to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import bisect
+import json
+import pickle
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from src.models.card import decode_cards
+from src.models.player_action import PlayerAction
+from src.games.session import GameSession, new_session
+
+DEFAULT_CHECKPOINT_EVERY = 100
+
+@dataclass
+class ActionLog:
+    """Everything needed to rebuild a session: its setup, seed and the actions fed to it by turn"""
+    game_type: str
+    seed: int
+    num_players: int
+    max_rounds: int
+    config: Dict[str, Any] = field(default_factory=dict)
+    external: Tuple[str, ...] = ()
+    actions: Dict[int, PlayerAction] = field(default_factory=dict)
+
+    @classmethod
+    def from_session(cls, session: GameSession) -> 'ActionLog':
+        return cls(session.game_type, session.game.seed, session.num_players, session.max_rounds,
+                   session.game.game_config(), tuple(sorted(session.external)), dict(session.actions))
+
+    def new_session(self) -> GameSession:
+        """The session at turn 0"""
+        return new_session(self.game_type, self.num_players, self.max_rounds, self.seed,
+                           self.external, **self.config)
+
+    def to_dict(self) -> dict:
+        return {
+            'game_type': self.game_type,
+            'seed': self.seed,
+            'num_players': self.num_players,
+            'max_rounds': self.max_rounds,
+            'config': self.config,
+            'external': list(self.external),
+            'actions': [[turn, action.action_type, [card.code for card in action.cards], action.amount]
+                        for turn, action in sorted(self.actions.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ActionLog':
+        actions = {turn: PlayerAction(action_type, decode_cards(codes), amount)
+                   for turn, action_type, codes, amount in data['actions']}
+        return cls(data['game_type'], data['seed'], data['num_players'], data['max_rounds'],
+                   data.get('config', {}), tuple(data.get('external', ())), actions)
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'ActionLog':
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+class Replayer:
+    """Rebuilds a logged session as it stood after any number of turns.
+
+    The whole game follows from the seed, so replaying only feeds the logged
+    actions to the external seats and lets the AI replay the rest. Every
+    checkpoint_every turns played, the session is pickled; seeking restores
+    the nearest checkpoint at or before the target, so once a log has been
+    played through, any seek costs at most checkpoint_every turns.
+    """
+
+    def __init__(self, log: ActionLog, checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY):
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        self.log = log
+        self.checkpoint_every = checkpoint_every
+        self._turns: List[int] = [0]
+        self._checkpoints: Dict[int, bytes] = {0: pickle.dumps(log.new_session())}
+
+    @property
+    def checkpoints(self) -> List[int]:
+        """Turns with a stored checkpoint"""
+        return list(self._turns)
+
+    def seek(self, turn: Optional[int] = None) -> GameSession:
+        """A fresh copy of the session after turn turns, or at the end of the game if turn is None.
+
+        Stops early if the game ends first; the session's turns says where.
+        """
+        start = self._turns[-1] if turn is None else self._turns[bisect.bisect_right(self._turns, turn) - 1]
+        session: GameSession = pickle.loads(self._checkpoints[start])
+        while not session.over and (turn is None or session.turns < turn):
+            try:
+                session.step(self.log.actions.get(session.turns))
+            except ValueError as e:
+                raise ValueError(f"Cannot replay turn {session.turns}: {e}") from e
+            if session.turns % self.checkpoint_every == 0 and session.turns not in self._checkpoints:
+                self._checkpoints[session.turns] = pickle.dumps(session)
+                bisect.insort(self._turns, session.turns)
+        return session
@@ -1,39 +1,63 @@
-from typing import List, Optional, Set
+from typing import Iterable, List, NamedTuple, Optional, Set, Tuple
 from src.models.base_game import BaseGame
-from src.models.card import Card
+from src.models.card import Card, standard_deck
 from src.models.player_state import PlayerState
 from src.models.game_state import GamePhase
 from src.models.deck import Deck
 from src.ui.terminal_ui import TerminalUI
 from src.models.player_action import PlayerAction, PlayerActionType
+from src.models.events import EventSink, GameEventType
+from src.games.rummy_melds import (FULL_DECK, best_discard, deadwood, expected_draw_deadwood, hand_mask,
+                                   is_run_mask, is_set_mask)
+
+# Actions whose cards must come from the acting player's hand
+CARD_ACTIONS = frozenset((PlayerActionType.DISCARD, PlayerActionType.DECLARE_SET, PlayerActionType.DECLARE_RUN))
+
+class RummySnapshot(NamedTuple):
+    has_drawn: bool
+    discard_pile: Tuple[Card, ...]
 
 class Rummy(BaseGame):
-    def __init__(self, num_players: int):
+    game_type = "Rummy"
+    
+    def __init__(self, num_players: int, seed: Optional[int] = None, headless: bool = False,
+                 sinks: Iterable[EventSink] = ()):
         if num_players > 6:
             raise ValueError("Maximum 6 players allowed in Rummy")
-        super().__init__(num_players)
+        super().__init__(num_players, seed, headless, sinks)
         self.discard_pile: List[Card] = []
         self.deal_initial_cards()
         self.has_drawn = False  # Track if player has drawn this turn
         
+    def snapshot_fields(self) -> RummySnapshot:
+        return RummySnapshot(self.has_drawn, tuple(self.discard_pile))
+        
+    def restore_fields(self, fields: RummySnapshot) -> None:
+        self.has_drawn = fields.has_drawn
+        self.discard_pile = list(fields.discard_pile)
+        
     def setup_deck(self) -> None:
         """Setup a standard 52-card deck"""
-        from ..example import create_standard_deck
-        deck = Deck('main', create_standard_deck())
+        deck = Deck('main', standard_deck(), rng=self.child_rng('deck', 'main'))
         deck.shuffle()
         self.game_state.add_deck(deck)
         
     def deal_initial_cards(self) -> None:
         """Deal initial cards (7 cards for 2 players, 6 for 3-4, 5 for 5-6)"""
-        num_players = len(self.game_state.get_players())
+        num_players = len(self.game_state.players)
         cards_per_player = 7 if num_players == 2 else 6 if num_players <= 4 else 5
         
+        self.emit(GameEventType.ROUND_STARTED, details={'round': 1})
         deck = self.game_state.get_deck('main')
         if deck:
-            for player in self.game_state.get_players():
-                player.add_to_hand(deck.draw(cards_per_player))
+            for player in self.game_state.players:
+                cards = deck.draw(cards_per_player)
+                player.add_to_hand(cards)
+                self.emit(GameEventType.CARDS_DEALT, player=player, cards=cards, details={'target': 'player'})
             # Start discard pile
-            self.discard_pile.extend(deck.draw(1))
+            cards = deck.draw(1)
+            self.discard_pile.extend(cards)
+            self.emit(GameEventType.CARDS_DEALT, cards=cards, details={'target': 'discard'})
             
         self.game_state.set_phase(GamePhase.IN_PROGRESS)
         
@@ -41,24 +65,27 @@ class Rummy(BaseGame):
         """Check if cards form a set (same rank)"""
         if len(cards) < 3:
             return False
-        return len({card.rank for card in cards}) == 1
+        mask = hand_mask(cards)
+        # A repeated card or one the mask can't hold (a joker) leaves fewer bits than cards
+        return mask.bit_count() == len(cards) and is_set_mask(mask)
         
     def is_run(self, cards: List[Card]) -> bool:
         """Check if cards form a run (consecutive ranks of same suit)"""
         if len(cards) < 3:
             return False
-            
-        # Check same suit
-        if len({card.suit for card in cards}) != 1:
-            return False
-            
-        # Check consecutive ranks
-        ranks = sorted(card.rank for card in cards)
-        return all(ranks[i] == ranks[i-1] + 1 for i in range(1, len(ranks)))
+        mask = hand_mask(cards)
+        # As for sets, every card must have its own bit
+        return mask.bit_count() == len(cards) and is_run_mask(mask)
+        
+    def deadwood(self, player: PlayerState) -> int:
+        """Points left unmelded in the player's best partition into sets and runs"""
+        return deadwood(player.card_mask)
         
-    def play_turn(self, player: PlayerState) -> None:
-        """Execute a turn for the given player"""
-        if player.id == 'p0':  # Human player
+    def play_turn(self, player: PlayerState, action: Optional[PlayerAction] = None) -> None:
+        """Execute a turn for the given player, or just apply action (one step of a turn) if given"""
+        if action:  # Replayed or remote action, for any seat
+            self._handle_player_action(player, action)
+        elif self.is_human(player):  # Human player
             self._play_human_turn(player)
         else:  # AI player
             self._play_ai_turn(player)
@@ -70,65 +97,104 @@ class Rummy(BaseGame):
         while True:
             TerminalUI.display_rummy_state(player, self.discard_pile)
             action = TerminalUI.get_rummy_action(player, can_draw_discard=not self.has_drawn and bool(self.discard_pile))
-            
-            if action.action_type == PlayerActionType.QUIT:
-                self.game_state.set_phase(GamePhase.COMPLETE)
+            if self._handle_player_action(player, action):
                 return
                 
-            if not self.has_drawn:
-                if action.action_type == PlayerActionType.DRAW_DECK:
-                    deck = self.game_state.get_deck('main')
-                    if deck:
-                        player.add_to_hand(deck.draw(1))
-                        self.has_drawn = True
-                elif action.action_type == PlayerActionType.DRAW_DISCARD:
-                    if self.discard_pile:
-                        player.add_to_hand([self.discard_pile.pop()])
-                        self.has_drawn = True
+    def _handle_player_action(self, player: PlayerState, action: PlayerAction) -> bool:
+        """Apply one step of a turn: a draw, then declarations, then a discard.
+
+        Returns whether the turn is over, which is after the discard or a quit.
+        """
+        if action.action_type == PlayerActionType.QUIT:
+            self.game_state.set_phase(GamePhase.COMPLETE)
+            return True
             
-            if self.has_drawn:
-                if action.action_type == PlayerActionType.DISCARD:
-                    if action.cards:
-                        removed = player.remove_from_hand([action.cards[0].id])
-                        self.discard_pile.extend(removed)
-                        return
-                elif action.action_type == PlayerActionType.DECLARE_SET:
-                    if self.is_set(action.cards):
-                        print("Valid set!")
-                        for card in action.cards:
-                            player.remove_from_hand([card.id])
-                    else:
-                        print("Invalid set!")
-                elif action.action_type == PlayerActionType.DECLARE_RUN:
-                    if self.is_run(action.cards):
-                        print("Valid run!")
-                        for card in action.cards:
-                            player.remove_from_hand([card.id])
-                    else:
-                        print("Invalid run!")
+        if not self.has_drawn:
+            if action.action_type == PlayerActionType.DRAW_DECK:
+                deck = self.game_state.get_deck('main')
+                if deck:
+                    cards = deck.draw(1)
+                    player.add_to_hand(cards)
+                    self.has_drawn = True
+                    self.emit(GameEventType.PLAYER_ACTED, player=player, action=action, cards=cards)
+            elif action.action_type == PlayerActionType.DRAW_DISCARD:
+                if self.discard_pile:
+                    cards = [self.discard_pile.pop()]
+                    player.add_to_hand(cards)
+                    self.has_drawn = True
+                    self.emit(GameEventType.PLAYER_ACTED, player=player, action=action, cards=cards)
+        
+        if self.has_drawn:
+            if action.action_type in CARD_ACTIONS:
+                self.check_held(player, action.cards)
+            if action.action_type == PlayerActionType.DISCARD:
+                if action.cards:
+                    removed = player.remove_from_hand([action.cards[0].id])
+                    self.discard_pile.extend(removed)
+                    self.emit(GameEventType.PLAYER_ACTED, player=player, action=action, cards=removed)
+                    self.has_drawn = False
+                    return True
+            elif action.action_type == PlayerActionType.DECLARE_SET:
+                if self.is_set(action.cards):
+                    player.remove_from_hand(card.id for card in action.cards)
+                    self.emit(GameEventType.PLAYER_ACTED, player=player, action=action, cards=action.cards)
+                else:
+                    self.emit(GameEventType.ACTION_REJECTED, player=player, action=action,
+                              details={'reason': "Invalid set!"})
+            elif action.action_type == PlayerActionType.DECLARE_RUN:
+                if self.is_run(action.cards):
+                    player.remove_from_hand(card.id for card in action.cards)
+                    self.emit(GameEventType.PLAYER_ACTED, player=player, action=action, cards=action.cards)
+                else:
+                    self.emit(GameEventType.ACTION_REJECTED, player=player, action=action,
+                              details={'reason': "Invalid run!"})
+        return False
             
+    @staticmethod
+    def check_held(player: PlayerState, cards: List[Card]) -> None:
+        """Raise ValueError unless the player holds each card, and each is named once"""
+        if len({card.id for card in cards}) != len(cards):
+            raise ValueError("A card is named more than once")
+        missing = [card.id for card in cards if not player.has_card(card.id)]
+        if missing:
+            raise ValueError(f"{player.id} doesn't hold {', '.join(missing)}")
+
     def _play_ai_turn(self, player: PlayerState) -> None:
         """Execute a turn for the AI player"""
-        # Draw phase
+        # Draw phase: take the top discard if keeping it beats the expected
+        # deadwood of a blind draw from the cards this player hasn't seen
         deck = self.game_state.get_deck('main')
-        if deck and len(deck.draw(1)) > 0:  # AI always draws from deck
-            player.add_to_hand(deck.draw(1))
+        mask = player.card_mask
+        top = self.discard_pile[-1] if self.discard_pile else None
+        can_draw_deck = deck is not None and deck.remaining_cards > 0
+        keep = 0
+        if top is not None:
+            top_value = best_discard(mask | 1 << top.code, keep=1 << top.code)[0]
+            unseen = FULL_DECK & ~mask & ~hand_mask(self.discard_pile)
+            if not can_draw_deck or top_value < expected_draw_deadwood(mask, unseen):
+                cards = [self.discard_pile.pop()]
+                player.add_to_hand(cards)
+                keep = 1 << top.code  # The card just taken can't go straight back
+                self.emit_action(player, PlayerActionType.DRAW_DISCARD, cards=cards)
+        if not keep and can_draw_deck:
+            cards = deck.draw(1)
+            player.add_to_hand(cards)
+            self.emit_action(player, PlayerActionType.DRAW_DECK, cards=cards)
             
-        # Discard phase
-        hand = player.get_hand()
-        # Simple AI: discard highest card that's not part of a set or run
-        for card in sorted(hand, key=lambda c: c.rank, reverse=True):
-            remaining = [c for c in hand if c.id != card.id]
-            if not self.is_set(remaining) and not self.is_run(remaining):
-                removed = player.remove_from_hand([card.id])
-                self.discard_pile.extend(removed)
-                break
+        # Discard phase: the card leaving the least deadwood, the highest such card on ties
+        _, code = best_discard(player.card_mask, keep)
+        card = next((c for c in player.hand if c.code == code), None)
+        if card is not None:
+            removed = player.remove_from_hand([card.id])
+            self.discard_pile.extend(removed)
+            self.emit_action(player, PlayerActionType.DISCARD, cards=removed)
                 
     def check_win_condition(self) -> Optional[PlayerState]:
         """Check if any player has won (all cards in sets or runs)"""
-        for player in self.game_state.get_players():
-            hand = player.get_hand()
-            # This is a simplified win check - you'd want more sophisticated logic
-            if self.is_set(hand) or self.is_run(hand):
+        for player in self.game_state.players:
+            if self.deadwood(player) == 0:
+                self.emit(GameEventType.ROUND_WON, player=player, cards=player.get_hand())
+                self.emit(GameEventType.ROUND_ENDED, player=player,
+                          details={'results': {p.id: self.deadwood(p) for p in self.game_state.players}})
                 return player
         return None 
\ No newline at end of file
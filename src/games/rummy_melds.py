@@ -0,0 +1,207 @@
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+from src.models.card import Card, NO_CODE
+
+# Hands are 52-bit masks with bit Card.code (suit_index * 13 + rank - 1) set
+# for each card held, so the ranks of one suit are 13 consecutive bits and
+# aces are low, as in Rummy.is_run.
+FULL_SUIT = (1 << 13) - 1
+FULL_DECK = (1 << 52) - 1
+
+def card_points(code: int) -> int:
+    """Deadwood points of a card: aces 1, number cards face value, face cards 10"""
+    return min(code % 13 + 1, 10)
+
+_POINTS = [card_points(code) for code in range(52)]
+
+def hand_mask(cards: Iterable[Card]) -> int:
+    """The mask of the standard cards in a collection; others have no bit and are skipped, as in PlayerState.card_mask"""
+    mask = 0
+    for card in cards:
+        if card.code != NO_CODE:
+            mask |= 1 << card.code
+    return mask
+
+def mask_points(mask: int) -> int:
+    """Total deadwood points of the cards in a mask"""
+    points = 0
+    while mask:
+        low = mask & -mask
+        points += _POINTS[low.bit_length() - 1]
+        mask ^= low
+    return points
+
+def _rows(mask: int) -> Tuple[int, int, int, int]:
+    """The four 13-bit suit rows of a mask"""
+    return (mask & FULL_SUIT, mask >> 13 & FULL_SUIT, mask >> 26 & FULL_SUIT, mask >> 39)
+
+def _spread(ranks: int) -> int:
+    """Copy a 13-bit rank mask into every suit row"""
+    return ranks | ranks << 13 | ranks << 26 | ranks << 39
+
+def rank_counts_at_least(mask: int, n: int) -> int:
+    """Rank mask (bit rank - 1) of ranks held in at least n suits, for n in 1..4"""
+    a, b, c, d = _rows(mask)
+    if n == 1:
+        return a | b | c | d
+    if n == 2:
+        return (a & (b | c | d)) | (b & (c | d)) | (c & d)
+    if n == 3:
+        return (a & b & (c | d)) | (c & d & (a | b))
+    return a & b & c & d
+
+def run_starts(row: int, length: int) -> int:
+    """Bits of a suit row that start length consecutive ranks held"""
+    starts = row
+    for shift in range(1, length):
+        starts &= row >> shift
+    return starts
+
+def melded_cards(mask: int) -> int:
+    """Cards of a hand that already sit in some complete set or run"""
+    cards = mask & _spread(rank_counts_at_least(mask, 3))
+    for suit, row in enumerate(_rows(mask)):
+        starts = run_starts(row, 3)
+        cards |= (starts | starts << 1 | starts << 2) << (suit * 13)
+    return cards
+
+def potential_meld_cards(mask: int) -> int:
+    """Cards in a meld or one draw away from one: pairs of a rank, suited neighbours and one-gappers"""
+    cards = mask & _spread(rank_counts_at_least(mask, 2))
+    for suit, row in enumerate(_rows(mask)):
+        adjacent = row & row >> 1
+        gapped = row & row >> 2
+        cards |= (adjacent | adjacent << 1 | gapped | gapped << 2) << (suit * 13)
+    return cards
+
+def completing_draws(mask: int) -> int:
+    """Cards not in the hand that would complete a new set or run with it"""
+    draws = _spread(rank_counts_at_least(mask, 2))
+    for suit, row in enumerate(_rows(mask)):
+        adjacent = row & row >> 1
+        gapped = row & row >> 2
+        draws |= ((adjacent << 2 | adjacent >> 1 | gapped << 1) & FULL_SUIT) << (suit * 13)
+    return draws & ~mask & FULL_DECK
+
+def is_set_mask(mask: int) -> bool:
+    """Whether the cards of a mask all share one rank"""
+    return rank_counts_at_least(mask, 1).bit_count() == 1
+
+def is_run_mask(mask: int) -> bool:
+    """Whether the cards of a mask are consecutive ranks of one suit"""
+    rows = [row for row in _rows(mask) if row]
+    if len(rows) != 1:
+        return False
+    row = rows[0] >> ((rows[0] & -rows[0]).bit_length() - 1)
+    return row & (row + 1) == 0
+
+def _build_sets() -> List[int]:
+    """Every 3 or 4 card set: 5 per rank"""
+    sets = []
+    for rank in range(13):
+        all_suits = sum(1 << (suit * 13 + rank) for suit in range(4))
+        sets.append(all_suits)
+        for suit in range(4):
+            sets.append(all_suits & ~(1 << (suit * 13 + rank)))
+    return sets
+
+def _build_runs() -> List[int]:
+    """Every run of 3 to 13 consecutive ranks in one suit: 66 per suit"""
+    runs = []
+    for suit in range(4):
+        for length in range(3, 14):
+            for start in range(14 - length):
+                runs.append(((1 << length) - 1) << (suit * 13 + start))
+    return runs
+
+SETS = tuple(_build_sets())
+RUNS = tuple(_build_runs())
+MELDS = SETS + RUNS
+_MELD_SET = frozenset(MELDS)
+
+# Melds containing each card, so the solver only tries melds that can use it
+_MELDS_BY_CARD = tuple(tuple(meld for meld in MELDS if meld >> code & 1) for code in range(52))
+
+# Bound on memoized hand masks; a 6-player game visits a few thousand per round
+CACHE_SIZE = 1 << 16
+
+@lru_cache(maxsize=CACHE_SIZE)
+def solve_melds(mask: int) -> Tuple[int, Tuple[int, ...]]:
+    """Partition a hand into melds and deadwood with the least deadwood points.
+
+    Returns the deadwood points and the melds (as masks) of the best
+    partition. The lowest card of the hand is either deadwood or part of one
+    of the melds containing it, so each step branches only over those.
+    """
+    if not mask:
+        return 0, ()
+    low = mask & -mask
+    code = low.bit_length() - 1
+    rest_points, rest_melds = solve_melds(mask ^ low)
+    best_points = _POINTS[code] + rest_points
+    best_melds = rest_melds
+    for meld in _MELDS_BY_CARD[code]:
+        if meld & mask == meld:
+            points, melds = solve_melds(mask ^ meld)
+            if points < best_points:
+                best_points = points
+                best_melds = (meld,) + melds
+                if not points:
+                    break
+    return best_points, best_melds
+
+def deadwood(mask: int) -> int:
+    """Least deadwood points of a hand over every meld partition"""
+    return solve_melds(mask)[0]
+
+def is_meld(mask: int) -> bool:
+    """Whether a mask is exactly one valid set or run"""
+    return mask in _MELD_SET
+
+# Cards worth each number of deadwood points, for counting draws by value
+_POINT_MASKS = tuple(sum(1 << code for code in range(52) if _POINTS[code] == points)
+                     for points in range(11))
+
+def best_discard(mask: int, keep: int = 0) -> Tuple[int, int]:
+    """(deadwood, card code) of the discard leaving the least deadwood.
+
+    Ties go to the card worth more points; cards in keep are never
+    discarded. Returns (deadwood(mask), -1) when there is nothing to discard.
+    """
+    best = (deadwood(mask), -1)
+    best_key = None
+    candidates = mask & ~keep
+    while candidates:
+        low = candidates & -candidates
+        candidates ^= low
+        code = low.bit_length() - 1
+        key = (deadwood(mask ^ low), -_POINTS[code])
+        if best_key is None or key < best_key:
+            best_key = key
+            best = (key[0], code)
+    return best
+
+def expected_draw_deadwood(mask: int, unseen: int) -> float:
+    """Expected deadwood after drawing a random unseen card and then discarding optimally.
+
+    A draw that completes no meld with the hand is deadwood whatever else is
+    discarded, so it either goes straight back or replaces the hand's own best
+    discard. Those draws are scored in bulk by point value; only the few
+    completing draws need a full search.
+    """
+    count = unseen.bit_count()
+    if not count:
+        return float(deadwood(mask))
+    base = deadwood(mask)
+    kept = best_discard(mask)[0] if mask else base
+    completing = completing_draws(mask) & unseen
+    isolated = unseen & ~completing
+
+    total = 0
+    for points in range(1, 11):
+        total += (isolated & _POINT_MASKS[points]).bit_count() * min(base, kept + points)
+    while completing:
+        low = completing & -completing
+        completing ^= low
+        total += best_discard(mask | low)[0]
+    return total / count
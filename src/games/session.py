@@ -0,0 +1,275 @@
+from abc import ABC, abstractmethod
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple, Type
+from src.models.base_game import BaseGame
+from src.models.events import EventSink
+from src.models.game_state import GamePhase
+from src.models.player_action import PlayerAction, PlayerActionType
+from src.models.player_state import PlayerState
+from src.games.poker import Poker
+from src.games.blackjack import Blackjack
+from src.games.rummy import CARD_ACTIONS, Rummy
+from src.games.rummy_melds import best_discard
+
+class GameSession(ABC):
+    """Drives one headless game a turn at a time: who acts next and what happens between turns.
+
+    Seats listed in external only move on actions passed to step(); the AI
+    plays every other seat. Every action passed in is kept by turn index, so
+    the session can be replayed from its seed (see src.games.replay).
+    """
+    game_type = ""
+    # Action types an external seat may send
+    actions_allowed: FrozenSet[str] = frozenset()
+
+    def __init__(self, game: BaseGame, max_rounds: int, external: Iterable[str] = ()):
+        self.game = game
+        self.max_rounds = max_rounds
+        self.num_players = len(game.game_state.players)
+        self.external = frozenset(external)
+        self.turns = 0
+        self.rounds = 0
+        self.winner: Optional[PlayerState] = None
+        self.over = max_rounds <= 0
+        self.actions: Dict[int, PlayerAction] = {}
+
+    @classmethod
+    @abstractmethod
+    def create(cls, num_players: int, max_rounds: int, seed: Optional[int] = None,
+               external: Iterable[str] = (), sinks: Iterable[EventSink] = (), **config) -> 'GameSession':
+        """Start a new headless game; config holds game_config() settings"""
+        pass
+
+    @property
+    def to_act(self) -> Optional[PlayerState]:
+        """The seat whose turn it is, or None once the game is over"""
+        return None if self.over else self._current()
+
+    @property
+    def awaiting_action(self) -> bool:
+        """Whether the game is waiting on an external seat"""
+        player = self.to_act
+        return player is not None and player.id in self.external
+
+    def step(self, action: Optional[PlayerAction] = None) -> None:
+        """Play one turn of the seat to act: the given action, or the AI's move if None"""
+        player = self.to_act
+        if player is None:
+            raise RuntimeError("The game is over")
+        if action is None and player.id in self.external:
+            raise ValueError(f"{player.id} needs an action")
+        if action is not None:
+            self.check_action(action)
+            self.actions[self.turns] = action
+        self.game.play_turn(player, action)
+        self.turns += 1
+        if self.game.game_state.get_phase() == GamePhase.COMPLETE:
+            self.over = True  # Someone quit
+            return
+        self._advance(player, action)
+
+    def run(self, max_turns: Optional[int] = None) -> None:
+        """Play AI turns until an external seat has to act, the game ends or max_turns turns are played"""
+        while not self.awaiting_action and not self.over and (max_turns is None or self.turns < max_turns):
+            self.step()
+
+    def check_action(self, action: PlayerAction) -> None:
+        """Raise ValueError if the seat to act can't take this action now"""
+        if action.action_type not in self.actions_allowed:
+            raise ValueError(f"{self.game.game_type} has no {action.action_type} action")
+
+    @abstractmethod
+    def timeout_action(self) -> PlayerAction:
+        """What an external seat to act does when it runs out of time"""
+        pass
+
+    @abstractmethod
+    def _current(self) -> PlayerState:
+        pass
+
+    @abstractmethod
+    def _advance(self, player: PlayerState, action: Optional[PlayerAction]) -> None:
+        """Move on after player's turn: the next seat, the dealer, scoring and new rounds"""
+        pass
+
+class PokerSession(GameSession):
+    """Passes round the table until one player holds all the money, max_rounds hands end or nobody can act"""
+    game_type = "poker"
+    actions_allowed = frozenset((PlayerActionType.FOLD, PlayerActionType.CALL, PlayerActionType.RAISE,
+                                 PlayerActionType.QUIT))
+
+    def __init__(self, game: Poker, max_rounds: int, external: Iterable[str] = ()):
+        super().__init__(game, max_rounds, external)
+        if not self.over:
+            self._start_pass()
+
+    @classmethod
+    def create(cls, num_players: int, max_rounds: int, seed: Optional[int] = None,
+               external: Iterable[str] = (), sinks: Iterable[EventSink] = (),
+               initial_bankroll: int = 1000, ai_max_samples: int = 1000) -> 'PokerSession':
+        game = Poker(num_players, initial_bankroll, seed=seed, headless=True, sinks=sinks)
+        game.ai_max_samples = ai_max_samples
+        return cls(game, max_rounds, external)
+
+    def _progress(self) -> Tuple[int, int, int, int]:
+        game = self.game
+        return (game.round_number, game.betting_round, game.pot, len(game.game_state.players))
+
+    def _start_pass(self) -> None:
+        # Everyone seated at the start of a pass gets a turn unless they fold first
+        self._pass = self.game.game_state.players
+        self._index = 0
+        self._pass_start = self._progress()
+        if not self._pass:
+            self.over = True
+
+    def timeout_action(self) -> PlayerAction:
+        """Check if nothing is owed, otherwise fold"""
+        player = self.to_act
+        if player.get_score() == self.game.current_bet:
+            return PlayerAction(PlayerActionType.CALL)
+        return PlayerAction(PlayerActionType.FOLD)
+
+    def _current(self) -> PlayerState:
+        return self._pass[self._index]
+
+    def _advance(self, player: PlayerState, action: Optional[PlayerAction]) -> None:
+        seated = self.game.game_state.players
+        self._index += 1
+        while self._index < len(self._pass) and self._pass[self._index] not in seated:
+            self._index += 1
+        if self._index < len(self._pass):
+            return
+
+        game = self.game
+        winner = game.check_win_condition()
+        if winner or game.round_number != self._pass_start[0]:
+            self.rounds += 1
+        if winner:
+            self.winner = winner
+            self.over = True
+        elif self._progress() == self._pass_start:
+            self.over = True  # Nobody left who can act
+        elif self.rounds >= self.max_rounds:
+            self.over = True
+        else:
+            self._start_pass()
+
+class BlackjackSession(GameSession):
+    """Plays max_rounds rounds from one shoe; each seat acts until it stands or busts"""
+    game_type = "blackjack"
+    actions_allowed = frozenset((PlayerActionType.HIT, PlayerActionType.STAND, PlayerActionType.QUIT))
+
+    def __init__(self, game: Blackjack, max_rounds: int, external: Iterable[str] = ()):
+        super().__init__(game, max_rounds, external)
+        self._seat = 0
+        self._hand_size = self._current().hand_size
+
+    @classmethod
+    def create(cls, num_players: int, max_rounds: int, seed: Optional[int] = None,
+               external: Iterable[str] = (), sinks: Iterable[EventSink] = ()) -> 'BlackjackSession':
+        return cls(Blackjack(num_players, seed=seed, headless=True, sinks=sinks), max_rounds, external)
+
+    def timeout_action(self) -> PlayerAction:
+        return PlayerAction(PlayerActionType.STAND)
+
+    def _current(self) -> PlayerState:
+        return self.game.game_state.players[self._seat]
+
+    def _advance(self, player: PlayerState, action: Optional[PlayerAction]) -> None:
+        game = self.game
+        # The AI takes one card per turn until it stands, even once bust
+        drew = player.hand_size != self._hand_size
+        if drew and not (player.id in self.external and game.hands[player.id].is_bust):
+            self._hand_size = player.hand_size
+            return
+
+        self._seat += 1
+        if self._seat == len(game.game_state.players):
+            game.play_dealer_turn()
+            game.check_win_condition()
+            self.rounds += 1
+            if self.rounds >= self.max_rounds:
+                self.over = True
+                return
+            game.new_round()
+            self._seat = 0
+        self._hand_size = self._current().hand_size
+
+class RummySession(GameSession):
+    """Plays until someone goes out, max_rounds passes end or the stock runs dry.
+
+    An external seat's turn takes several steps: a draw, any declarations,
+    then a discard.
+    """
+    game_type = "rummy"
+    actions_allowed = frozenset((PlayerActionType.DRAW_DECK, PlayerActionType.DRAW_DISCARD,
+                                 PlayerActionType.DISCARD, PlayerActionType.DECLARE_SET,
+                                 PlayerActionType.DECLARE_RUN, PlayerActionType.QUIT))
+
+    def __init__(self, game: Rummy, max_rounds: int, external: Iterable[str] = ()):
+        super().__init__(game, max_rounds, external)
+        self._seat = 0
+        self._pile_size = len(game.discard_pile)
+
+    @classmethod
+    def create(cls, num_players: int, max_rounds: int, seed: Optional[int] = None,
+               external: Iterable[str] = (), sinks: Iterable[EventSink] = ()) -> 'RummySession':
+        return cls(Rummy(num_players, seed=seed, headless=True, sinks=sinks), max_rounds, external)
+
+    def check_action(self, action: PlayerAction) -> None:
+        super().check_action(action)
+        drawing = action.action_type in (PlayerActionType.DRAW_DECK, PlayerActionType.DRAW_DISCARD)
+        if action.action_type != PlayerActionType.QUIT and drawing == self.game.has_drawn:
+            raise ValueError("Already drew this turn" if drawing else "Draw a card first")
+        if action.action_type in CARD_ACTIONS:
+            self.game.check_held(self.to_act, action.cards)
+
+    def timeout_action(self) -> PlayerAction:
+        """Draw from the stock, then discard whatever leaves the least deadwood"""
+        game = self.game
+        player = self.to_act
+        if not game.has_drawn:
+            deck = game.game_state.get_deck('main')
+            if (deck is None or deck.remaining_cards == 0) and game.discard_pile:
+                return PlayerAction(PlayerActionType.DRAW_DISCARD)
+            return PlayerAction(PlayerActionType.DRAW_DECK)
+        _, code = best_discard(player.card_mask)
+        card = next((c for c in player.hand if c.code == code), None)
+        return PlayerAction(PlayerActionType.DISCARD, [card] if card else [])
+
+    def _current(self) -> PlayerState:
+        return self.game.game_state.players[self._seat]
+
+    def _advance(self, player: PlayerState, action: Optional[PlayerAction]) -> None:
+        game = self.game
+        discarded = len(game.discard_pile) > self._pile_size
+        self._pile_size = len(game.discard_pile)
+        if action is not None and not discarded:
+            return  # The turn goes on until the discard
+
+        winner = game.check_win_condition()
+        if winner:
+            self.winner = winner
+            self.rounds += 1
+            self.over = True
+            return
+        self._seat += 1
+        if self._seat == len(game.game_state.players):
+            self._seat = 0
+            self.rounds += 1
+            deck = game.game_state.get_deck('main')
+            if self.rounds >= self.max_rounds or deck.remaining_cards == 0:
+                self.over = True
+
+SESSIONS: Dict[str, Type[GameSession]] = {
+    "poker": PokerSession,
+    "blackjack": BlackjackSession,
+    "rummy": RummySession,
+}
+
+def new_session(game_type: str, num_players: int, max_rounds: int, seed: Optional[int] = None,
+                external: Iterable[str] = (), sinks: Iterable[EventSink] = (), **config) -> GameSession:
+    """Start a headless session of a game type ("poker", "blackjack" or "rummy")"""
+    if game_type not in SESSIONS:
+        raise ValueError(f"Unknown game type: {game_type}")
+    return SESSIONS[game_type].create(num_players, max_rounds, seed, external, sinks, **config)
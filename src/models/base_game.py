@@ -1,18 +1,97 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from .game_state import GameState, GamePhase
+from typing import Any, Iterable, List, NamedTuple, Optional
+import random
+from .game_state import GameSnapshot, GameState, GamePhase
 from .player_state import PlayerState
 from .deck import Deck
 from .card import Card
+from .events import EventSink, GameEvent, GameEventType
+from .player_action import PlayerAction
+from .rng import SeedPart, derive_seed, new_seed, seed_words
+
+class PositionSnapshot(NamedTuple):
+    state: GameSnapshot
+    rng_state: Any
+    fields: Any  # The game's own fields, from snapshot_fields()
 
 class BaseGame(ABC):
-    def __init__(self, num_players: int):
+    game_type = "Game"
+    
+    def __init__(self, num_players: int, seed: Optional[int] = None, headless: bool = False,
+                 sinks: Iterable[EventSink] = ()):
         if num_players < 2:
             raise ValueError("Number of players must be at least 2")
             
+        # Headless games never prompt or print; every seat is played by the AI
+        # and observers subscribe to events instead
+        self.headless = headless
+        self._event_sinks: List[EventSink] = []
+        if not headless:
+            from ..ui.terminal_ui import TerminalEventSink
+            self.subscribe(TerminalEventSink())
+        # Sinks given up front also see the game start and the first deal
+        for sink in sinks:
+            self.subscribe(sink)
+            
+        # Root seed of every random stream in the game; record it to replay
+        self.seed = new_seed() if seed is None else seed
+        seed_words(self.seed)  # Fail now, not when the game is saved or logged
+        self.rng = self.child_rng('game')
         self.game_state = GameState()
         self.setup_players(num_players)
         self.setup_deck()
+        self.emit(GameEventType.GAME_STARTED,
+                  details={'seed': self.seed, 'players': tuple(p.id for p in self.game_state.players),
+                           'config': self.game_config()})
+        
+    @classmethod
+    def restored(cls, seed: int, headless: bool, rng_state: Any, game_state: GameState, fields: Any,
+                 **config) -> 'BaseGame':
+        """Rebuild a game at a saved position without dealing a new one; the decoder's counterpart
+        of __init__. fields is what snapshot_fields() returned and config what game_config() did."""
+        game = cls.__new__(cls)
+        game.headless = headless
+        game._event_sinks = []
+        game.seed = seed
+        game.rng = random.Random()
+        game.rng.setstate(rng_state)
+        game.game_state = game_state
+        game.configure(**config)
+        game.restore_fields(fields)
+        return game
+        
+    def configure(self) -> None:
+        """Set what the game keeps beside its state: settings and AI helpers. Called by both
+        __init__ and restored(), so a game set up either way has the same attributes."""
+        pass
+        
+    def __getstate__(self) -> dict:
+        # Sinks observe a particular run of the game, so copies start without them
+        state = self.__dict__.copy()
+        state['_event_sinks'] = []
+        return state
+        
+    def snapshot(self) -> PositionSnapshot:
+        """Capture the whole position: GameState, the game's generator and the game's own fields"""
+        return PositionSnapshot(self.game_state.snapshot(), self.rng.getstate(), self.snapshot_fields())
+        
+    def restore(self, snapshot: PositionSnapshot) -> None:
+        """Return the game to a snapshot, undoing any moves since; a snapshot can be restored any number of times"""
+        self.game_state.restore(snapshot.state)
+        self.rng.setstate(snapshot.rng_state)
+        self.restore_fields(snapshot.fields)
+        
+    def snapshot_fields(self) -> Any:
+        """The game's own state beyond its GameState and generator, for snapshot()"""
+        return None
+        
+    def restore_fields(self, fields: Any) -> None:
+        """Restore what snapshot_fields() captured"""
+        pass
+        
+    def game_config(self) -> dict:
+        """Constructor settings beyond the player count and seed, needed to recreate the game"""
+        return {}
         
     def setup_players(self, num_players: int) -> None:
         """Setup players including the human player"""
@@ -23,6 +102,36 @@ class BaseGame(ABC):
         for i in range(1, num_players):
             self.game_state.add_player(PlayerState(f'p{i}', f'AI Player {i}'))
     
+    def subscribe(self, sink: EventSink) -> None:
+        """Send this game's events to a sink"""
+        self._event_sinks.append(sink)
+        
+    def unsubscribe(self, sink: EventSink) -> None:
+        """Stop sending this game's events to a sink"""
+        self._event_sinks.remove(sink)
+        
+    def emit(self, event_type: str, **fields) -> None:
+        """Send an event to every subscribed sink; costs next to nothing when there are none"""
+        if self._event_sinks:
+            event = GameEvent(event_type, self.game_type, **fields)
+            for sink in self._event_sinks:
+                sink.handle_event(event)
+                
+    def emit_action(self, player: PlayerState, action_type: str, amount: int = 0,
+                    cards: Optional[List[Card]] = None) -> None:
+        """Emit PLAYER_ACTED for an action the game took on a player's behalf"""
+        if self._event_sinks:
+            self.emit(GameEventType.PLAYER_ACTED, player=player, cards=cards,
+                      action=PlayerAction(action_type, cards, amount), amount=amount)
+                      
+    def is_human(self, player: PlayerState) -> bool:
+        """Whether the player's turns are taken by a person rather than the AI"""
+        return player.id == 'p0' and not self.headless
+        
+    def child_rng(self, *path: SeedPart) -> random.Random:
+        """An independent generator derived from the game seed"""
+        return random.Random(derive_seed(self.seed, *path))
+        
     @abstractmethod
     def setup_deck(self) -> None:
         """Setup the deck(s) needed for the game"""
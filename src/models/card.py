@@ -1,16 +1,26 @@
 from dataclasses import dataclass
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
 # Type aliases
 CardAttributeValue = Union[int, str, bool]
 CardAttributes = Dict[str, CardAttributeValue]
 
-@dataclass
+# Standard cards have a canonical code 0-51: suit_index * 13 + (rank - 1)
+SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+RANK_NAMES = {1: 'Ace', 11: 'Jack', 12: 'Queen', 13: 'King'}
+NO_CODE = -1
+
+# Poker hand ranks (games.hand_evaluator) pack the category above five 4-bit
+# kicker slots, so a plain integer comparison orders any two hands.
+CATEGORY_SHIFT = 20
+
+@dataclass(slots=True)
 class CardEffect:
     effect_type: str
     value: int
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     id: str
     name: str
@@ -19,10 +29,13 @@ class Card:
     type: str
     attributes: CardAttributes = None
     effects: List[CardEffect] = None
+    code: int = NO_CODE
 
     def __post_init__(self):
         self.attributes = self.attributes or {}
         self.effects = self.effects or []
+        if self.code == NO_CODE and self.suit in SUIT_INDEX and 1 <= self.rank <= 13:
+            self.code = SUIT_INDEX[self.suit] * 13 + self.rank - 1
 
     def clone(self) -> 'Card':
         return Card(
@@ -32,5 +45,45 @@ class Card:
             rank=self.rank,
             type=self.type,
             attributes=self.attributes.copy(),
-            effects=self.effects.copy()
-        ) 
\ No newline at end of file
+            effects=self.effects.copy(),
+            code=self.code
+        )
+
+    @staticmethod
+    def from_code(code: int) -> 'Card':
+        """Get the shared standard card for a code 0-51"""
+        return STANDARD_CARDS[code]
+
+    def __reduce_ex__(self, protocol):
+        # Shared standard cards pickle and copy as a reference to the shared instance
+        if 0 <= self.code < 52 and STANDARD_CARDS[self.code] is self:
+            return (Card.from_code, (self.code,))
+        return object.__reduce_ex__(self, protocol)
+
+def _make_standard_card(code: int) -> Card:
+    suit = SUITS[code // 13]
+    rank = code % 13 + 1
+    return Card(
+        id=f"{suit}-{rank}",
+        name=f"{RANK_NAMES.get(rank, rank)} of {suit}",
+        suit=suit,
+        rank=rank,
+        type='standard',
+        code=code
+    )
+
+# Interned standard cards, shared by every standard deck. They are treated as
+# immutable: clone() a card before changing its attributes or effects.
+STANDARD_CARDS: Tuple[Card, ...] = tuple(_make_standard_card(code) for code in range(52))
+
+def standard_deck() -> List[Card]:
+    """A standard 52-card deck of the shared card instances"""
+    return list(STANDARD_CARDS)
+
+def encode_cards(cards: Iterable[Card]) -> bytes:
+    """Pack standard cards into one byte per card"""
+    return bytes(card.code for card in cards)
+
+def decode_cards(data: Iterable[int]) -> List[Card]:
+    """Unpack card codes into the shared standard cards"""
+    return [STANDARD_CARDS[code] for code in data]
@@ -1,41 +1,121 @@
-from typing import List
+from typing import Any, List, NamedTuple, Optional
 import random
 from .card import Card
+from .rng import make_rng
+
+class DeckSnapshot(NamedTuple):
+    cards: List[Card]
+    next: int
+    cut: int
+    discard_pile: List[Card]
+    rng_state: Any
 
 class Deck:
-    def __init__(self, id: str, initial_cards: List[Card] = None):
+    def __init__(self, id: str, initial_cards: List[Card] = None, penetration: float = 1.0,
+                 rng: Optional[random.Random] = None):
+        if not 0 < penetration <= 1:
+            raise ValueError("Penetration must be in (0, 1]")
         self.id = id
-        self._cards = initial_cards.copy() if initial_cards else []
+        # Cards before the cursor have been dealt; the rest are undealt, top first
+        self._cards: List[Card] = list(initial_cards) if initial_cards else []
+        self._next: int = 0
         self._discard_pile: List[Card] = []
+        # Set while a snapshot shares a buffer; it is copied before the next write
+        self._cards_shared = False
+        self._discards_shared = False
+        # Each deck shuffles from its own generator so seeded runs are reproducible
+        self.rng = rng if rng is not None else make_rng()
+        # Fraction of the shuffled deck dealt before the cut card comes out
+        self.penetration = penetration
+        self._cut: int = self._cut_position()
+
+    def _cut_position(self) -> int:
+        return self._next + round((len(self._cards) - self._next) * self.penetration)
+
+    def _own_cards(self) -> List[Card]:
+        if self._cards_shared:
+            self._cards = self._cards.copy()
+            self._cards_shared = False
+        return self._cards
+
+    def _own_discards(self) -> List[Card]:
+        if self._discards_shared:
+            self._discard_pile = self._discard_pile.copy()
+            self._discards_shared = False
+        return self._discard_pile
 
     def shuffle(self) -> None:
-        """Shuffle the deck using Fisher-Yates algorithm"""
-        random.shuffle(self._cards)
+        """Shuffle the undealt cards in place using Fisher-Yates"""
+        cards = self._own_cards()
+        start = self._next
+        randrange = self.rng.randrange
+        for i in range(len(cards) - 1, start, -1):
+            j = randrange(start, i + 1)
+            cards[i], cards[j] = cards[j], cards[i]
+        self._cut = self._cut_position()
+
+    def reshuffle(self) -> None:
+        """Return the discard pile to the deck and shuffle"""
+        cards = self._own_cards()
+        discards = self._own_discards()
+        count = len(discards)
+        if count <= self._next:
+            # Refill the already-dealt slots just ahead of the cursor
+            self._next -= count
+            cards[self._next:self._next + count] = discards
+        else:
+            cards[:self._next] = discards
+            self._next = 0
+        discards.clear()
+        self.shuffle()
 
     def draw(self, count: int = 1) -> List[Card]:
         """Draw specified number of cards from the deck"""
-        if count > len(self._cards):
+        if count > self.remaining_cards:
             # Reshuffle discard pile if needed
-            self._cards.extend(self._discard_pile)
-            self._discard_pile.clear()
-            self.shuffle()
+            self.reshuffle()
         
-        drawn_cards = self._cards[:count]
-        self._cards = self._cards[count:]
-        return drawn_cards
+        start = self._next
+        self._next = min(start + count, len(self._cards))
+        return self._cards[start:self._next]
 
     def add_to_discard(self, cards: List[Card]) -> None:
         """Add cards to the discard pile"""
-        self._discard_pile.extend(cards)
+        self._own_discards().extend(cards)
 
     def add_cards(self, cards: List[Card]) -> None:
         """Add cards to the deck"""
-        self._cards.extend(cards)
+        self._own_cards().extend(cards)
+
+    def snapshot(self) -> DeckSnapshot:
+        """Capture the deck in O(1); the buffers are copied only if the deck later changes them"""
+        self._cards_shared = True
+        self._discards_shared = True
+        return DeckSnapshot(self._cards, self._next, self._cut, self._discard_pile, self.rng.getstate())
+
+    def restore(self, snapshot: DeckSnapshot) -> None:
+        """Return the deck to a snapshot, which stays valid for further restores"""
+        self._cards = snapshot.cards
+        self._next = snapshot.next
+        self._cut = snapshot.cut
+        self._discard_pile = snapshot.discard_pile
+        self._cards_shared = True
+        self._discards_shared = True
+        self.rng.setstate(snapshot.rng_state)
+
+    def undealt(self) -> List[Card]:
+        """The undealt cards, top first, without drawing them"""
+        return self._cards[self._next:]
 
     @property
     def remaining_cards(self) -> int:
-        return len(self._cards)
+        return len(self._cards) - self._next
 
     @property
     def discard_count(self) -> int:
-        return len(self._discard_pile) 
\ No newline at end of file
+        return len(self._discard_pile)
+
+    @property
+    def needs_reshuffle(self) -> bool:
+        """Whether the cut card has been reached"""
+        return self._next >= self._cut
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from .card import Card
+from .player_action import PlayerAction
+from .player_state import PlayerState
+
+class GameEventType:
+    GAME_STARTED = "game_started"        # details: 'seed', 'players' (ids by seat), 'config'
+    ROUND_STARTED = "round_started"
+    # details['target']: 'player', 'board', 'dealer' or 'discard'; details['hole']
+    # marks the dealer's face-down card, shown in ROUND_ENDED once the dealer plays
+    CARDS_DEALT = "cards_dealt"
+    PLAYER_ACTED = "player_acted"
+    ACTION_REJECTED = "action_rejected"  # details['reason'] says why
+    PLAYER_BUSTED = "player_busted"
+    PLAYER_ELIMINATED = "player_eliminated"
+    # details['showdown'] is False for a Poker pot won when everyone else
+    # folded; the winner's cards were never shown
+    ROUND_WON = "round_won"
+    # Sent after every round, won or not: player is the winner or None,
+    # details['results'] maps player ids to their final hand rank or value;
+    # Poker lists every seat dealt in, with HAND_NOT_SHOWN for hands that
+    # were folded or won uncontested
+    ROUND_ENDED = "round_ended"
+    GAME_OVER = "game_over"
+
+HAND_NOT_SHOWN = -1
+
+# Stable one-byte codes for binary logs; never renumber, only append
+EVENT_CODES = {
+    GameEventType.GAME_STARTED: 1,
+    GameEventType.ROUND_STARTED: 2,
+    GameEventType.CARDS_DEALT: 3,
+    GameEventType.PLAYER_ACTED: 4,
+    GameEventType.ACTION_REJECTED: 5,
+    GameEventType.PLAYER_BUSTED: 6,
+    GameEventType.PLAYER_ELIMINATED: 7,
+    GameEventType.ROUND_WON: 8,
+    GameEventType.ROUND_ENDED: 9,
+    GameEventType.GAME_OVER: 10,
+}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+@dataclass(slots=True)
+class GameEvent:
+    event_type: str
+    game_type: str
+    player: Optional[PlayerState] = None
+    cards: List[Card] = None
+    action: Optional[PlayerAction] = None
+    amount: int = 0
+    details: Dict[str, Any] = None
+
+    def __post_init__(self):
+        self.cards = self.cards or []
+        self.details = self.details or {}
+
+class EventSink(ABC):
+    """Receives the events a game emits. Frontends, loggers and servers subclass this."""
+
+    @abstractmethod
+    def handle_event(self, event: GameEvent) -> None:
+        pass
@@ -1,15 +1,23 @@
-from typing import List, Dict, Optional
-from .player_state import PlayerState
-from .deck import Deck
+from typing import List, Dict, NamedTuple, Optional, Tuple
+from .player_state import PlayerSnapshot, PlayerState
+from .deck import Deck, DeckSnapshot
 
 class GamePhase:
     SETUP = "setup"
     IN_PROGRESS = "in_progress"
     COMPLETE = "complete"
 
+class GameSnapshot(NamedTuple):
+    players: Tuple[PlayerState, ...]
+    player_states: Tuple[PlayerSnapshot, ...]
+    current_player_index: int
+    phase: str
+    decks: Tuple[Tuple[Deck, DeckSnapshot], ...]
+
 class GameState:
     def __init__(self):
         self._players: List[PlayerState] = []
+        self._players_view: Optional[Tuple[PlayerState, ...]] = None
         self._current_player_index: int = 0
         self._phase: str = GamePhase.SETUP
         self._decks: Dict[str, Deck] = {}
@@ -17,6 +25,18 @@ class GameState:
     def add_player(self, player: PlayerState) -> None:
         """Add a player to the game"""
         self._players.append(player)
+        self._players_view = None
+
+    def remove_player(self, player: PlayerState) -> None:
+        """Remove a player from the game"""
+        self._players.remove(player)
+        self._players_view = None
+
+    def seat_players(self, players: List[PlayerState]) -> None:
+        """Replace the players with the given ones, in order"""
+        self._players = list(players)
+        self._players_view = None
+        self._current_player_index = 0
 
     def add_deck(self, deck: Deck) -> None:
         """Add a deck to the game"""
@@ -44,4 +64,37 @@ class GameState:
 
     def get_players(self) -> List[PlayerState]:
         """Get a list of all players"""
-        return self._players.copy() 
\ No newline at end of file
+        return self._players.copy()
+
+    @property
+    def players(self) -> Tuple[PlayerState, ...]:
+        """Read-only tuple of all players, rebuilt only when players join or leave"""
+        if self._players_view is None:
+            self._players_view = tuple(self._players)
+        return self._players_view
+
+    def snapshot(self) -> GameSnapshot:
+        """Capture players, turn, phase and decks without copying any Card.
+
+        A game's own fields (pot, board, dealer hand) are not included; use
+        BaseGame.snapshot to roll back a whole position.
+        """
+        return GameSnapshot(
+            self.players,
+            tuple(player.snapshot() for player in self._players),
+            self._current_player_index,
+            self._phase,
+            tuple((deck, deck.snapshot()) for deck in self._decks.values())
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Return the game to a snapshot; a snapshot can be restored any number of times"""
+        self._players = list(snapshot.players)
+        self._players_view = snapshot.players
+        for player, player_state in zip(snapshot.players, snapshot.player_states):
+            player.restore(player_state)
+        self._current_player_index = snapshot.current_player_index
+        self._phase = snapshot.phase
+        self._decks = {deck.id: deck for deck, _ in snapshot.decks}
+        for deck, deck_state in snapshot.decks:
+            deck.restore(deck_state)
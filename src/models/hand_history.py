@@ -0,0 +1,192 @@
+import os
+import struct
+from typing import BinaryIO, Dict, List, Optional, Set
+from .events import EVENT_CODES, EventSink, GameEvent, GameEventType
+from .player_action import ACTION_CODES
+from .rng import seed_words
+
+# File layout: FILE_HEADER, then records of
+#   u16 length of the rest of the record
+#   RECORD: event code, game id, seat, action code, amount, card count
+#   one byte per card (Card.code, 255 if the card has none)
+#   an event-specific tail:
+#     GAME_STARTED  GAME_TAIL: game code, seed (rng.seed_words: high, low),
+#                   seats, initial bankroll,
+#                   then each seat's player id as a u8 length and UTF-8
+#     ROUND_STARTED u32 round number
+#     CARDS_DEALT   u8 target code
+#     ROUND_ENDED   ROUND_TAIL: dealer value (-1 if none), result count,
+#                   then RESULT per result: seat, hand rank or value
+# Seats are indexes into the players listed when the game started; 255
+# means no player.
+MAGIC = b'CGHH'
+VERSION = 2
+FILE_HEADER = struct.Struct('<4sH')
+LENGTH = struct.Struct('<H')
+RECORD = struct.Struct('<BIBBiB')
+PREFIXED_RECORD = struct.Struct('<HBIBBiB')  # LENGTH and RECORD packed in one go
+GAME_TAIL = struct.Struct('<BqQBi')
+ROUND_NUMBER = struct.Struct('<I')
+TARGET = struct.Struct('<B')
+ROUND_TAIL = struct.Struct('<hB')
+RESULT = struct.Struct('<Bi')
+
+NO_SEAT = 255
+NO_CARD = 255
+
+# Stable codes for game types and deal targets; never renumber, only append
+GAME_CODES = {"Poker": 1, "Blackjack": 2, "Rummy": 3}
+GAME_NAMES = {code: name for name, code in GAME_CODES.items()}
+TARGET_CODES = {'player': 1, 'board': 2, 'dealer': 3, 'discard': 4}
+TARGET_NAMES = {code: name for name, code in TARGET_CODES.items()}
+
+_GAME_STARTED = EVENT_CODES[GameEventType.GAME_STARTED]
+_ROUND_STARTED = EVENT_CODES[GameEventType.ROUND_STARTED]
+_CARDS_DEALT = EVENT_CODES[GameEventType.CARDS_DEALT]
+_ROUND_ENDED = EVENT_CODES[GameEventType.ROUND_ENDED]
+_ROUND_ENDS = frozenset((GameEventType.ROUND_ENDED, GameEventType.GAME_OVER))
+# Encoded single cards indexed by Card.code, NO_CODE (-1) being the last
+_CARD_BYTES = [bytes([code]) for code in range(52)] + [bytes([NO_CARD])]
+_TARGET_TAILS = {target: TARGET.pack(code) for target, code in TARGET_CODES.items()}
+_NO_TARGET = TARGET.pack(0)
+
+class HandHistoryWriter:
+    """Append-only binary log of game events, buffered and written in large batches.
+
+    One writer can log any number of games, even interleaved: each game gets
+    its own recorder sink and game id.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._file: Optional[BinaryIO] = open(path, 'ab')
+        if self._file.tell() == 0:
+            self._buffer += FILE_HEADER.pack(MAGIC, VERSION)
+        self._next_game_id = 0
+        self._recorders: Set['GameRecorder'] = set()
+
+    def recorder(self) -> 'GameRecorder':
+        """A sink for one game; pass it to the game's constructor to log the start and first deal.
+
+        Pass it to end_game once the game is over.
+        """
+        self._next_game_id += 1
+        recorder = GameRecorder(self, self._next_game_id)
+        self._recorders.add(recorder)
+        return recorder
+
+    def end_game(self, recorder: 'GameRecorder') -> None:
+        """Write out the last events of a finished game"""
+        recorder.flush()
+        self._recorders.discard(recorder)
+
+    def write(self, records: bytes) -> None:
+        """Append encoded records, length prefixes included"""
+        self._buffer += records
+        if len(self._buffer) >= self.buffer_size:
+            self._write_buffer()
+
+    def flush(self) -> None:
+        """Write every event logged so far, including rounds still in play"""
+        for recorder in self._recorders:
+            recorder.flush()
+        self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        if self._buffer and self._file:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file:
+            self.flush()
+            self._file.close()
+            self._file = None
+            self._recorders.clear()
+
+    def __enter__(self) -> 'HandHistoryWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+class GameRecorder(EventSink):
+    """Encodes one game's events into its writer.
+
+    Events are held until their round ends and then encoded in one pass,
+    which costs much less per event than encoding each on arrival.
+    """
+
+    def __init__(self, writer: HandHistoryWriter, game_id: int):
+        self.writer = writer
+        self.game_id = game_id
+        self.seats: Dict[str, int] = {}
+        self._pending: List[GameEvent] = []
+
+    def handle_event(self, event: GameEvent) -> None:
+        self._pending.append(event)
+        if event.event_type in _ROUND_ENDS:
+            self.flush()
+
+    def flush(self) -> None:
+        """Encode the events held so far into the writer"""
+        if not self._pending:
+            return
+        parts = []
+        append = parts.append
+        pack = PREFIXED_RECORD.pack
+        event_codes = EVENT_CODES
+        action_codes = ACTION_CODES
+        card_bytes = _CARD_BYTES
+        game_id = self.game_id
+        for event in self._pending:
+            code = event_codes[event.event_type]
+            player = event.player
+            action = event.action
+            cards = event.cards
+            if not cards:
+                encoded = b''
+            elif len(cards) == 1:
+                encoded = card_bytes[cards[0].code]
+            else:
+                # Masking maps NO_CODE (-1) to NO_CARD (255)
+                encoded = bytes([card.code & 0xFF for card in cards])
+
+            if code == _CARDS_DEALT:
+                tail = _TARGET_TAILS.get(event.details.get('target'), _NO_TARGET)
+            elif code == _ROUND_STARTED or code == _ROUND_ENDED or code == _GAME_STARTED:
+                tail = self._encode_tail(code, event)
+            else:
+                tail = b''
+            append(pack(RECORD.size + len(encoded) + len(tail), code, game_id,
+                        self.seats.get(player.id, NO_SEAT) if player else NO_SEAT,
+                        action_codes.get(action.action_type, 0) if action else 0, event.amount, len(encoded)))
+            append(encoded)
+            append(tail)
+        self._pending.clear()
+        self.writer.write(b''.join(parts))
+
+    def _encode_tail(self, code: int, event: GameEvent) -> bytes:
+        details = event.details
+        if code == _ROUND_STARTED:
+            return ROUND_NUMBER.pack(details.get('round', 0))
+        if code == _ROUND_ENDED:
+            results = details.get('results', {})
+            tail = ROUND_TAIL.pack(details.get('dealer_value', -1), len(results))
+            return tail + b''.join(RESULT.pack(self.seats.get(player_id, NO_SEAT), value)
+                                   for player_id, value in results.items())
+        self.seats = {player_id: seat for seat, player_id in enumerate(details['players'])}
+        tail = GAME_TAIL.pack(GAME_CODES.get(event.game_type, 0), *seed_words(details['seed']),
+                              len(self.seats), details['config'].get('initial_bankroll', 0))
+        for player_id in details['players']:
+            encoded = player_id.encode()
+            tail += bytes([len(encoded)]) + encoded
+        return tail
+
+def default_history_path(directory: str, name: str) -> str:
+    """Path of a log file in directory, creating the directory if needed"""
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{name}.hh")
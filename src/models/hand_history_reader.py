@@ -0,0 +1,332 @@
+import argparse
+import glob
+import json
+import mmap
+import os
+import shutil
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+import numpy as np
+from .card import CATEGORY_SHIFT
+from .events import EVENT_CODES, EVENT_TYPES, GameEventType
+from .hand_history import (FILE_HEADER, GAME_CODES, GAME_NAMES, GAME_TAIL, LENGTH, MAGIC, NO_SEAT,
+                           RECORD, RESULT, ROUND_TAIL, VERSION)
+from .player_action import ACTION_TYPES
+from .rng import join_seed_words
+
+# One row per seat per ROUND_ENDED record. Each secondary index is a pair of
+# .npy files next to the rows: the indexed column sorted, and the row ids in
+# that order, so a lookup is a binary search over a memory-mapped array.
+ROW_DTYPE = np.dtype([
+    ('offset', '<u8'),       # of the ROUND_ENDED record
+    ('game_offset', '<u8'),  # of the game's GAME_STARTED record
+    ('player', '<u4'),       # index into the player id table
+    ('game', 'u1'),          # GAME_CODES
+    ('won', 'u1'),
+    ('up_rank', 'u1'),       # rank of the dealer's up card, 0 if no dealer
+    ('value', '<i4'),        # Poker hand rank, Blackjack total or Rummy deadwood
+    ('pot', '<i4'),
+    ('dealer_value', '<i2'), # -1 if no dealer
+])
+INDEXED_COLUMNS = ('player', 'game', 'value', 'pot')
+INDEX_VERSION = 2
+
+_GAME_STARTED = EVENT_CODES[GameEventType.GAME_STARTED]
+_ROUND_WON = EVENT_CODES[GameEventType.ROUND_WON]
+_ROUND_ENDED = EVENT_CODES[GameEventType.ROUND_ENDED]
+_BLACKJACK = GAME_CODES["Blackjack"]
+_INT32 = np.iinfo(np.int32)
+
+class HistoryRecord(NamedTuple):
+    offset: int
+    event_type: str
+    game_id: int
+    seat: int
+    action_type: Optional[str]
+    amount: int
+    cards: bytes  # Card codes
+    tail: bytes
+
+class GameStart(NamedTuple):
+    game_type: str
+    seed: int
+    initial_bankroll: int
+    players: Tuple[str, ...]
+
+class HandResult(NamedTuple):
+    """One seat's result in one round"""
+    offset: int
+    game_offset: int
+    game_type: str
+    player: str
+    won: bool
+    value: int
+    pot: int
+    dealer_value: int
+    up_rank: int
+
+def _decode_game_start(tail: bytes) -> GameStart:
+    game, seed_high, seed_low, seats, bankroll = GAME_TAIL.unpack_from(tail)
+    players = []
+    pos = GAME_TAIL.size
+    for _ in range(seats):
+        length = tail[pos]
+        players.append(tail[pos + 1:pos + 1 + length].decode())
+        pos += 1 + length
+    return GameStart(GAME_NAMES.get(game, ''), join_seed_words(seed_high, seed_low), bankroll, tuple(players))
+
+def index_path(path: str) -> str:
+    """Directory holding the indexes of a log"""
+    return path + '.idx'
+
+class HandHistoryReader:
+    """Memory-mapped view of a hand-history log with on-disk secondary indexes.
+
+    The indexes are built by one pass over the log the first time it is
+    opened, and rebuilt whenever the log has grown since. Queries binary
+    search the most selective index and only read the rows it points at.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < FILE_HEADER.size:
+                raise ValueError(f"{path} is not a hand history log")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = FILE_HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} hand history log")
+        self._load_index()
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> 'HandHistoryReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _raw_records(self) -> Iterator[Tuple[int, int, int, int, int, int, int, int]]:
+        """(offset, event code, game id, seat, action code, amount, cards start, end) of each whole record"""
+        data = self._map
+        size = len(data)
+        pos = FILE_HEADER.size
+        while pos + LENGTH.size + RECORD.size <= size:
+            end = pos + LENGTH.size + LENGTH.unpack_from(data, pos)[0]
+            if end > size:
+                break  # Torn write at the end of the log
+            code, game_id, seat, action, amount, _ = RECORD.unpack_from(data, pos + LENGTH.size)
+            yield pos, code, game_id, seat, action, amount, pos + LENGTH.size + RECORD.size, end
+            pos = end
+
+    def _decode(self, offset: int) -> HistoryRecord:
+        data = self._map
+        length = LENGTH.unpack_from(data, offset)[0]
+        code, game_id, seat, action, amount, num_cards = RECORD.unpack_from(data, offset + LENGTH.size)
+        cards_start = offset + LENGTH.size + RECORD.size
+        tail_start = cards_start + num_cards
+        return HistoryRecord(offset, EVENT_TYPES.get(code, ''), game_id, seat, ACTION_TYPES.get(action),
+                             amount, data[cards_start:tail_start], data[tail_start:offset + LENGTH.size + length])
+
+    def records(self) -> Iterator[HistoryRecord]:
+        """Every record in the log, in order"""
+        for raw in self._raw_records():
+            yield self._decode(raw[0])
+
+    def game_start(self, offset: int) -> GameStart:
+        """The GAME_STARTED record at an offset, such as HandResult.game_offset"""
+        return _decode_game_start(self._decode(offset).tail)
+
+    def _scan(self) -> Tuple[np.ndarray, List[str]]:
+        """One row per seat result of every ROUND_ENDED record"""
+        data = self._map
+        player_codes: Dict[str, int] = {}
+        games: Dict[int, Tuple[int, int, List[int]]] = {}  # game id -> (offset, game code, player codes)
+        winners: Dict[int, Set[int]] = {}  # game id -> seats sent ROUND_WON since its last ROUND_ENDED
+        rows = []
+        for offset, code, game_id, seat, _, amount, cards_start, end in self._raw_records():
+            if code == _GAME_STARTED:
+                num_cards = data[cards_start - 1]
+                start = _decode_game_start(data[cards_start + num_cards:end])
+                players = [player_codes.setdefault(player_id, len(player_codes)) for player_id in start.players]
+                games[game_id] = (offset, GAME_CODES.get(start.game_type, 0), players)
+            elif code == _ROUND_WON:
+                winners.setdefault(game_id, set()).add(seat)
+            elif code == _ROUND_ENDED and game_id in games:
+                game_offset, game, players = games[game_id]
+                num_cards = data[cards_start - 1]
+                up_rank = 0
+                if game == _BLACKJACK and num_cards and data[cards_start] < 52:
+                    up_rank = data[cards_start] % 13 + 1
+                pos = cards_start + num_cards
+                dealer_value, num_results = ROUND_TAIL.unpack_from(data, pos)
+                pos += ROUND_TAIL.size
+                # A split pot has several winners; ROUND_ENDED names only the first
+                round_winners = winners.pop(game_id, None) or {seat}
+                for _ in range(num_results):
+                    result_seat, value = RESULT.unpack_from(data, pos)
+                    pos += RESULT.size
+                    if result_seat == NO_SEAT or result_seat >= len(players):
+                        continue
+                    if game == _BLACKJACK:
+                        won = value <= 21 and (dealer_value > 21 or value > dealer_value)
+                    else:
+                        won = result_seat in round_winners
+                    rows.append((offset, game_offset, players[result_seat], game, won, up_rank,
+                                 value, amount, dealer_value))
+        return np.array(rows, dtype=ROW_DTYPE), list(player_codes)
+
+    def rebuild_index(self) -> None:
+        """Scan the log and write fresh indexes"""
+        rows, players = self._scan()
+        directory = index_path(self.path)
+        tmp_directory = directory + '.tmp'
+        shutil.rmtree(tmp_directory, ignore_errors=True)
+        os.makedirs(tmp_directory)
+        np.save(os.path.join(tmp_directory, 'rows.npy'), rows)
+        for column in INDEXED_COLUMNS:
+            order = np.argsort(rows[column], kind='stable').astype(np.uint64)
+            np.save(os.path.join(tmp_directory, f'{column}.keys.npy'), rows[column][order])
+            np.save(os.path.join(tmp_directory, f'{column}.rows.npy'), order)
+        with open(os.path.join(tmp_directory, 'meta.json'), 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'log_size': len(self._map), 'players': players}, f)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.rename(tmp_directory, directory)
+
+    def _load_index(self) -> None:
+        directory = index_path(self.path)
+        meta_path = os.path.join(directory, 'meta.json')
+        meta = None
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+        if not meta or meta['version'] != INDEX_VERSION or meta['log_size'] != len(self._map):
+            self.rebuild_index()
+            with open(meta_path) as f:
+                meta = json.load(f)
+        self.players: List[str] = meta['players']
+        self._player_codes = {player_id: code for code, player_id in enumerate(self.players)}
+        self._rows = np.load(os.path.join(directory, 'rows.npy'), mmap_mode='r')
+        self._indexes = {
+            column: (np.load(os.path.join(directory, f'{column}.keys.npy'), mmap_mode='r'),
+                     np.load(os.path.join(directory, f'{column}.rows.npy'), mmap_mode='r'))
+            for column in INDEXED_COLUMNS
+        }
+
+    def __len__(self) -> int:
+        """Number of indexed seat results"""
+        return len(self._rows)
+
+    def _select(self, player: Optional[str] = None, game_type: Optional[str] = None,
+                won: Optional[bool] = None, hand_category: Optional[int] = None,
+                min_value: Optional[int] = None, max_value: Optional[int] = None,
+                min_pot: Optional[int] = None, max_pot: Optional[int] = None,
+                dealer_busted: Optional[bool] = None, up_rank: Optional[int] = None) -> np.ndarray:
+        """Rows matching every given criterion, in log order"""
+        ranges: Dict[str, Tuple[int, int]] = {}
+        if player is not None:
+            if player not in self._player_codes:
+                return np.empty(0, dtype=ROW_DTYPE)
+            ranges['player'] = (self._player_codes[player],) * 2
+        if hand_category is not None and game_type is None:
+            game_type = "Poker"  # Only poker hand ranks have categories
+        if game_type is not None:
+            if game_type not in GAME_CODES:
+                return np.empty(0, dtype=ROW_DTYPE)
+            ranges['game'] = (GAME_CODES[game_type],) * 2
+        if hand_category is not None:
+            min_value = max(min_value or 0, hand_category << CATEGORY_SHIFT)
+            max_value = min(_INT32.max if max_value is None else max_value,
+                            ((hand_category + 1) << CATEGORY_SHIFT) - 1)
+        if min_value is not None or max_value is not None:
+            ranges['value'] = (_INT32.min if min_value is None else min_value,
+                               _INT32.max if max_value is None else max_value)
+        if min_pot is not None or max_pot is not None:
+            ranges['pot'] = (_INT32.min if min_pot is None else min_pot,
+                             _INT32.max if max_pot is None else max_pot)
+
+        if ranges:
+            # Only read the rows of the narrowest index range
+            spans = {}
+            for column, (low, high) in ranges.items():
+                keys = self._indexes[column][0]
+                spans[column] = (np.searchsorted(keys, low, 'left'), np.searchsorted(keys, high, 'right'))
+            column = min(spans, key=lambda c: spans[c][1] - spans[c][0])
+            start, stop = spans[column]
+            rows = self._rows[np.sort(self._indexes[column][1][start:stop])]
+        else:
+            rows = self._rows[:]
+
+        mask = np.ones(len(rows), dtype=bool)
+        for column, (low, high) in ranges.items():
+            mask &= (rows[column] >= low) & (rows[column] <= high)
+        if won is not None:
+            mask &= rows['won'] == won
+        if dealer_busted is not None:
+            mask &= (rows['dealer_value'] > 21) == dealer_busted
+            mask &= rows['up_rank'] > 0
+        if up_rank is not None:
+            mask &= rows['up_rank'] == up_rank
+        return rows[mask]
+
+    def query(self, **criteria) -> List[HandResult]:
+        """Seat results matching every criterion given.
+
+        Criteria: player (id), game_type ("Poker", "Blackjack" or "Rummy"),
+        won, hand_category (a PokerHand category), min_value / max_value
+        (hand rank, total or deadwood), min_pot / max_pot, dealer_busted and
+        up_rank (rank of the dealer's up card, 1 for an ace). Ranges are
+        inclusive. For example, p3 losing with a full house is
+        query(player='p3', won=False, hand_category=PokerHand.FULL_HOUSE).
+        """
+        return [HandResult(int(row['offset']), int(row['game_offset']), GAME_NAMES.get(int(row['game']), ''),
+                           self.players[row['player']], bool(row['won']), int(row['value']), int(row['pot']),
+                           int(row['dealer_value']), int(row['up_rank']))
+                for row in self._select(**criteria)]
+
+    def count(self, **criteria) -> int:
+        """Number of seat results matching the criteria, as for query"""
+        return len(self._select(**criteria))
+
+def log_paths(paths: Sequence[str]) -> List[str]:
+    """Log files among paths, expanding directories to the .hh files in them"""
+    logs = []
+    for path in paths:
+        if os.path.isdir(path):
+            logs.extend(sorted(glob.glob(os.path.join(path, '*.hh'))))
+        else:
+            logs.append(path)
+    return logs
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query hand-history logs")
+    parser.add_argument('logs', nargs='+', help="log files or directories of them")
+    parser.add_argument('--player')
+    parser.add_argument('--game', dest='game_type', choices=sorted(GAME_CODES))
+    outcome = parser.add_mutually_exclusive_group()
+    outcome.add_argument('--won', action='store_const', const=True, dest='won')
+    outcome.add_argument('--lost', action='store_const', const=False, dest='won')
+    parser.add_argument('--hand-category', type=int)
+    parser.add_argument('--min-value', type=int)
+    parser.add_argument('--max-value', type=int)
+    parser.add_argument('--min-pot', type=int)
+    parser.add_argument('--max-pot', type=int)
+    parser.add_argument('--dealer-busted', action='store_const', const=True)
+    parser.add_argument('--up-rank', type=int)
+    parser.add_argument('--limit', type=int, default=20, help="results to print per log (0 to only count)")
+    args = vars(parser.parse_args())
+    logs = args.pop('logs')
+    limit = args.pop('limit')
+    criteria = {name: value for name, value in args.items() if value is not None}
+
+    total = 0
+    for path in log_paths(logs):
+        with HandHistoryReader(path) as reader:
+            results = reader.query(**criteria)
+            total += len(results)
+            for result in results[:limit]:
+                print(json.dumps({'log': path, **result._asdict()}))
+    print(json.dumps({'matches': total}))
+
+if __name__ == "__main__":
+    main()
@@ -30,4 +30,21 @@ class PlayerActionType:
     DRAW_DISCARD = "draw_discard"
     DISCARD = "discard"
     DECLARE_SET = "declare_set"
-    DECLARE_RUN = "declare_run" 
\ No newline at end of file
+    DECLARE_RUN = "declare_run"
+
+# Stable one-byte codes for binary logs (0 means no action); never renumber, only append
+ACTION_CODES = {
+    PlayerActionType.QUIT: 1,
+    PlayerActionType.FOLD: 2,
+    PlayerActionType.CALL: 3,
+    PlayerActionType.RAISE: 4,
+    PlayerActionType.HIT: 5,
+    PlayerActionType.STAND: 6,
+    PlayerActionType.DOUBLE: 7,
+    PlayerActionType.DRAW_DECK: 8,
+    PlayerActionType.DRAW_DISCARD: 9,
+    PlayerActionType.DISCARD: 10,
+    PlayerActionType.DECLARE_SET: 11,
+    PlayerActionType.DECLARE_RUN: 12,
+}
+ACTION_TYPES = {code: action_type for action_type, code in ACTION_CODES.items()} 
\ No newline at end of file
@@ -1,35 +1,82 @@
-from typing import List
-from .card import Card
+from typing import Dict, Iterable, List, NamedTuple, Tuple, ValuesView
+from .card import Card, NO_CODE
+
+class PlayerSnapshot(NamedTuple):
+    hand: Tuple[Card, ...]
+    score: int
+    bankroll: int
 
 class PlayerState:
     def __init__(self, id: str, name: str, initial_bankroll: int = 1000):
         self.id = id
         self.name = name
-        self._hand: List[Card] = []
+        # Hand cards keyed by insertion slot (keeping deal order), plus the slots
+        # holding each card id, so add, remove and membership are O(1) even when
+        # a multi-deck shoe deals the same card twice
+        self._hand: Dict[int, Card] = {}
+        self._slots: Dict[str, List[int]] = {}
+        self._next_slot: int = 0
+        # 4x13 suit/rank bitboard: bit Card.code is set while the hand holds
+        # at least one copy of that card
+        self.card_mask: int = 0
         self._score: int = 0
         self.bankroll: int = initial_bankroll
 
-    def add_to_hand(self, cards: List[Card]) -> None:
+    def add_to_hand(self, cards: Iterable[Card]) -> None:
         """Add cards to player's hand"""
-        self._hand.extend(cards)
+        for card in cards:
+            slot = self._next_slot
+            self._next_slot += 1
+            self._hand[slot] = card
+            self._slots.setdefault(card.id, []).append(slot)
+            if card.code != NO_CODE:
+                self.card_mask |= 1 << card.code
 
-    def remove_from_hand(self, card_ids: List[str]) -> List[Card]:
+    def remove_from_hand(self, card_ids: Iterable[str]) -> List[Card]:
         """Remove and return cards from player's hand"""
         removed_cards: List[Card] = []
-        remaining_cards: List[Card] = []
-
-        for card in self._hand:
-            if card.id in card_ids:
+        for card_id in dict.fromkeys(card_ids):
+            for slot in self._slots.pop(card_id, ()):
+                card = self._hand.pop(slot)
                 removed_cards.append(card)
-            else:
-                remaining_cards.append(card)
-
-        self._hand = remaining_cards
+                if card.code != NO_CODE:
+                    # Every copy of the id is gone, so the card's bit clears
+                    self.card_mask &= ~(1 << card.code)
         return removed_cards
 
+    def clear_hand(self) -> None:
+        """Remove all cards from player's hand"""
+        self._hand.clear()
+        self._slots.clear()
+        self.card_mask = 0
+
+    def has_card(self, card_id: str) -> bool:
+        """Check if a card is in player's hand"""
+        return card_id in self._slots
+
     def get_hand(self) -> List[Card]:
         """Get a copy of player's hand"""
-        return self._hand.copy()
+        return list(self._hand.values())
+
+    @property
+    def hand(self) -> ValuesView[Card]:
+        """Read-only live view of player's hand, for callers that only iterate"""
+        return self._hand.values()
+
+    @property
+    def hand_size(self) -> int:
+        return len(self._hand)
+
+    def snapshot(self) -> PlayerSnapshot:
+        """Capture the player's hand, score and bankroll, sharing the Card objects"""
+        return PlayerSnapshot(tuple(self._hand.values()), self._score, self.bankroll)
+
+    def restore(self, snapshot: PlayerSnapshot) -> None:
+        """Return the player to a snapshot"""
+        self.clear_hand()
+        self.add_to_hand(snapshot.hand)
+        self._score = snapshot.score
+        self.bankroll = snapshot.bankroll
 
     def update_score(self, points: int) -> None:
         """Update player's score"""
@@ -45,4 +92,4 @@ class PlayerState:
 
     def get_bankroll(self) -> int:
         """Get player's current bankroll"""
-        return self.bankroll 
\ No newline at end of file
+        return self.bankroll
@@ -0,0 +1,40 @@
+import hashlib
+import random
+from typing import List, Optional, Tuple, Union
+
+SeedPart = Union[int, str]
+
+def derive_seed(root_seed: int, *path: SeedPart) -> int:
+    """Derive an independent 64-bit seed for the stream named by path.
+
+    The same root seed and path always give the same seed, and distinct paths
+    give statistically independent streams, e.g. derive_seed(root, 'game', 42)
+    for game 42 of a batch, or derive_seed(game_seed, 'deck', 'main').
+    """
+    key = '/'.join(str(part) for part in (root_seed,) + path).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+def spawn_seeds(root_seed: int, count: int, *path: SeedPart) -> List[int]:
+    """Seeds for count child streams, e.g. one per worker process"""
+    return [derive_seed(root_seed, *path, index) for index in range(count)]
+
+def new_seed() -> int:
+    """A fresh 64-bit root seed from the operating system"""
+    return random.SystemRandom().getrandbits(64)
+
+def seed_words(seed: int) -> Tuple[int, int]:
+    """Split a seed into a signed high and an unsigned low 64-bit word for fixed-width formats.
+
+    Covers negative seeds as well as derived and fresh ones up to 2**64 - 1.
+    """
+    if not -(1 << 127) <= seed < 1 << 127:
+        raise ValueError(f"Seed {seed} doesn't fit in 128 bits")
+    return seed >> 64, seed & 0xFFFFFFFFFFFFFFFF
+
+def join_seed_words(high: int, low: int) -> int:
+    """The seed split by seed_words"""
+    return high << 64 | low
+
+def make_rng(seed: Optional[int] = None) -> random.Random:
+    """A private generator; unseeded generators draw a fresh seed"""
+    return random.Random(new_seed() if seed is None else seed)
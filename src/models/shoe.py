@@ -0,0 +1,83 @@
+import random
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+from .card import Card
+from .deck import Deck, DeckSnapshot
+
+# Hi-Lo tag of each rank (index rank - 1): low cards +1, tens and aces -1
+HI_LO = (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1)
+
+class ShoeSnapshot(NamedTuple):
+    deck: DeckSnapshot
+    running_count: int
+    rank_counts: Tuple[int, ...]
+
+class Shoe(Deck):
+    """A dealing shoe that keeps a card count and the undealt rank histogram.
+
+    Both are updated as cards leave or return to the undealt stack, so
+    reading them is O(1). The running count is the sum of the count tags of
+    every card outside the undealt stack, which for a full shoe is the usual
+    running count since the last shuffle.
+    """
+
+    def __init__(self, id: str, initial_cards: List[Card] = None, penetration: float = 1.0,
+                 rng: Optional[random.Random] = None, count_tags: Sequence[int] = HI_LO):
+        self.count_tags = tuple(count_tags)
+        self.running_count = 0
+        self._rank_counts = [0] * 13
+        super().__init__(id, initial_cards, penetration, rng)
+        self._return(self._cards)
+
+    def _return(self, cards: List[Card]) -> None:
+        """Account for cards going back into the undealt stack"""
+        rank_counts = self._rank_counts
+        tags = self.count_tags
+        for card in cards:
+            rank_counts[card.rank - 1] += 1
+            self.running_count -= tags[card.rank - 1]
+
+    def draw(self, count: int = 1) -> List[Card]:
+        cards = super().draw(count)
+        rank_counts = self._rank_counts
+        tags = self.count_tags
+        for card in cards:
+            rank_counts[card.rank - 1] -= 1
+            self.running_count += tags[card.rank - 1]
+        return cards
+
+    def reshuffle(self) -> None:
+        self._return(self._discard_pile)
+        super().reshuffle()
+
+    def add_cards(self, cards: List[Card]) -> None:
+        super().add_cards(cards)
+        self._return(cards)
+
+    @property
+    def decks_remaining(self) -> float:
+        return self.remaining_cards / 52
+
+    @property
+    def true_count(self) -> float:
+        """Running count per deck left in the shoe"""
+        decks = self.decks_remaining
+        return self.running_count / decks if decks else 0.0
+
+    @property
+    def rank_counts(self) -> Tuple[int, ...]:
+        """Undealt cards of each rank, ace first"""
+        return tuple(self._rank_counts)
+
+    @property
+    def composition(self) -> List[int]:
+        """Undealt cards per blackjack value category (ace, 2-9, ten-valued)"""
+        counts = self._rank_counts
+        return counts[:9] + [counts[9] + counts[10] + counts[11] + counts[12]]
+
+    def snapshot(self) -> ShoeSnapshot:
+        return ShoeSnapshot(super().snapshot(), self.running_count, tuple(self._rank_counts))
+
+    def restore(self, snapshot: ShoeSnapshot) -> None:
+        super().restore(snapshot.deck)
+        self.running_count = snapshot.running_count
+        self._rank_counts = list(snapshot.rank_counts)
@@ -0,0 +1,160 @@
+import random
+import struct
+from typing import List, Sequence, Tuple
+from .card import STANDARD_CARDS, Card
+from .deck import Deck, DeckSnapshot
+from .game_state import GamePhase, GameSnapshot, GameState
+from .player_state import PlayerSnapshot, PlayerState
+from .shoe import Shoe, ShoeSnapshot
+
+# Layout of an encoded GameState (all little-endian):
+#   STATE_HEADER: magic, version
+#   STATE: phase code, current player index, player count, deck count
+#   per player: id and name (u8 length + UTF-8), PLAYER: score, bankroll,
+#     then the hand as cards
+#   per deck: DECK: kind, penetration, dealt cursor, cut position; the id;
+#     the cards and the discard pile as cards; the generator state; for
+#     shoes, the 13 count tags as signed bytes
+# Cards are a u16 count then one Card.code byte each, so only standard
+# cards can be encoded. A generator state is RNG: Mersenne Twister words
+# and position, then whether a Gaussian is cached and its value.
+MAGIC = b'CGST'
+VERSION = 1
+STATE_HEADER = struct.Struct('<4sH')
+STATE = struct.Struct('<BBBB')
+PLAYER = struct.Struct('<ii')
+DECK = struct.Struct('<BdHH')
+CARD_COUNT = struct.Struct('<H')
+STR_LENGTH = struct.Struct('<B')
+RNG = struct.Struct('<625I?d')
+COUNT_TAGS = struct.Struct('<13b')
+
+# Stable codes; never renumber, only append
+PHASE_CODES = {GamePhase.SETUP: 0, GamePhase.IN_PROGRESS: 1, GamePhase.COMPLETE: 2}
+PHASES = {code: phase for phase, code in PHASE_CODES.items()}
+PLAIN_DECK, SHOE = 0, 1
+_DECK_KINDS = {Deck: PLAIN_DECK, Shoe: SHOE}
+
+def write_str(parts: List[bytes], text: str) -> None:
+    encoded = text.encode()
+    parts.append(STR_LENGTH.pack(len(encoded)))
+    parts.append(encoded)
+
+def read_str(data: bytes, pos: int) -> Tuple[str, int]:
+    length = data[pos]
+    pos += STR_LENGTH.size
+    return bytes(data[pos:pos + length]).decode(), pos + length
+
+def write_cards(parts: List[bytes], cards: Sequence[Card]) -> None:
+    try:
+        codes = bytes([card.code for card in cards])
+    except ValueError:
+        raise ValueError("Only standard cards can be encoded") from None
+    parts.append(CARD_COUNT.pack(len(codes)))
+    parts.append(codes)
+
+def read_cards(data: bytes, pos: int) -> Tuple[List[Card], int]:
+    count = CARD_COUNT.unpack_from(data, pos)[0]
+    pos += CARD_COUNT.size
+    return [STANDARD_CARDS[code] for code in data[pos:pos + count]], pos + count
+
+def write_rng_state(parts: List[bytes], state: tuple) -> None:
+    """Append a random.Random state, as from getstate()"""
+    _, internal, gauss = state
+    parts.append(RNG.pack(*internal, gauss is not None, gauss or 0.0))
+
+def read_rng_state(data: bytes, pos: int) -> Tuple[tuple, int]:
+    """A random.Random state, for setstate()"""
+    values = RNG.unpack_from(data, pos)
+    gauss = values[-1] if values[-2] else None
+    return (3, values[:-2], gauss), pos + RNG.size
+
+def write_player(parts: List[bytes], player: PlayerState, snapshot: PlayerSnapshot) -> None:
+    write_str(parts, player.id)
+    write_str(parts, player.name)
+    parts.append(PLAYER.pack(snapshot.score, snapshot.bankroll))
+    write_cards(parts, snapshot.hand)
+
+def read_player(data: bytes, pos: int) -> Tuple[PlayerState, PlayerSnapshot, int]:
+    """A new player and the snapshot to restore it to"""
+    player_id, pos = read_str(data, pos)
+    name, pos = read_str(data, pos)
+    score, bankroll = PLAYER.unpack_from(data, pos)
+    hand, pos = read_cards(data, pos + PLAYER.size)
+    return PlayerState(player_id, name), PlayerSnapshot(tuple(hand), score, bankroll), pos
+
+def _write_deck(parts: List[bytes], deck: Deck, snapshot: DeckSnapshot) -> None:
+    kind = _DECK_KINDS.get(type(deck))
+    if kind is None:
+        raise ValueError(f"Cannot encode a {type(deck).__name__}")
+    if kind == SHOE:
+        snapshot = snapshot.deck
+    parts.append(DECK.pack(kind, deck.penetration, snapshot.next, snapshot.cut))
+    write_str(parts, deck.id)
+    write_cards(parts, snapshot.cards)
+    write_cards(parts, snapshot.discard_pile)
+    write_rng_state(parts, snapshot.rng_state)
+    if kind == SHOE:
+        parts.append(COUNT_TAGS.pack(*deck.count_tags))
+
+def _read_deck(data: bytes, pos: int) -> Tuple[Deck, DeckSnapshot, int]:
+    kind, penetration, next_card, cut = DECK.unpack_from(data, pos)
+    pos += DECK.size
+    deck_id, pos = read_str(data, pos)
+    cards, pos = read_cards(data, pos)
+    discards, pos = read_cards(data, pos)
+    rng_state, pos = read_rng_state(data, pos)
+    snapshot = DeckSnapshot(cards, next_card, cut, discards, rng_state)
+    if kind != SHOE:
+        return Deck(deck_id, None, penetration, random.Random(0)), snapshot, pos
+
+    tags = COUNT_TAGS.unpack_from(data, pos)
+    pos += COUNT_TAGS.size
+    # The count and histogram follow from the undealt cards
+    rank_counts = [0] * 13
+    running_count = 0
+    for card in cards[next_card:]:
+        rank_counts[card.rank - 1] += 1
+        running_count -= tags[card.rank - 1]
+    shoe = Shoe(deck_id, None, penetration, random.Random(0), tags)
+    return shoe, ShoeSnapshot(snapshot, running_count, tuple(rank_counts)), pos
+
+def write_game_state(parts: List[bytes], state: GameState) -> None:
+    """Append the encoding of a GameState (without STATE_HEADER) to parts"""
+    snapshot = state.snapshot()
+    parts.append(STATE.pack(PHASE_CODES[snapshot.phase], snapshot.current_player_index,
+                            len(snapshot.players), len(snapshot.decks)))
+    for player, player_state in zip(snapshot.players, snapshot.player_states):
+        write_player(parts, player, player_state)
+    for deck, deck_snapshot in snapshot.decks:
+        _write_deck(parts, deck, deck_snapshot)
+
+def read_game_state(data: bytes, pos: int) -> Tuple[GameState, int]:
+    """Decode a GameState written by write_game_state; returns it and the position after it"""
+    phase, current, num_players, num_decks = STATE.unpack_from(data, pos)
+    pos += STATE.size
+    players = []
+    player_states = []
+    for _ in range(num_players):
+        player, player_state, pos = read_player(data, pos)
+        players.append(player)
+        player_states.append(player_state)
+    decks = []
+    for _ in range(num_decks):
+        deck, deck_snapshot, pos = _read_deck(data, pos)
+        decks.append((deck, deck_snapshot))
+    state = GameState()
+    state.restore(GameSnapshot(tuple(players), tuple(player_states), current, PHASES[phase], tuple(decks)))
+    return state, pos
+
+def encode_game_state(state: GameState) -> bytes:
+    """Players, hands, bankrolls, decks with their discard piles and generators, and the phase"""
+    parts = [STATE_HEADER.pack(MAGIC, VERSION)]
+    write_game_state(parts, state)
+    return b''.join(parts)
+
+def decode_game_state(data: bytes) -> GameState:
+    magic, version = STATE_HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} game state")
+    return read_game_state(data, STATE_HEADER.size)[0]
@@ -0,0 +1,396 @@
+import argparse
+import asyncio
+import json
+import logging
+import signal
+from typing import Any, Dict, List, Optional, Sequence, Set
+from src.games.autoplay import GAME_TYPES
+from src.games.session import GameSession, new_session
+from src.models.card import Card, decode_cards
+from src.models.events import EventSink, GameEvent, GameEventType
+from src.models.player_action import PlayerAction, PlayerActionType
+from src.models.player_state import PlayerState
+
+logger = logging.getLogger(__name__)
+
+# Clients speak newline-delimited JSON. They send
+#   {"type": "join", "table": id, "game": "poker", "players": 4, "humans": 1}
+#   {"type": "action", "action": "raise", "amount": 50, "cards": [card codes]}
+#   {"type": "leave"}
+# and receive "joined", "turn", "event", "error", "game_over" and
+# "table_closed" messages. A join opens the table if it doesn't exist yet,
+# with the first `humans` seats held for clients and the AI on the rest;
+# play starts once every human seat is taken. The Blackjack dealer's hole
+# card is sent face down; ROUND_ENDED shows the dealer's whole hand.
+DEFAULT_PORT = 7777
+ACTION_TIMEOUT = 30.0
+OUTBOX_SIZE = 256  # Messages queued per client before it counts as too slow and is dropped
+MAX_LINE = 1 << 16
+BACKLOG = 4096  # Pending connections; thousands of clients may arrive at once
+DEFAULT_ROUNDS = 100
+CLOSE_TIMEOUT = 5.0
+# Equity rollouts per Poker AI decision. AI turns run on the event loop, so
+# the offline default of 1000 would hold every other table up for ~6 ms a turn
+SERVER_AI_SAMPLES = 100
+
+def _jsonable(value: Any) -> Any:
+    """Event details with cards as codes and players as ids"""
+    if isinstance(value, Card):
+        return value.code
+    if isinstance(value, PlayerState):
+        return value.id
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    try:
+        return [_jsonable(item) for item in value]  # Lists, tuples and hands
+    except TypeError:
+        return str(value)
+
+def event_message(event: GameEvent, viewer: Optional[str]) -> dict:
+    """A game event as one seat may see it: cards dealt or drawn blind to other seats,
+    the dealer's hole card and the hand that wins a pot uncontested are hidden"""
+    if event.player is None:
+        hidden = event.details.get('hole', False)
+    else:
+        hidden = event.player.id != viewer and (
+            event.event_type == GameEventType.CARDS_DEALT
+            or event.event_type == GameEventType.ROUND_WON and not event.details.get('showdown', True)
+            or event.action is not None and event.action.action_type == PlayerActionType.DRAW_DECK)
+    return {
+        'type': 'event',
+        'event': event.event_type,
+        'player': event.player.id if event.player else None,
+        'action': event.action.action_type if event.action else None,
+        'cards': [None] * len(event.cards) if hidden else [card.code for card in event.cards],
+        'amount': event.amount,
+        'details': {} if hidden and event.player is not None else _jsonable(event.details),
+    }
+
+def parse_action(message: dict) -> PlayerAction:
+    codes = message.get('cards', [])
+    if not all(isinstance(code, int) and 0 <= code < 52 for code in codes):
+        raise ValueError("Cards are codes 0-51")
+    return PlayerAction(str(message['action']), decode_cards(codes), int(message.get('amount', 0)))
+
+class Connection(EventSink):
+    """One client. Messages go through a bounded outbox drained by the connection's own writer task,
+    so a slow client never stalls its table; one that falls OUTBOX_SIZE messages behind is dropped.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, outbox_size: int = OUTBOX_SIZE):
+        self.reader = reader
+        self.writer = writer
+        self.outbox: asyncio.Queue = asyncio.Queue(outbox_size)
+        self.table: Optional['Table'] = None
+        self.seat: Optional[str] = None
+        self.closed = False
+        self._drain_task = asyncio.create_task(self._drain())
+
+    def send(self, message: dict) -> None:
+        if self.closed:
+            return
+        try:
+            self.outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            self.closed = True
+            self._drain_task.cancel()
+
+    def handle_event(self, event: GameEvent) -> None:
+        self.send(event_message(event, self.seat))
+
+    async def _drain(self) -> None:
+        try:
+            while True:
+                message = await self.outbox.get()
+                if message is None:
+                    break
+                self.writer.write(json.dumps(message).encode() + b'\n')
+                await self.writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.writer.close()
+
+    def close(self) -> None:
+        """Stop taking messages; those already queued are still sent"""
+        if not self.closed:
+            self.closed = True
+            try:
+                self.outbox.put_nowait(None)
+            except asyncio.QueueFull:
+                self._drain_task.cancel()
+
+    async def wait_closed(self) -> None:
+        await asyncio.wait([self._drain_task])
+
+class _OpeningEvents(EventSink):
+    """Keeps what a game emits as it is set up, before any client can be subscribed"""
+
+    def __init__(self):
+        self.events: List[GameEvent] = []
+
+    def handle_event(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+class Table:
+    """One game session played out by a task on the event loop.
+
+    AI turns run inline, yielding to the loop after each one, so each must
+    stay short (see SERVER_AI_SAMPLES). When an external seat is to act, the
+    table waits up to action_timeout for its client, then plays the
+    session's timeout action; seats nobody holds any more time out at once.
+    Clients are sent the opening events (the first deal) when they join.
+    """
+
+    def __init__(self, table_id: str, session: GameSession, action_timeout: float = ACTION_TIMEOUT,
+                 opening: Sequence[GameEvent] = ()):
+        self.id = table_id
+        self.session = session
+        self.action_timeout = action_timeout
+        self.opening = list(opening)
+        self.seats: Dict[str, Optional[Connection]] = {seat: None for seat in sorted(session.external)}
+        self.closed = False
+        self.task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+        self._pending: Optional[asyncio.Future] = None
+        self._pending_seat: Optional[str] = None
+
+    @property
+    def connections(self) -> List[Connection]:
+        return [connection for connection in self.seats.values() if connection is not None]
+
+    def join(self, connection: Connection) -> str:
+        """Seat a client in the first free human seat"""
+        if self._ready.is_set():
+            raise ValueError(f"Table {self.id} has already started")
+        seat = next((seat for seat, holder in self.seats.items() if holder is None), None)
+        if seat is None:
+            raise ValueError(f"Table {self.id} is full")
+        self.seats[seat] = connection
+        connection.table = self
+        connection.seat = seat
+        self.session.game.subscribe(connection)
+        if all(self.seats.values()):
+            self._ready.set()
+        return seat
+
+    def leave(self, connection: Connection) -> None:
+        """Free a client's seat; from then on it plays timeout actions. The table closes when nobody is left."""
+        if self.seats.get(connection.seat) is not connection:
+            return
+        self.seats[connection.seat] = None
+        self.session.game.unsubscribe(connection)
+        if self._pending_seat == connection.seat and not self._pending.done():
+            self._pending.set_result(None)
+        connection.table = None
+        connection.seat = None
+        if not self.connections:
+            self.close("Everyone left")
+
+    def submit(self, seat: str, action: PlayerAction) -> None:
+        if self._pending is None or self._pending_seat != seat or self._pending.done():
+            raise ValueError("Not your turn")
+        self._pending.set_result(action)
+
+    def broadcast(self, message: dict) -> None:
+        for connection in self.connections:
+            connection.send(message)
+
+    async def run(self) -> None:
+        await self._ready.wait()
+        session = self.session
+        loop = asyncio.get_running_loop()
+        while not session.over:
+            if not session.awaiting_action:
+                session.step()
+                await asyncio.sleep(0)  # Let other tables and clients in between AI turns
+                continue
+
+            seat = session.to_act.id
+            connection = self.seats[seat]
+            action = None
+            if connection is not None:
+                self._pending = loop.create_future()
+                self._pending_seat = seat
+                connection.send({'type': 'turn', 'seat': seat, 'timeout': self.action_timeout})
+                try:
+                    action = await asyncio.wait_for(self._pending, self.action_timeout)
+                except asyncio.TimeoutError:
+                    connection.send({'type': 'error', 'message': "Out of time"})
+                finally:
+                    self._pending = None
+                    self._pending_seat = None
+            if action is None or action.action_type == PlayerActionType.QUIT:
+                # One seat quitting shouldn't end everyone else's game
+                action = session.timeout_action()
+            try:
+                session.step(action)
+            except ValueError as e:
+                if connection is not None:
+                    connection.send({'type': 'error', 'message': str(e)})
+
+        winner = session.winner.id if session.winner else None
+        self.broadcast({'type': 'game_over', 'winner': winner, 'rounds': session.rounds})
+        self.close("Game over")
+
+    def close(self, reason: str) -> None:
+        """Stop the game and release every client; safe to call more than once"""
+        if self.closed:
+            return
+        self.closed = True
+        self.broadcast({'type': 'table_closed', 'table': self.id, 'reason': reason})
+        for seat, connection in self.seats.items():
+            if connection is not None:
+                self.session.game.unsubscribe(connection)
+                connection.table = None
+                connection.seat = None
+                self.seats[seat] = None
+        if self.task is not None and self.task is not asyncio.current_task():
+            self.task.cancel()
+
+class GameServer:
+    """Hosts any number of tables on one event loop, reached over TCP or a Unix socket"""
+
+    def __init__(self, action_timeout: float = ACTION_TIMEOUT, max_rounds: int = DEFAULT_ROUNDS,
+                 outbox_size: int = OUTBOX_SIZE, ai_max_samples: int = SERVER_AI_SAMPLES):
+        self.action_timeout = action_timeout
+        self.max_rounds = max_rounds
+        self.outbox_size = outbox_size
+        self.ai_max_samples = ai_max_samples
+        self.tables: Dict[str, Table] = {}
+        self._connections: Set[Connection] = set()
+        self._servers: List[asyncio.AbstractServer] = []
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT) -> None:
+        self._servers.append(await asyncio.start_server(self._serve, host, port, limit=MAX_LINE,
+                                                                backlog=BACKLOG))
+
+    async def start_unix(self, path: str) -> None:
+        self._servers.append(await asyncio.start_unix_server(self._serve, path, limit=MAX_LINE,
+                                                                     backlog=BACKLOG))
+
+    def open_table(self, table_id: str, game_type: str, num_players: int, humans: int = 1,
+                   seed: Optional[int] = None, **config) -> Table:
+        if table_id in self.tables:
+            raise ValueError(f"Table {table_id} already exists")
+        if not 1 <= humans <= num_players:
+            raise ValueError("A table needs between 1 and all of its players human")
+        if game_type == 'poker':
+            config.setdefault('ai_max_samples', self.ai_max_samples)
+        opening = _OpeningEvents()
+        session = new_session(game_type, num_players, self.max_rounds, seed,
+                              external=[f'p{i}' for i in range(humans)], sinks=[opening], **config)
+        session.game.unsubscribe(opening)
+        table = Table(table_id, session, self.action_timeout, opening.events)
+        self.tables[table_id] = table
+        table.task = asyncio.create_task(self._run_table(table))
+        return table
+
+    async def _run_table(self, table: Table) -> None:
+        try:
+            await table.run()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.exception("Table %s failed", table.id)
+            table.close(f"Table failed: {type(e).__name__}: {e}")
+        finally:
+            table.close("Table stopped")
+            self.tables.pop(table.id, None)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = Connection(reader, writer, self.outbox_size)
+        self._connections.add(connection)
+        try:
+            while not connection.closed:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break  # Line over MAX_LINE, or the client went away
+                if not line:
+                    break
+                try:
+                    self._dispatch(connection, json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    connection.send({'type': 'error', 'message': str(e)})
+        finally:
+            if connection.table is not None:
+                connection.table.leave(connection)
+            connection.close()
+            self._connections.discard(connection)
+
+    def _dispatch(self, connection: Connection, message: dict) -> None:
+        kind = message.get('type')
+        if kind == 'join':
+            if connection.table is not None:
+                raise ValueError("Already seated")
+            table = self.tables.get(message['table'])
+            if table is None:
+                if message.get('game') not in GAME_TYPES:
+                    raise ValueError(f"game must be one of {', '.join(GAME_TYPES)}")
+                config = {'initial_bankroll': int(message['bankroll'])} if 'bankroll' in message else {}
+                seed = int(message['seed']) if message.get('seed') is not None else None
+                table = self.open_table(str(message['table']), message['game'], int(message.get('players', 2)),
+                                        int(message.get('humans', 1)), seed, **config)
+            seat = table.join(connection)
+            connection.send({'type': 'joined', 'table': table.id, 'game': table.session.game_type, 'seat': seat})
+            for event in table.opening:
+                connection.handle_event(event)
+        elif kind == 'action':
+            if connection.table is None:
+                raise ValueError("Not seated")
+            connection.table.submit(connection.seat, parse_action(message))
+        elif kind == 'leave':
+            if connection.table is not None:
+                connection.table.leave(connection)
+        else:
+            raise ValueError(f"Unknown message type {kind!r}")
+
+    async def close(self, reason: str = "Server shutting down") -> None:
+        """Stop accepting clients, close every table and flush what each client is owed"""
+        for server in self._servers:
+            server.close()
+        tables = list(self.tables.values())
+        for table in tables:
+            table.close(reason)
+        if tables:
+            await asyncio.gather(*(table.task for table in tables), return_exceptions=True)
+        connections = list(self._connections)
+        for connection in connections:
+            connection.close()
+        if connections:
+            await asyncio.wait([asyncio.ensure_future(c.wait_closed()) for c in connections], timeout=CLOSE_TIMEOUT)
+        for server in self._servers:
+            await server.wait_closed()
+
+async def serve(host: str, port: int, unix_path: Optional[str], action_timeout: float, max_rounds: int,
+                ai_max_samples: int) -> None:
+    server = GameServer(action_timeout, max_rounds, ai_max_samples=ai_max_samples)
+    if unix_path:
+        await server.start_unix(unix_path)
+    else:
+        await server.start_tcp(host, port)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await stop.wait()
+    await server.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve Poker, Blackjack and Rummy tables to network clients")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', help="listen on this Unix socket path instead of TCP")
+    parser.add_argument('--timeout', type=float, default=ACTION_TIMEOUT, help="seconds a seat has to act")
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help="rounds per table")
+    parser.add_argument('--ai-samples', type=int, default=SERVER_AI_SAMPLES,
+                        help="equity rollouts per Poker AI decision")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    asyncio.run(serve(args.host, args.port, args.unix, args.timeout, args.rounds, args.ai_samples))
+
+if __name__ == "__main__":
+    main()
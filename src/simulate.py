@@ -0,0 +1,152 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict
+from typing import Dict, Iterator, List, Optional, Set
+from src.games.autoplay import GAME_TYPES, GameResult, play_game
+from src.models.hand_history import HandHistoryWriter, default_history_path
+from src.models.rng import derive_seed, new_seed
+
+def run_chunk(game_type: str, start: int, count: int, root_seed: int,
+              num_players: int, max_rounds: int, history_dir: Optional[str] = None) -> List[GameResult]:
+    """Play games start..start+count-1; each game's seed depends only on its index.
+
+    With history_dir, the chunk's games are logged to their own file there.
+    """
+    history = None
+    if history_dir:
+        history = HandHistoryWriter(default_history_path(history_dir, f"{game_type}-{root_seed}-{start:09d}"))
+    try:
+        return [play_game(game_type, index, derive_seed(root_seed, game_type, index),
+                          num_players, max_rounds, history)
+                for index in range(start, start + count)]
+    finally:
+        if history:
+            history.close()
+
+def simulate(game_type: str, games: int, num_players: int, max_rounds: int, root_seed: int,
+             processes: Optional[int] = None, chunk_size: int = 25,
+             history_dir: Optional[str] = None) -> Iterator[GameResult]:
+    """Play games across a process pool, yielding results as chunks finish.
+
+    Results arrive in completion order, but a given root seed always plays
+    the same games however the work is split.
+    """
+    args = (root_seed, num_players, max_rounds, history_dir)
+    chunks = ((start, min(chunk_size, games - start)) for start in range(0, games, chunk_size))
+    if processes == 0:
+        for start, count in chunks:
+            yield from run_chunk(game_type, start, count, *args)
+        return
+
+    workers = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep a couple of chunks queued per worker rather than the whole run
+        in_flight: Set[Future] = set()
+        for start, count in chunks:
+            in_flight.add(pool.submit(run_chunk, game_type, start, count, *args))
+            if len(in_flight) >= 2 * workers:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield from future.result()
+        for future in in_flight:
+            yield from future.result()
+
+class SimulationSummary:
+    """Running totals over streamed game results"""
+
+    def __init__(self):
+        self.games = 0
+        self.rounds = 0
+        self.turns = 0
+        self.game_wins: Dict[str, int] = {}
+        self.round_wins: Dict[str, int] = {}
+        # Per round index: number of games that reached it and the summed value per seat
+        self._trajectory_counts: List[int] = []
+        self._trajectory_sums: List[List[int]] = []
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.rounds += result.rounds
+        self.turns += result.turns
+        if result.winner:
+            self.game_wins[result.winner] = self.game_wins.get(result.winner, 0) + 1
+        for player_id, wins in result.round_wins.items():
+            self.round_wins[player_id] = self.round_wins.get(player_id, 0) + wins
+        for i, values in enumerate(result.trajectory):
+            if i == len(self._trajectory_counts):
+                self._trajectory_counts.append(0)
+                self._trajectory_sums.append([0] * len(values))
+            self._trajectory_counts[i] += 1
+            sums = self._trajectory_sums[i]
+            for seat, value in enumerate(values):
+                sums[seat] += value
+
+    def mean_trajectory(self) -> List[List[float]]:
+        """Average bankroll (or score) per seat after each round, over the games that reached it"""
+        return [[total / count for total in sums]
+                for count, sums in zip(self._trajectory_counts, self._trajectory_sums)]
+
+    def to_dict(self) -> dict:
+        games = self.games or 1
+        rounds = self.rounds or 1
+        return {
+            'games': self.games,
+            'hands': self.rounds,
+            'turns': self.turns,
+            'hands_per_game': self.rounds / games,
+            'game_win_rate': {pid: wins / games for pid, wins in sorted(self.game_wins.items())},
+            'hand_win_rate': {pid: wins / rounds for pid, wins in sorted(self.round_wins.items())},
+            'mean_trajectory': self.mean_trajectory(),
+        }
+
+def _report_progress(done: int, total: int, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    rate = done / elapsed if elapsed > 0 else 0.0
+    sys.stderr.write(f"\r{done}/{total} games ({rate:.1f}/s)")
+    if done == total:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run AI-only games in parallel and aggregate the results")
+    parser.add_argument('game', choices=GAME_TYPES)
+    parser.add_argument('-n', '--games', type=int, default=100)
+    parser.add_argument('-p', '--players', type=int, default=4)
+    parser.add_argument('--rounds', type=int, default=100, help="Maximum hands per game")
+    parser.add_argument('--seed', type=int, default=None, help="Root seed; random if omitted")
+    parser.add_argument('--processes', type=int, default=None, help="Worker processes; 0 runs inline")
+    parser.add_argument('--chunk-size', type=int, default=25, help="Games per work item")
+    parser.add_argument('--results', default=None, help="Stream each game's result to this JSON lines file")
+    parser.add_argument('--history', default=None, help="Directory to write binary hand histories to")
+    parser.add_argument('--quiet', action='store_true', help="No progress on stderr")
+    args = parser.parse_args(argv)
+
+    root_seed = new_seed() if args.seed is None else args.seed
+    summary = SimulationSummary()
+    started = last_report = time.perf_counter()
+    results_file = open(args.results, 'w') if args.results else None
+    try:
+        for result in simulate(args.game, args.games, args.players, args.rounds, root_seed,
+                               args.processes, args.chunk_size, args.history):
+            summary.add(result)
+            if results_file:
+                results_file.write(json.dumps(asdict(result)) + "\n")
+            if not args.quiet and (time.perf_counter() - last_report >= 0.5 or summary.games == args.games):
+                _report_progress(summary.games, args.games, started)
+                last_report = time.perf_counter()
+    finally:
+        if results_file:
+            results_file.close()
+
+    report = summary.to_dict()
+    report['game'] = args.game
+    report['seed'] = root_seed
+    report['seconds'] = round(time.perf_counter() - started, 3)
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
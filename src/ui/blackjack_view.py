@@ -30,7 +30,7 @@ class BlackjackView(GameView):
     def draw_player_hand(self, player: PlayerState, hand_value: int) -> None:
         """Draw player's hand"""
         self.ui.draw_text(f"{player.name}'s Hand (Value: {hand_value}):", (50, 300))
-        for i, card in enumerate(player.get_hand()):
+        for i, card in enumerate(player.hand):
             self.ui.draw_card(card, (50 + i * 80, 350))
             
     def draw(self, game_state: dict) -> None:
@@ -47,6 +47,7 @@ class BlackjackView(GameView):
         for text, rect in self.buttons.items():
             self.ui.draw_button(text.capitalize(), rect)
             
+        self.draw_messages()
         pygame.display.flip()
         
     def handle_click(self, pos: tuple) -> Optional[PlayerAction]:
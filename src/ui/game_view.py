@@ -1,15 +1,30 @@
 import pygame
+from collections import deque
 from typing import Optional, List, Dict
 from .pygame_ui import PygameUI
 from ..models.card import Card
 from ..models.player_state import PlayerState
 from ..models.player_action import PlayerAction
+from ..models.events import EventSink, GameEvent
+from .terminal_ui import TerminalUI
 
-class GameView:
+class GameView(EventSink):
     def __init__(self, ui: PygameUI):
         self.ui = ui
         self.running = True
         self.clock = pygame.time.Clock()
+        self.messages: deque = deque(maxlen=4)
+
+    def handle_event(self, event: GameEvent) -> None:
+        """Keep the latest game events for the message log"""
+        text = TerminalUI.format_event(event)
+        if text:
+            self.messages.append(text.strip())
+
+    def draw_messages(self) -> None:
+        """Draw the most recent game events"""
+        for i, text in enumerate(self.messages):
+            self.ui.draw_text(text, (620, 50 + i * 40))
         
     def handle_events(self) -> Optional[PlayerAction]:
         """Handle pygame events"""
@@ -28,6 +43,7 @@ class GameView:
     def draw(self, game_state: dict) -> None:
         """Draw the game state"""
         self.ui.screen.fill(PygameUI.GREEN)
+        self.draw_messages()
         pygame.display.flip()
         
     def run_frame(self, game_state: dict) -> Optional[PlayerAction]:
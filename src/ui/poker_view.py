@@ -48,7 +48,7 @@ class PokerView(GameView):
         
         # Draw player's hand
         self.ui.draw_text("Your Hand:", (50, 500))
-        self.draw_player_hand(game_state['player'].get_hand(), (50, 550))
+        self.draw_player_hand(game_state['player'].hand, (50, 550))
         
         # Draw current bet
         self.ui.draw_text(f"Current Bet: ${game_state['current_bet']}", (50, 450))
@@ -60,6 +60,7 @@ class PokerView(GameView):
         if self.showing_raise_input:
             self.ui.draw_text(f"Raise Amount: ${self.raise_amount}", (400, 650))
             
+        self.draw_messages()
         pygame.display.flip()
         
     def handle_click(self, pos: tuple) -> Optional[PlayerAction]:
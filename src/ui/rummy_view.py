@@ -40,7 +40,7 @@ class RummyView(GameView):
         self.ui.draw_text(f"{player.name}'s Hand:", (50, 300))
         self.card_rects.clear()
         
-        for i, card in enumerate(player.get_hand()):
+        for i, card in enumerate(player.hand):
             pos = (50 + i * 80, 350)
             rect = pygame.Rect(pos[0], pos[1], 71, 96)  # Standard card size
             self.card_rects[card.id] = rect
@@ -69,6 +69,7 @@ class RummyView(GameView):
             button_text = text.replace('_', ' ').capitalize()
             self.ui.draw_button(button_text, rect)
             
+        self.draw_messages()
         pygame.display.flip()
         
     def handle_click(self, pos: tuple) -> Optional[PlayerAction]:
@@ -76,7 +77,7 @@ class RummyView(GameView):
         # Check card clicks for selection
         for card_id, rect in self.card_rects.items():
             if rect.collidepoint(pos):
-                card = next((c for c in self.game_state['player'].get_hand() if c.id == card_id), None)
+                card = next((c for c in self.game_state['player'].hand if c.id == card_id), None)
                 if card:
                     if card in self.selected_cards:
                         self.selected_cards.remove(card)
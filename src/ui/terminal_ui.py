@@ -2,6 +2,21 @@ from typing import List, Optional
 from ..models.card import Card
 from ..models.player_action import PlayerAction, PlayerActionType
 from ..models.player_state import PlayerState
+from ..models.events import EventSink, GameEvent, GameEventType
+
+# One-line descriptions of player actions, filled in with the event
+_ACTION_TEXT = {
+    PlayerActionType.FOLD: "{name} folds",
+    PlayerActionType.CALL: "{name} calls ${amount}",
+    PlayerActionType.RAISE: "{name} raises to ${amount}",
+    PlayerActionType.HIT: "{name} hits",
+    PlayerActionType.STAND: "{name} stands",
+    PlayerActionType.DRAW_DECK: "{name} draws from the deck",
+    PlayerActionType.DRAW_DISCARD: "{name} takes the top discard",
+    PlayerActionType.DISCARD: "{name} discards {card}",
+    PlayerActionType.DECLARE_SET: "Valid set!",
+    PlayerActionType.DECLARE_RUN: "Valid run!",
+}
 
 class TerminalUI:
     @staticmethod
@@ -18,7 +33,7 @@ class TerminalUI:
         print("Community cards:", end=" ")
         TerminalUI.display_cards(community_cards)
         print("\nYour hand:", end=" ")
-        TerminalUI.display_cards(player.get_hand())
+        TerminalUI.display_cards(player.hand)
         print(f"Your score: ${player.get_score()}")
         
     @staticmethod
@@ -32,7 +47,7 @@ class TerminalUI:
         else:
             TerminalUI.display_cards(dealer_hand)
         print("\nYour hand:", end=" ")
-        TerminalUI.display_cards(player.get_hand())
+        TerminalUI.display_cards(player.hand)
         
     @staticmethod
     def display_rummy_state(player: PlayerState, discard_pile: List[Card]) -> None:
@@ -41,7 +56,7 @@ class TerminalUI:
         if discard_pile:
             TerminalUI.display_cards([discard_pile[-1]])
         print("\nYour hand:", end=" ")
-        TerminalUI.display_cards(player.get_hand())
+        TerminalUI.display_cards(player.hand)
         
     @staticmethod
     def get_poker_action() -> PlayerAction:
@@ -169,7 +184,7 @@ class TerminalUI:
     def display_winner(winner: PlayerState, game_type: str, **kwargs) -> None:
         print(f"\n{winner.name} wins!")
         print(f"Winning hand:", end=" ")
-        TerminalUI.display_cards(winner.get_hand())
+        TerminalUI.display_cards(winner.hand)
         
         if game_type == "Poker":
             print(f"Community cards:", end=" ")
@@ -179,4 +194,45 @@ class TerminalUI:
         elif game_type == "Blackjack":
             print(f"Dealer's hand:", end=" ")
             TerminalUI.display_cards(kwargs.get('dealer_hand', []))
-            print(f"Hand value: {kwargs.get('hand_value', 0)}") 
\ No newline at end of file
+            print(f"Hand value: {kwargs.get('hand_value', 0)}")
+
+    @staticmethod
+    def format_event(event: GameEvent) -> Optional[str]:
+        """One-line description of a game event, or None for events shown elsewhere"""
+        name = event.player.name if event.player else ""
+        if event.event_type == GameEventType.PLAYER_ACTED:
+            text = _ACTION_TEXT.get(event.action.action_type)
+            card = event.cards[0].name if event.cards else ""
+            return text.format(name=name, amount=event.amount, card=card) if text else None
+        if event.event_type == GameEventType.ACTION_REJECTED:
+            return event.details.get('reason')
+        if event.event_type == GameEventType.PLAYER_BUSTED:
+            return "Bust!"
+        if event.event_type == GameEventType.PLAYER_ELIMINATED:
+            return f"{name} is eliminated due to insufficient funds!"
+        if event.event_type == GameEventType.CARDS_DEALT and event.details.get('target') == 'board':
+            return f"\nDealing the {event.details.get('stage')}:"
+        if event.event_type == GameEventType.ROUND_STARTED and event.details.get('round', 1) > 1:
+            return "\nStarting new round..."
+        if event.event_type == GameEventType.ROUND_WON:
+            return f"\n{name} wins!"
+        if event.event_type == GameEventType.GAME_OVER:
+            return f"\nGame Over! {name} wins with ${event.amount}!"
+        return None
+
+    @staticmethod
+    def display_event(event: GameEvent) -> None:
+        if event.event_type == GameEventType.ROUND_WON:
+            TerminalUI.display_winner(event.player, event.game_type, **event.details)
+            return
+        text = TerminalUI.format_event(event)
+        if text is not None:
+            print(text)
+            if event.event_type == GameEventType.CARDS_DEALT:
+                TerminalUI.display_cards(event.details.get('board', event.cards))
+
+class TerminalEventSink(EventSink):
+    """Prints game events to the console"""
+
+    def handle_event(self, event: GameEvent) -> None:
+        TerminalUI.display_event(event)
@@ -0,0 +1,42 @@
+import pytest
+from src.games.blackjack_hand import BlackjackHand
+from src.games.session import new_session
+from src.models.card import STANDARD_CARDS
+
+def hand(*ranks):
+    return BlackjackHand(STANDARD_CARDS[rank - 1] for rank in ranks)
+
+@pytest.mark.parametrize('ranks, value, soft', [
+    ((10, 7), 17, False),
+    ((1, 6), 17, True),
+    ((1, 6, 10), 17, False),   # The ace drops back to 1
+    ((1, 1), 12, True),        # Only one ace counts as 11
+    ((1, 1, 9), 21, True),
+    ((13, 12), 20, False),     # Face cards count 10
+    ((), 0, False),
+])
+def test_totals(ranks, value, soft):
+    cards = hand(*ranks)
+    assert (cards.value, cards.soft) == (value, soft)
+
+def test_bust_and_blackjack():
+    assert hand(10, 6, 8).is_bust and not hand(1, 10, 10).is_bust
+    assert hand(1, 13).is_blackjack
+    assert not hand(7, 7, 7).is_blackjack and hand(7, 7, 7).value == 21
+
+def test_behaves_like_a_list():
+    cards = hand(2, 3)
+    cards.append(STANDARD_CARDS[4])
+    assert len(cards) == 3 and cards[-1] is STANDARD_CARDS[4] and list(cards) == [STANDARD_CARDS[1], STANDARD_CARDS[2], STANDARD_CARDS[4]]
+    assert cards.value == 10
+    cards.clear()
+    assert not cards and cards.value == 0
+
+def test_game_totals_match_the_cards_held():
+    session = new_session('blackjack', 4, 8, seed=6)
+    game = session.game
+    while not session.over:
+        session.step()
+        for player in game.game_state.players:
+            assert game.hands[player.id].value == hand(*(card.rank for card in player.hand)).value
+            assert list(game.hands[player.id]) == player.get_hand()
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from src.games.blackjack_sim import BlackjackSimulator, threshold_table
+from src.games.dealer_odds import NUM_CATEGORIES
+
+TENS = [0] * (NUM_CATEGORIES - 1) + [40]
+
+def test_every_hand_has_one_outcome():
+    stats = BlackjackSimulator(num_players=3, seed=1, batch_size=3000).play(10000)
+    assert stats.rounds == 10000
+    assert (stats.wins + stats.losses + stats.pushes == 10000).all()
+    assert (stats.margin > 0).all() and (stats.margin < 0.03).all()
+
+def test_seeded_runs_repeat():
+    first = BlackjackSimulator(num_players=2, seed=4).play(5000)
+    second = BlackjackSimulator(num_players=2, seed=4).play(5000)
+    assert (first.wins == second.wins).all() and (first.losses == second.losses).all()
+
+def test_strategy_beats_mimicking_the_dealer():
+    strategy = BlackjackSimulator(seed=2).play(200000)
+    mimic = BlackjackSimulator(seed=2, hit_table=threshold_table()).play(200000)
+    assert strategy.house_edge < mimic.house_edge
+    assert 0.0 < strategy.house_edge < 0.1
+
+def test_a_shoe_of_tens_always_pushes():
+    stats = BlackjackSimulator(num_players=2, seed=3).play(100, composition=TENS)
+    assert (stats.pushes == 100).all() and stats.house_edge == 0.0
+
+def test_a_shoe_too_small_for_a_round_is_rejected():
+    with pytest.raises(ValueError):
+        BlackjackSimulator(num_players=2, seed=3).play(1, composition=[0] * (NUM_CATEGORIES - 1) + [5])
+
+def test_bad_arguments_are_rejected():
+    with pytest.raises(ValueError):
+        BlackjackSimulator(num_players=8)
+    with pytest.raises(ValueError):
+        BlackjackSimulator(hit_table=np.zeros((2, 10, NUM_CATEGORIES), dtype=bool))
+    simulator = BlackjackSimulator(seed=1)
+    with pytest.raises(ValueError):
+        simulator.play(10, composition=[4] * (NUM_CATEGORIES - 1))
+    with pytest.raises(ValueError):
+        simulator.play(10, composition=[-1] + [4] * (NUM_CATEGORIES - 1))
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from src.games.blackjack_sim import BlackjackSimulator
+from src.games.blackjack_strategy import StrategyTable, get_strategy_table
+from src.games.dealer_odds import NUM_CATEGORIES
+
+ACE, TEN = 0, 9  # Up-card categories
+
+def _up(rank: int) -> int:
+    return ACE if rank == 11 else rank - 1
+
+@pytest.mark.parametrize('value, soft, up_rank, hit', [
+    (11, False, 10, True),
+    (12, False, 2, True),
+    (12, False, 4, False),
+    (16, False, 6, False),
+    (16, False, 7, True),
+    (16, False, 10, True),
+    (17, False, 11, False),
+    (17, True, 7, True),
+    (18, True, 2, False),
+    (18, True, 9, True),
+    (18, True, 10, True),
+    (19, True, 10, False),
+    (21, False, 10, False),
+])
+def test_basic_strategy(value, soft, up_rank, hit):
+    assert get_strategy_table().should_hit(value, soft, _up(up_rank)) == hit
+
+def test_busted_hands_never_hit():
+    assert not get_strategy_table().should_hit(25, False, TEN)
+
+def test_decisions_follow_the_shoe():
+    # From a shoe of nothing but tens, any hard 12 or more busts on the next card
+    tens = [0] * (NUM_CATEGORIES - 1) + [96]
+    table = StrategyTable.compute(composition=tens)
+    assert table.should_hit(11, False, TEN)
+    assert not any(table.should_hit(value, False, TEN) for value in range(12, 22))
+    assert not table.should_hit(11, False, ACE)  # No aces in the shoe, so no ace up-card row
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / 'strategy.bin')
+    table = StrategyTable.compute(decks=2)
+    table.save(path)
+    loaded = StrategyTable.load(path)
+    assert (loaded.decks, loaded.stands_on) == (2, table.stands_on)
+    assert (loaded.as_array() == table.as_array()).all()
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = tmp_path / 'strategy.bin'
+    get_strategy_table().save(str(path))
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        StrategyTable.load(str(path))
+
+def test_array_matches_lookups():
+    table = get_strategy_table()
+    array = table.as_array()
+    for soft in (False, True):
+        for value in range(4, 22):
+            for up_card in range(NUM_CATEGORIES):
+                assert array[int(soft), value, up_card] == table.should_hit(value, soft, up_card)
+
+def test_simulator_plays_the_strategy_by_default():
+    simulator = BlackjackSimulator(seed=1)
+    assert np.array_equal(simulator.hit_table, get_strategy_table().as_array())
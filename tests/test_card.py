@@ -0,0 +1,36 @@
+import copy
+import pickle
+from src.models.card import (NO_CODE, STANDARD_CARDS, SUITS, Card, decode_cards, encode_cards,
+                             standard_deck)
+
+def test_codes_follow_suit_and_rank():
+    for code, card in enumerate(STANDARD_CARDS):
+        assert card.code == code == SUITS.index(card.suit) * 13 + card.rank - 1
+        assert card.id == f"{card.suit}-{card.rank}"
+    assert STANDARD_CARDS[0].name == "Ace of Hearts" and STANDARD_CARDS[51].name == "King of Spades"
+
+def test_cards_built_by_hand_get_their_code():
+    assert Card('x', 'Queen of Clubs', 'Clubs', 12, 'standard').code == STANDARD_CARDS[37].code
+    assert Card('joker', 'Joker', 'None', 0, 'joker').code == NO_CODE
+
+def test_decks_share_the_interned_cards():
+    first, second = standard_deck(), standard_deck()
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+    assert Card.from_code(17) is STANDARD_CARDS[17]
+
+def test_copies_keep_the_shared_instance():
+    hand = [STANDARD_CARDS[3], STANDARD_CARDS[40]]
+    assert all(a is b for a, b in zip(pickle.loads(pickle.dumps(hand)), hand))
+    assert all(a is b for a, b in zip(copy.deepcopy(hand), hand))
+    clone = STANDARD_CARDS[3].clone()
+    clone.attributes['marked'] = True
+    assert clone is not STANDARD_CARDS[3] and not STANDARD_CARDS[3].attributes
+    # A changed copy is its own card when copied again
+    assert copy.deepcopy(clone) is not clone
+
+def test_byte_encoding_round_trip():
+    cards = [STANDARD_CARDS[code] for code in (0, 12, 13, 51)]
+    data = encode_cards(cards)
+    assert data == bytes([0, 12, 13, 51])
+    assert all(a is b for a, b in zip(decode_cards(data), cards))
@@ -0,0 +1,140 @@
+import hashlib
+import random
+import pytest
+from src.games.game_codec import GAME_HEADER, deserialize_game, serialize_game
+from src.games.session import new_session
+from src.models.card import Card, STANDARD_CARDS, standard_deck
+from src.models.deck import Deck
+from src.models.game_state import GamePhase, GameState
+from src.models.player_state import PlayerState
+from src.models.shoe import Shoe
+from src.models.state_codec import STATE_HEADER, decode_game_state, encode_game_state
+
+GAMES = [('poker', 6), ('blackjack', 5), ('rummy', 4)]
+JOKER = Card('joker', 'Joker', 'None', 0, 'joker')
+
+def _session(game_type, num_players, seed=11):
+    session = new_session(game_type, num_players, 10, seed=seed)
+    if game_type == 'poker':
+        session.game.ai_max_samples = 50  # Fewer equity rollouts keep the test fast
+    return session
+
+def _play_round(game) -> None:
+    """Give every seated player a turn, then finish the round the way the game does"""
+    for player in game.game_state.players:
+        game.play_turn(player)
+    if game.game_type == 'Blackjack':
+        game.play_dealer_turn()
+        game.check_win_condition()
+        game.new_round()
+    else:
+        game.check_win_condition()
+
+@pytest.mark.parametrize('game_type, num_players', GAMES)
+@pytest.mark.parametrize('turns', [0, 7, 23, 60])
+def test_decoded_game_plays_on_identically(game_type, num_players, turns):
+    session = _session(game_type, num_players)
+    session.run(max_turns=turns)
+    game = session.game
+    data = serialize_game(game)
+    copy = deserialize_game(data)
+    assert type(copy) is type(game) and copy.seed == game.seed
+    assert serialize_game(copy) == data
+    for _ in range(3):
+        _play_round(game)
+        _play_round(copy)
+        assert serialize_game(copy) == serialize_game(game)
+
+@pytest.mark.parametrize('game_type, num_players', GAMES)
+def test_decoded_game_has_the_attributes_of_a_new_one(game_type, num_players):
+    game = _session(game_type, num_players).game
+    copy = deserialize_game(serialize_game(game))
+    assert sorted(vars(copy)) == sorted(vars(game))
+    assert copy.game_config() == game.game_config()
+
+@pytest.mark.parametrize('seed', [-7, 2 ** 63, 2 ** 64 - 1, -(2 ** 100)])
+def test_any_seed_survives_a_round_trip(seed):
+    game = _session('blackjack', 2, seed=seed).game
+    copy = deserialize_game(serialize_game(game))
+    assert copy.seed == seed
+    assert serialize_game(copy) == serialize_game(game)
+
+def test_folded_poker_seats_survive_a_round_trip():
+    session = _session('poker', 6, seed=3)
+    checked = 0
+    while not session.over and checked < 5:
+        session.step()
+        game = session.game
+        if len(game.seats) > len(game.game_state.players):
+            copy = deserialize_game(serialize_game(game))
+            assert [p.id for p in copy.seats] == [p.id for p in game.seats]
+            assert [(p.bankroll, p.get_hand()) for p in copy.seats] == [(p.bankroll, p.get_hand()) for p in game.seats]
+            # Players still in the hand are the same objects in both places
+            assert all(any(p is seat for seat in copy.seats) for p in copy.game_state.players)
+            checked += 1
+    assert checked
+
+def _small_state() -> GameState:
+    state = GameState()
+    for index in range(2):
+        player = PlayerState(f'p{index}', f'Player {index}')
+        player.add_to_hand([STANDARD_CARDS[index], STANDARD_CARDS[20 + index]])
+        player.update_bankroll(-25 * index)
+        player.update_score(index + 1)
+        state.add_player(player)
+    deck = Deck('main', standard_deck()[4:], rng=random.Random(5))
+    deck.shuffle()
+    deck.draw(3)
+    deck.add_to_discard([STANDARD_CARDS[2]])
+    state.add_deck(deck)
+    shoe = Shoe('shoe', standard_deck() * 2, penetration=0.75, rng=random.Random(6))
+    shoe.shuffle()
+    shoe.draw(10)
+    state.add_deck(shoe)
+    state.set_phase(GamePhase.IN_PROGRESS)
+    return state
+
+def test_game_state_round_trip():
+    state = _small_state()
+    data = encode_game_state(state)
+    decoded = decode_game_state(data)
+    assert encode_game_state(decoded) == data
+    assert [(p.id, p.name, p.get_hand(), p.get_score(), p.bankroll) for p in decoded.players] == \
+        [(p.id, p.name, p.get_hand(), p.get_score(), p.bankroll) for p in state.players]
+    shoe, decoded_shoe = state.get_deck('shoe'), decoded.get_deck('shoe')
+    assert decoded_shoe.running_count == shoe.running_count
+    assert decoded_shoe.composition == shoe.composition
+    assert decoded.get_deck('main').draw(5) == state.get_deck('main').draw(5)
+
+def test_game_state_layout_is_pinned():
+    # Changing the encoded layout must come with a new state_codec.VERSION
+    # and a new hash here
+    data = encode_game_state(_small_state())
+    assert len(data) == 5286
+    assert hashlib.sha256(data).hexdigest()[:16] == '41be98075bc265cf'
+
+def test_non_standard_cards_cannot_be_encoded():
+    state = _small_state()
+    state.players[0].add_to_hand([JOKER])
+    with pytest.raises(ValueError):
+        encode_game_state(state)
+    game = _session('rummy', 2).game
+    game.discard_pile.append(JOKER)
+    with pytest.raises(ValueError):
+        serialize_game(game)
+
+def test_wrong_magic_or_version_is_rejected():
+    data = serialize_game(_session('blackjack', 2).game)
+    header = GAME_HEADER.unpack_from(data)
+    for field, value in ((0, b'XXXX'), (1, header[1] + 1), (2, 99)):  # Magic, version, game code
+        bad = bytearray(data)
+        GAME_HEADER.pack_into(bad, 0, *header[:field], value, *header[field + 1:])
+        with pytest.raises(ValueError):
+            deserialize_game(bytes(bad))
+
+    state = encode_game_state(_small_state())
+    for bad_magic, bad_version in ((b'XXXX', 1), (b'CGST', 2)):
+        bad = bytearray(state)
+        STATE_HEADER.pack_into(bad, 0, bad_magic, bad_version)
+        with pytest.raises(ValueError):
+            decode_game_state(bytes(bad))
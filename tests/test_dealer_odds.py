@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from src.games.blackjack_strategy import full_shoe
+from src.games.dealer_odds import (DEALER_TOTALS, NUM_CATEGORIES, bust_probability, cache_info, card_category,
+                                   clear_cache, composition_of, dealer_distribution)
+from src.models.card import STANDARD_CARDS
+
+ACE, TEN = 0, 9
+
+def _only(category: int, count: int = 8):
+    composition = [0] * NUM_CATEGORIES
+    composition[category] = count
+    return composition
+
+def _shoe_without(up_card: int):
+    shoe = full_shoe(6)
+    shoe[up_card] -= 1
+    return shoe
+
+# Dealer bust rates for a 6-deck shoe, dealer standing on soft 17, no peek
+@pytest.mark.parametrize('up_card, bust', [(1, 0.354), (5, 0.423), (6, 0.262), (TEN, 0.214), (ACE, 0.117)])
+def test_bust_rates(up_card, bust):
+    assert bust_probability(up_card, _shoe_without(up_card)) == pytest.approx(bust, abs=0.005)
+
+def test_distributions_sum_to_one():
+    for up_card in range(NUM_CATEGORIES):
+        distribution = dealer_distribution(up_card, _shoe_without(up_card))
+        assert len(distribution) == len(DEALER_TOTALS)
+        assert sum(distribution) == pytest.approx(1.0)
+
+def test_forced_outcomes():
+    assert dealer_distribution(TEN, _only(6)) == (0, 1, 0, 0, 0, 0, 0)    # 10 + 7 stands on 17
+    assert dealer_distribution(ACE, _only(5)) == (0, 1, 0, 0, 0, 0, 0)    # Soft 17 stands
+    assert dealer_distribution(5, _only(TEN)) == (0, 0, 0, 0, 0, 0, 1)    # 6 + 10 draws and busts
+    assert dealer_distribution(5, [0] * NUM_CATEGORIES) == (1, 0, 0, 0, 0, 0, 0)  # Nothing left to draw
+
+def test_stands_on_setting():
+    # A 6 in the hole makes 16: kept when the dealer stands on 16, else a ten busts it
+    composition = _only(5, 1)
+    composition[TEN] = 4
+    assert dealer_distribution(TEN, composition, stands_on=16) == pytest.approx((0.2, 0, 0, 0, 0.8, 0, 0))
+    assert dealer_distribution(TEN, composition) == pytest.approx((0, 0, 0, 0, 0.8, 0, 0.2))
+
+def test_states_are_memoized():
+    clear_cache()
+    dealer_distribution(3, _shoe_without(3))
+    misses = cache_info().misses
+    dealer_distribution(3, np.array(_shoe_without(3)))
+    assert cache_info().misses == misses
+
+def test_cards_by_category():
+    assert [card_category(STANDARD_CARDS[code]) for code in range(13)] == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9, 9]
+    assert composition_of(STANDARD_CARDS) == full_shoe(1)
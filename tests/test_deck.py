@@ -0,0 +1,39 @@
+import random
+import pytest
+from src.models.card import standard_deck
+from src.models.deck import Deck
+
+def _deck(penetration=1.0, seed=1):
+    deck = Deck('main', standard_deck(), penetration=penetration, rng=random.Random(seed))
+    deck.shuffle()
+    return deck
+
+def test_draws_come_off_the_top():
+    deck = _deck()
+    top = deck.undealt()[:5]
+    assert deck.draw(2) + deck.draw(3) == top
+    assert deck.remaining_cards == 47
+
+def test_cut_card_comes_out_at_the_penetration():
+    deck = _deck(penetration=0.75)
+    deck.draw(38)
+    assert not deck.needs_reshuffle
+    deck.draw(1)
+    assert deck.needs_reshuffle
+
+@pytest.mark.parametrize('penetration', [0.0, -0.5, 1.5])
+def test_penetration_must_be_a_fraction(penetration):
+    with pytest.raises(ValueError):
+        Deck('main', standard_deck(), penetration=penetration)
+
+def test_running_out_reshuffles_the_discards():
+    deck = _deck(penetration=0.5)
+    held = deck.draw(50)
+    deck.add_to_discard(held[:10])
+    held = held[10:] + deck.draw(5)
+    assert len(held) == 45 and len(set(card.id for card in held)) == 45
+    assert deck.discard_count == 0 and deck.remaining_cards == 7
+    # The reshuffled deck gets a new cut card
+    assert not deck.needs_reshuffle
+    deck.draw(3)
+    assert deck.needs_reshuffle
@@ -0,0 +1,49 @@
+import math
+import pytest
+from src.games.equity import EquityEstimator, run_rollouts
+from test_hand_evaluator import codes
+
+def _estimate(hole, board, opponents, **kwargs):
+    kwargs.setdefault('time_budget', math.inf)
+    kwargs.setdefault('seed', 3)
+    return EquityEstimator(processes=0).estimate(codes(hole), codes(board), opponents, **kwargs)
+
+def test_made_nuts_always_win():
+    estimate = _estimate('Ah Kh', 'Qh Jh Th 2c 3d', 3, max_samples=500)
+    assert estimate.equity == 1.0 and estimate.margin == 0.0
+
+def test_board_playing_for_everyone_splits():
+    # Nobody can beat the royal flush on the board, so two players always tie
+    total, total_sq, count = run_rollouts(codes('2c 3d'), codes('Ah Kh Qh Jh Th'), 1, 200, seed=1)
+    assert (total, total_sq, count) == (100.0, 50.0, 200)
+
+def test_aces_against_one_random_hand():
+    estimate = _estimate('As Ad', '', 1, target_margin=0.005, max_samples=40000)
+    assert abs(estimate.equity - 0.852) < max(estimate.margin, 0.01)
+
+def test_seeded_estimates_repeat():
+    first = _estimate('7c 8c', '9c Tc 2h', 2, max_samples=2000)
+    assert _estimate('7c 8c', '9c Tc 2h', 2, max_samples=2000) == first
+
+def test_sample_cap_smaller_than_a_batch():
+    estimate = _estimate('Kd Qd', '', 4, target_margin=0.0, max_samples=60)
+    assert estimate.samples == 60
+
+def test_stops_at_the_target_margin():
+    estimate = _estimate('Kd Qd', '', 1, target_margin=0.05)
+    assert estimate.margin <= 0.05 and estimate.samples < 200000
+
+def test_without_opponents_the_pot_is_ours():
+    assert _estimate('2c 7d', '', 0).equity == 1.0
+
+def test_bad_hands_are_rejected():
+    with pytest.raises(ValueError):
+        _estimate('2c 7d 9s', '', 1)
+    with pytest.raises(ValueError):
+        _estimate('2c 7d', 'Ah Kh Qh Jh Th 9h', 1)
+
+def test_process_pool_estimate():
+    with EquityEstimator(processes=1, batch_size=200) as estimator:
+        estimate = estimator.estimate(codes('As Ad'), [], 1, time_budget=30.0, max_samples=2000, seed=5)
+    assert estimate.samples >= 2000 and abs(estimate.equity - 0.852) < 0.05
+    assert estimator._pool is None
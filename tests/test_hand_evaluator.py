@@ -0,0 +1,106 @@
+import random
+from itertools import combinations
+import numpy as np
+import pytest
+from src.games.batch_evaluator import evaluate_batch
+from src.games.hand_evaluator import HandAccumulator, PokerHand, evaluate_cards, evaluate_codes, hand_category
+from src.models.card import STANDARD_CARDS
+
+RANKS = {'A': 1, 'T': 10, 'J': 11, 'Q': 12, 'K': 13}
+SUITS = 'hdcs'  # Hearts, Diamonds, Clubs, Spades, as in Card.code
+
+def codes(hand: str):
+    """Card codes of a hand written like "Ah Td 7c 2s" """
+    return [SUITS.index(card[-1]) * 13 + (RANKS.get(card[0]) or int(card[0])) - 1 for card in hand.split()]
+
+def rank(hand: str) -> int:
+    return evaluate_codes(codes(hand))
+
+@pytest.mark.parametrize('hand, category', [
+    ('Ah Kh Qh Jh Th', PokerHand.ROYAL_FLUSH),
+    ('9s 8s 7s 6s 5s', PokerHand.STRAIGHT_FLUSH),
+    ('Ad 2d 3d 4d 5d', PokerHand.STRAIGHT_FLUSH),
+    ('7h 7d 7c 7s 2h', PokerHand.FOUR_OF_A_KIND),
+    ('Kh Kd Kc 2s 2h', PokerHand.FULL_HOUSE),
+    ('Ah 9h 7h 4h 2h', PokerHand.FLUSH),
+    ('Ah 2d 3c 4s 5h', PokerHand.STRAIGHT),
+    ('Th Jd Qc Ks Ah', PokerHand.STRAIGHT),
+    ('Qh Qd Qc 9s 2h', PokerHand.THREE_OF_A_KIND),
+    ('Jh Jd 4c 4s 9h', PokerHand.TWO_PAIR),
+    ('8h 8d Ac 4s 2h', PokerHand.PAIR),
+    ('Ah Jd 8c 4s 2h', PokerHand.HIGH_CARD),
+    # Seven cards
+    ('Ah Kh Qh Jh Th 9h 8h', PokerHand.ROYAL_FLUSH),
+    ('2h 5h 7h 9h Kh 8d 6c', PokerHand.FLUSH),
+    ('5h 6h 7h 8h 9d Th 2h', PokerHand.FLUSH),
+    ('4h 5h 6h 7h 8h 9d Td', PokerHand.STRAIGHT_FLUSH),
+    ('Kh Kd Kc 2s 2h 2d Ac', PokerHand.FULL_HOUSE),
+    ('9h 9d 9c 9s Kh Kd Kc', PokerHand.FOUR_OF_A_KIND),
+    ('Ah 2d 3c 4s 5h Kd Kc', PokerHand.STRAIGHT),
+])
+def test_categories(hand, category):
+    assert hand_category(rank(hand)) == category
+
+def test_categories_are_ordered():
+    hands = ['Ah Jd 8c 4s 2h', '2h 2d 3c 4s 6h', '2h 2d 3c 3s 4h', '2h 2d 2c 3s 4h', 'Ah 2d 3c 4s 5h',
+             '2h 3h 4h 5h 7h', '2h 2d 2c 3s 3h', '2h 2d 2c 2s 3h', 'Ad 2d 3d 4d 5d', 'Ah Kh Qh Jh Th']
+    ranks = [rank(hand) for hand in hands]
+    assert ranks == sorted(ranks) and len(set(ranks)) == len(ranks)
+
+def test_wheel_is_the_lowest_straight():
+    wheel = rank('Ah 2d 3c 4s 5h')
+    assert wheel < rank('2h 3d 4c 5s 6h') < rank('Th Jd Qc Ks Ah')
+    assert wheel > rank('Ah Ad Ac Ks Qh')
+    # A six on the board makes the six-high straight, not the wheel
+    assert rank('Ah 2d 3c 4s 5h 6d') == rank('2h 3d 4c 5s 6h')
+    assert rank('Ad 2d 3d 4d 5d') < rank('2h 3h 4h 5h 6h')
+
+@pytest.mark.parametrize('better, worse', [
+    ('Ah Ad Kc 9s 4h', 'As Ac Qd Jh Th'),      # Pair: first kicker
+    ('Ah Ad Kc 9s 4h', 'As Ac Kd 9h 3h'),      # Pair: third kicker
+    ('Ah Jd 8c 4s 3h', 'As Jc 8d 4h 2h'),      # High card: fifth card
+    ('Kh Kd 5c 5s Ah', 'Ks Kc 5h 5d Qh'),      # Two pair: kicker
+    ('Kh Kd 6c 6s 2h', 'Ks Kc 5h 5d Ah'),      # Two pair: second pair before kicker
+    ('Qh Qd Qc As 2h', 'Qs Qd Qc Ks Jh'),      # Trips: kicker
+    ('3h 3d 3c As Ah', '2s 2d 2c Ks Kh'),      # Full house: trips first
+    ('9h 9d 9c 9s Ah', '9h 9d 9c 9s Kh'),      # Quads: kicker
+    ('Ah Kh 9h 7h 3h', 'Ad Kd 9d 7d 2d'),      # Flush: fifth card
+])
+def test_kickers(better, worse):
+    assert rank(better) > rank(worse)
+
+def test_only_the_best_five_cards_count():
+    # The sixth and seventh cards never break a tie
+    assert rank('Ah Ad Kc Qs Jh 3d 2c') == rank('As Ac Kd Qh Jd 4s 3h')
+    # Three pairs: the third pair's rank can be the kicker
+    assert rank('Kh Kd Qc Qs Jh Jd 2c') == rank('Kh Kd Qc Qs Jc 3d 2c')
+    # Two sets of trips make the best full house
+    assert rank('2h 2d 2c Ks Kh Kd 7c') == rank('Ks Kh Kd 2h 2d 7c 8c')
+
+def test_seven_cards_rank_as_their_best_five():
+    rng = random.Random(7)
+    for _ in range(300):
+        hand = rng.sample(range(52), 7)
+        assert evaluate_codes(hand) == max(evaluate_codes(five) for five in combinations(hand, 5))
+
+def test_cards_accumulator_and_codes_agree():
+    rng = random.Random(3)
+    for _ in range(200):
+        hand = rng.sample(range(52), 7)
+        accumulator = HandAccumulator(hand[:2])
+        board = HandAccumulator(hand[2:5])
+        board.add(hand[5:])
+        expected = evaluate_codes(hand)
+        assert evaluate_cards(STANDARD_CARDS[code] for code in hand) == expected
+        assert accumulator.merged(board).rank() == expected
+
+@pytest.mark.parametrize('num_cards', [5, 6, 7])
+def test_batch_matches_scalar(num_cards):
+    rng = np.random.default_rng(11)
+    hands = np.array([rng.permutation(52)[:num_cards] for _ in range(2000)])
+    expected = [evaluate_codes(hand) for hand in hands.tolist()]
+    assert evaluate_batch(hands).tolist() == expected
+
+def test_batch_rejects_more_than_seven_cards():
+    with pytest.raises(ValueError):
+        evaluate_batch(np.zeros((1, 8), dtype=np.int64))
@@ -0,0 +1,72 @@
+import os
+import pytest
+from src.games.session import new_session
+from src.models.events import EventSink, GameEvent, GameEventType
+from src.models.hand_history import FILE_HEADER, HandHistoryWriter
+from src.models.hand_history_reader import HandHistoryReader
+
+class _Recorder(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def handle_event(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+def _log_game(path, game_type, num_players, seed, **config):
+    """Play a game into a fresh log; returns the events it emitted"""
+    events = _Recorder()
+    with HandHistoryWriter(path) as history:
+        recorder = history.recorder()
+        session = new_session(game_type, num_players, 3, seed=seed, sinks=[recorder, events], **config)
+        session.run()
+        history.end_game(recorder)
+    return events.events
+
+@pytest.mark.parametrize('game_type, num_players, config', [
+    ('poker', 4, {'ai_max_samples': 50}), ('blackjack', 3, {}), ('rummy', 3, {})])
+def test_every_event_is_recorded(game_type, num_players, config, tmp_path):
+    path = str(tmp_path / 'game.hh')
+    events = _log_game(path, game_type, num_players, 12, **config)
+    with HandHistoryReader(path) as reader:
+        records = list(reader.records())
+        seats = reader.game_start(records[0].offset).players
+    assert len(records) == len(events)
+    for record, event in zip(records, events):
+        assert record.event_type == event.event_type
+        assert record.seat == (seats.index(event.player.id) if event.player else 255)
+        assert record.action_type == (event.action.action_type if event.action else None)
+        assert record.amount == event.amount
+        assert list(record.cards) == [card.code for card in event.cards]
+
+@pytest.mark.parametrize('seed', [-5, 0, 2 ** 63, 2 ** 64 - 1, -(2 ** 100)])
+def test_any_seed_is_logged(seed, tmp_path):
+    path = str(tmp_path / 'game.hh')
+    _log_game(path, 'blackjack', 2, seed)
+    with HandHistoryReader(path) as reader:
+        start = reader.game_start(next(reader.records()).offset)
+    assert start.game_type == "Blackjack" and start.seed == seed and start.players == ('p0', 'p1')
+
+def test_seeds_beyond_128_bits_are_rejected():
+    with pytest.raises(ValueError):
+        new_session('blackjack', 2, 2, seed=2 ** 127)
+
+def test_torn_last_record_is_skipped(tmp_path):
+    path = str(tmp_path / 'game.hh')
+    events = _log_game(path, 'rummy', 2, 3)
+    with open(path, 'ab') as f:
+        f.write(b'\x20\x00\x03')  # A length prefix promising more than follows
+    with HandHistoryReader(path) as reader:
+        assert sum(1 for _ in reader.records()) == len(events)
+
+def test_rounds_are_written_as_they_end(tmp_path):
+    path = str(tmp_path / 'game.hh')
+    history = HandHistoryWriter(path, buffer_size=1)
+    recorder = history.recorder()
+    session = new_session('blackjack', 2, 3, seed=1, sinks=[recorder])
+    session.step()
+    assert os.path.getsize(path) <= FILE_HEADER.size  # No records while the round is in play
+    while session.rounds == 0:
+        session.step()
+    with HandHistoryReader(path) as reader:
+        assert GameEventType.ROUND_ENDED in [record.event_type for record in reader.records()]
+    history.close()
@@ -0,0 +1,108 @@
+import json
+import subprocess
+import sys
+import pytest
+from src.games.hand_evaluator import PokerHand, hand_category
+from src.games.session import new_session
+from src.models.events import HAND_NOT_SHOWN, EventSink, GameEvent, GameEventType
+from src.models.hand_history import HandHistoryWriter
+from src.models.hand_history_reader import HandHistoryReader, main
+from test_poker import _showdown
+
+class _Recorder(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def handle_event(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+def test_folded_seats_are_indexed_as_losers(tmp_path):
+    path = str(tmp_path / 'poker.hh')
+    events = _Recorder()
+    with HandHistoryWriter(path) as history:
+        recorder = history.recorder()
+        new_session('poker', 5, 20, seed=4, sinks=[recorder, events], ai_max_samples=50).run()
+        history.end_game(recorder)
+    ended = [event for event in events.events if event.event_type == GameEventType.ROUND_ENDED]
+    won = [event for event in events.events if event.event_type == GameEventType.ROUND_WON]
+    uncontested = [event for event in won if not event.details['showdown']]
+    assert uncontested
+    with HandHistoryReader(path) as reader:
+        assert len(reader) == sum(len(event.details['results']) for event in ended)
+        winners = reader.query(won=True)
+        assert [(result.player, result.pot) for result in winners] == \
+            [(event.player.id, event.details['pot']) for event in won]
+        # Neither folded hands nor uncontested winners' hands are shown
+        hidden = reader.count(max_value=HAND_NOT_SHOWN)
+        assert hidden == sum(list(event.details['results'].values()).count(HAND_NOT_SHOWN) for event in ended)
+        assert reader.count(won=True, max_value=HAND_NOT_SHOWN) == len(uncontested)
+        assert reader.count(won=False) == len(reader) - len(won)
+
+def test_every_player_splitting_a_pot_is_a_winner(tmp_path):
+    path = str(tmp_path / 'split.hh')
+    with HandHistoryWriter(path) as history:
+        recorder = history.recorder()
+        game, _ = _showdown(['2c 2d', '3c 3d', 'Kc Kd'], '5h 6d 7c 8s 9h', 90, sinks=[recorder])
+        game.check_win_condition()
+        history.end_game(recorder)
+    with HandHistoryReader(path) as reader:
+        assert sorted(result.player for result in reader.query(won=True)) == ['p0', 'p1', 'p2']
+
+def test_reader_does_not_import_the_games():
+    code = ("import sys, src.models.hand_history_reader; "
+            "sys.exit(any(name.startswith('src.games') for name in sys.modules))")
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+def _log_games(path, games):
+    with HandHistoryWriter(path) as history:
+        for game_type, num_players, rounds, seed, config in games:
+            recorder = history.recorder()
+            new_session(game_type, num_players, rounds, seed=seed, sinks=[recorder], **config).run()
+            history.end_game(recorder)
+
+MIXED = [('poker', 4, 4, 1, {'ai_max_samples': 50}), ('blackjack', 3, 4, 2, {}), ('rummy', 3, 20, 3, {})]
+
+@pytest.mark.parametrize('criteria, matches', [
+    ({'player': 'p1'}, lambda r: r.player == 'p1'),
+    ({'game_type': 'Blackjack', 'won': True}, lambda r: r.game_type == 'Blackjack' and r.won),
+    ({'hand_category': PokerHand.PAIR}, lambda r: r.game_type == 'Poker' and hand_category(r.value) == PokerHand.PAIR),
+    ({'min_pot': 20, 'max_pot': 60}, lambda r: 20 <= r.pot <= 60),
+    ({'min_value': 17, 'max_value': 21, 'game_type': 'Blackjack'},
+     lambda r: r.game_type == 'Blackjack' and 17 <= r.value <= 21),
+    ({'dealer_busted': True}, lambda r: r.up_rank > 0 and r.dealer_value > 21),
+    ({'up_rank': 1}, lambda r: r.up_rank == 1),
+    ({'player': 'nobody'}, lambda r: False),
+])
+def test_queries_match_a_full_scan(criteria, matches, tmp_path):
+    path = str(tmp_path / 'mixed.hh')
+    _log_games(path, MIXED)
+    with HandHistoryReader(path) as reader:
+        every = reader.query()
+        assert {result.game_type for result in every} == {'Poker', 'Blackjack', 'Rummy'}
+        expected = [result for result in every if matches(result)]
+        assert reader.query(**criteria) == expected
+        assert reader.count(**criteria) == len(expected)
+
+def test_indexes_are_rebuilt_when_the_log_grows(tmp_path):
+    path = str(tmp_path / 'grow.hh')
+    _log_games(path, MIXED[1:2])
+    with HandHistoryReader(path) as reader:
+        before = len(reader)
+    with HandHistoryReader(path) as reader:  # Reuses the indexes on disk
+        assert len(reader) == before
+    _log_games(path, MIXED[1:2])
+    with HandHistoryReader(path) as reader:
+        assert len(reader) == 2 * before
+
+def test_cli_prints_matches(tmp_path, monkeypatch, capsys):
+    path = str(tmp_path / 'cli.hh')
+    _log_games(path, MIXED[1:2])
+    monkeypatch.setattr(sys, 'argv', ['hand_history_reader', str(tmp_path), '--game', 'Blackjack',
+                                      '--won', '--limit', '2'])
+    main()
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    with HandHistoryReader(path) as reader:
+        total = reader.count(game_type='Blackjack', won=True)
+    assert lines[-1] == {'matches': total}
+    assert len(lines) == min(total, 2) + 1
+    assert all(line['log'] == path and line['won'] for line in lines[:-1])
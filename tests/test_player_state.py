@@ -0,0 +1,58 @@
+from src.models.card import STANDARD_CARDS, Card
+from src.models.player_state import PlayerState
+
+JOKER = Card('joker', 'Joker', 'None', 0, 'joker')
+
+def _player(*codes):
+    player = PlayerState('p0', 'Player')
+    player.add_to_hand([STANDARD_CARDS[code] for code in codes])
+    return player
+
+def test_hand_keeps_deal_order_through_removals():
+    player = _player(5, 17, 30, 44)
+    removed = player.remove_from_hand([STANDARD_CARDS[30].id, STANDARD_CARDS[5].id])
+    assert removed == [STANDARD_CARDS[30], STANDARD_CARDS[5]]
+    player.add_to_hand([STANDARD_CARDS[2]])
+    assert player.get_hand() == [STANDARD_CARDS[17], STANDARD_CARDS[44], STANDARD_CARDS[2]]
+    assert player.hand_size == 3 and list(player.hand) == player.get_hand()
+
+def test_membership_and_mask_follow_the_hand():
+    player = _player(0, 51)
+    assert player.has_card(STANDARD_CARDS[0].id) and not player.has_card(STANDARD_CARDS[1].id)
+    assert player.card_mask == 1 | 1 << 51
+    player.remove_from_hand([STANDARD_CARDS[51].id])
+    assert player.card_mask == 1 and not player.has_card(STANDARD_CARDS[51].id)
+    player.clear_hand()
+    assert player.card_mask == 0 and player.hand_size == 0
+
+def test_unknown_and_repeated_ids():
+    player = _player(3, 4)
+    assert player.remove_from_hand(['no-such-card']) == []
+    assert player.remove_from_hand([STANDARD_CARDS[3].id] * 3) == [STANDARD_CARDS[3]]
+    assert player.get_hand() == [STANDARD_CARDS[4]]
+
+def test_copies_from_a_multi_deck_shoe():
+    player = _player(9, 9, 10)
+    assert player.hand_size == 3
+    assert player.remove_from_hand([STANDARD_CARDS[9].id]) == [STANDARD_CARDS[9]] * 2
+    assert player.card_mask == 1 << 10
+
+def test_cards_without_a_code_have_no_bit():
+    player = _player(7)
+    player.add_to_hand([JOKER])
+    assert player.has_card('joker') and player.card_mask == 1 << 7
+    player.remove_from_hand(['joker'])
+    assert player.card_mask == 1 << 7
+
+def test_snapshot_round_trip():
+    player = _player(1, 2)
+    player.update_score(5)
+    player.update_bankroll(-40)
+    snapshot = player.snapshot()
+    player.remove_from_hand([STANDARD_CARDS[1].id])
+    player.update_score(3)
+    player.update_bankroll(100)
+    player.restore(snapshot)
+    assert (player.get_hand(), player.get_score(), player.get_bankroll()) == \
+        ([STANDARD_CARDS[1], STANDARD_CARDS[2]], 5, 960)
+    assert player.card_mask == 0b110
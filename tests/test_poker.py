@@ -0,0 +1,68 @@
+import numpy as np
+from src.games.hand_evaluator import HandAccumulator, evaluate_cards
+from src.games.poker import Poker
+from src.games.session import new_session
+from src.models.card import STANDARD_CARDS
+from src.models.events import EventSink, GameEvent, GameEventType
+from test_hand_evaluator import codes
+
+class _Recorder(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def handle_event(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+def _showdown(holes, board, pot, sinks=()):
+    """A game at the end of its last betting round with the given hole cards, board and pot"""
+    recorder = _Recorder()
+    game = Poker(len(holes), 100, seed=1, headless=True, sinks=[recorder, *sinks])
+    for player, hole in zip(game.game_state.players, holes):
+        player.clear_hand()
+        player.add_to_hand([STANDARD_CARDS[code] for code in codes(hole)])
+        game._hole_states[player.id] = HandAccumulator(codes(hole))
+    game.community_cards = [STANDARD_CARDS[code] for code in codes(board)]
+    game._board_state = HandAccumulator(codes(board))
+    game._hand_ranks.clear()
+    game.pot = pot
+    game.round_active = False
+    recorder.events.clear()
+    return game, recorder
+
+def test_tied_hands_split_the_pot():
+    # Everyone plays the straight on the board
+    game, recorder = _showdown(['2c 2d', '3c 3d', 'Kc Qd'], '5h 6d 7c 8s 9h', 101)
+    bankrolls = [player.get_bankroll() for player in game.seats]
+    winner = game.check_win_condition()
+    assert winner is None  # The game goes on
+    won = [event for event in recorder.events if event.event_type == GameEventType.ROUND_WON]
+    # The odd chip goes to the first tied seat
+    assert [(event.player.id, event.amount) for event in won] == [('p0', 34), ('p1', 34), ('p2', 33)]
+    assert [player.get_bankroll() - before for player, before in zip(game.seats, bankrolls)] == [34, 34, 33]
+    ended = next(event for event in recorder.events if event.event_type == GameEventType.ROUND_ENDED)
+    assert ended.player.id == 'p0' and ended.amount == 101
+
+def test_best_hand_takes_the_whole_pot():
+    game, recorder = _showdown(['2c 2d', 'Tc Td', '9c 9d'], '5h 6d 7c 8s Kh', 90)
+    game.check_win_condition()
+    won = [event for event in recorder.events if event.event_type == GameEventType.ROUND_WON]
+    assert [(event.player.id, event.amount) for event in won] == [('p2', 90)]
+
+def test_batch_evaluation_matches_the_game():
+    game, _ = _showdown(['Ah Kh', '2c 2d', '7s 8s'], 'Qh Jh Th 2s 3s', 0)
+    hands = np.array([[card.code for card in player.get_hand() + game.community_cards] for player in game.seats])
+    assert Poker.evaluate_batch(hands).tolist() == [game.evaluate_hand(player) for player in game.seats]
+    # A list of lists is accepted too
+    assert Poker.evaluate_batch(hands.tolist()).tolist() == Poker.evaluate_batch(hands).tolist()
+
+def test_incremental_ranks_follow_the_board():
+    session = new_session('poker', 5, 6, seed=9, ai_max_samples=50)
+    game = session.game
+    checked = set()
+    while not session.over:
+        session.step()
+        for player in game.game_state.players:
+            expected = evaluate_cards(player.get_hand() + game.community_cards)
+            assert game.evaluate_hand(player) == expected
+            checked.add(len(game.community_cards))
+    assert checked >= {0, 3, 4, 5}
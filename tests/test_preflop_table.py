@@ -0,0 +1,48 @@
+from itertools import combinations
+import pytest
+from src.games.preflop_table import (HEADER, MAX_OPPONENTS, NUM_HANDS, PreflopTable, _representative,
+                                     build_table, get_preflop_table, hand_index, simulate_hand)
+from test_hand_evaluator import codes
+
+def test_every_starting_hand_has_one_index():
+    combos = {}
+    for first, second in combinations(range(52), 2):
+        index = hand_index(first, second)
+        assert hand_index(second, first) == index
+        combos[index] = combos.get(index, 0) + 1
+    assert sorted(combos) == list(range(NUM_HANDS))
+    # 13 pairs of 6 combos, 78 suited hands of 4 and 78 offsuit of 12
+    assert sorted(combos.values()) == [4] * 78 + [6] * 13 + [12] * 78
+    assert all(hand_index(*_representative(index)) == index for index in range(NUM_HANDS))
+
+def test_suits_do_not_matter():
+    assert hand_index(*codes('Ah Kh')) == hand_index(*codes('As Ks'))
+    assert hand_index(*codes('Ah Kd')) == hand_index(*codes('Ac Ks'))
+    assert hand_index(*codes('Ah Kh')) != hand_index(*codes('Ah Kd'))
+
+def test_default_table_equities():
+    table = get_preflop_table()
+    aces, sevens_deuce = codes('As Ah'), codes('7c 2d')
+    assert abs(table.equity(aces, 1) - 0.852) < 0.01
+    assert abs(table.equity(sevens_deuce, 1) - 0.35) < 0.02
+    equities = [table.equity(aces, n) for n in range(1, MAX_OPPONENTS + 1)]
+    assert equities == sorted(equities, reverse=True)
+    assert table.equity(aces, 0) == 1.0
+    assert table.equity(aces, 20) == table.equity(aces, MAX_OPPONENTS)
+
+def test_built_table_stores_the_simulation(tmp_path):
+    path = str(tmp_path / 'preflop.bin')
+    build_table(path, samples=20, processes=1, seed=2)
+    table = PreflopTable(path)
+    index = hand_index(*codes('Qs Jd'))
+    expected = simulate_hand(index, 20, 2 * NUM_HANDS + index)
+    stored = [table.equity(codes('Qs Jd'), n) for n in range(1, MAX_OPPONENTS + 1)]
+    assert stored == pytest.approx(expected, abs=1 / 65535)
+    assert table.samples == 20
+    table.close()
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / 'preflop.bin'
+    path.write_bytes(HEADER.pack(b'PFEQ', 1, NUM_HANDS, MAX_OPPONENTS - 1, 20) + bytes(4000))
+    with pytest.raises(ValueError):
+        PreflopTable(str(path))
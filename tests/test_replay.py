@@ -0,0 +1,65 @@
+import random
+import pytest
+from src.games.game_codec import serialize_game
+from src.games.replay import ActionLog, Replayer
+from src.games.session import new_session
+from src.models.player_action import PlayerAction, PlayerActionType
+
+GAMES = [('poker', 5), ('blackjack', 4), ('rummy', 3)]
+
+def _external_action(session, rng: random.Random) -> PlayerAction:
+    """A random move for the external seat to act, falling back on its timeout move"""
+    game_type = session.game_type
+    if game_type == 'poker' and rng.random() < 0.5:
+        if rng.random() < 0.5:
+            return PlayerAction(PlayerActionType.RAISE, amount=session.game.current_bet + rng.choice((10, 50)))
+        return PlayerAction(PlayerActionType.CALL)
+    if game_type == 'blackjack':
+        return PlayerAction(rng.choice((PlayerActionType.HIT, PlayerActionType.STAND)))
+    if game_type == 'rummy' and session.game.has_drawn:
+        return PlayerAction(PlayerActionType.DISCARD, [rng.choice(session.to_act.get_hand())])
+    return session.timeout_action()
+
+def _record(game_type, num_players):
+    """Play a session with two external seats, keeping the serialized game after every turn"""
+    # Fewer equity rollouts keep the test fast; the log carries the setting into the replay
+    config = {'ai_max_samples': 50} if game_type == 'poker' else {}
+    session = new_session(game_type, num_players, 6, seed=17, external=('p0', 'p2'), **config)
+    rng = random.Random(4)
+    states = [serialize_game(session.game)]
+    while not session.over:
+        session.step(_external_action(session, rng) if session.awaiting_action else None)
+        states.append(serialize_game(session.game))
+    return session, states
+
+@pytest.mark.parametrize('game_type, num_players', GAMES)
+def test_seek_matches_the_live_game(game_type, num_players, tmp_path):
+    session, states = _record(game_type, num_players)
+    assert session.actions
+    path = str(tmp_path / 'log.json')
+    ActionLog.from_session(session).save(path)
+    log = ActionLog.load(path)
+    assert log == ActionLog.from_session(session)
+
+    replayer = Replayer(log, checkpoint_every=5)
+    end = replayer.seek()
+    assert end.over and end.turns == session.turns
+    assert serialize_game(end.game) == states[-1]
+
+    # Turns on, just before and just after checkpoints, then random ones in any order
+    rng = random.Random(9)
+    turns = [t for c in replayer.checkpoints for t in (c - 1, c, c + 1) if 0 <= t <= session.turns]
+    turns += rng.sample(range(session.turns + 1), min(20, session.turns + 1))
+    for turn in turns:
+        replayed = replayer.seek(turn)
+        assert replayed.turns == turn
+        assert serialize_game(replayed.game) == states[turn]
+    # Seeking past the end stops where the game did
+    assert replayer.seek(session.turns + 10).turns == session.turns
+
+def test_seek_returns_independent_copies():
+    session, states = _record('blackjack', 3)
+    replayer = Replayer(ActionLog.from_session(session), checkpoint_every=4)
+    first = replayer.seek(6)
+    first.run()
+    assert serialize_game(replayer.seek(6).game) == states[6]
@@ -0,0 +1,31 @@
+from src.games.rummy import Rummy
+from src.models.rng import derive_seed, make_rng, spawn_seeds
+
+def test_derived_seeds_are_stable_and_distinct():
+    assert derive_seed(7, 'game', 3) == derive_seed(7, 'game', 3)
+    seeds = {derive_seed(7, 'game', 3), derive_seed(8, 'game', 3), derive_seed(7, 'game', 4),
+             derive_seed(7, 'deck', 3)}
+    assert len(seeds) == 4
+    assert all(0 <= seed < 1 << 64 for seed in seeds)
+
+def test_spawned_seeds_match_derived_ones():
+    seeds = spawn_seeds(5, 4, 'worker')
+    assert seeds == [derive_seed(5, 'worker', index) for index in range(4)]
+    assert len(set(seeds)) == 4
+
+def test_unseeded_generators_differ():
+    assert make_rng().getrandbits(64) != make_rng().getrandbits(64)
+    assert make_rng(3).random() == make_rng(3).random()
+
+def test_streams_do_not_interfere():
+    first, second = Rummy(3, seed=21, headless=True), Rummy(3, seed=21, headless=True)
+    # Drawing from the game's generator leaves the deck's order alone
+    for _ in range(100):
+        second.rng.random()
+    first_deck, second_deck = first.game_state.get_deck('main'), second.game_state.get_deck('main')
+    first_deck.add_to_discard(first_deck.draw(first_deck.remaining_cards))
+    second_deck.add_to_discard(second_deck.draw(second_deck.remaining_cards))
+    first_deck.reshuffle()
+    second_deck.reshuffle()
+    assert first_deck.undealt() == second_deck.undealt()
+    assert [p.get_hand() for p in first.game_state.players] == [p.get_hand() for p in second.game_state.players]
@@ -0,0 +1,39 @@
+import pytest
+from src.games.session import new_session
+from src.models.card import STANDARD_CARDS
+from src.models.player_action import PlayerAction, PlayerActionType
+
+def _drawn_session():
+    """A session where external seat p0 has just drawn"""
+    session = new_session('rummy', 2, 5, seed=6, external=('p0',))
+    session.step(PlayerAction(PlayerActionType.DRAW_DECK))
+    return session
+
+def _not_held(player, rank):
+    return [card for card in STANDARD_CARDS if card.rank == rank and not player.has_card(card.id)]
+
+@pytest.mark.parametrize('action_type', [PlayerActionType.DECLARE_SET, PlayerActionType.DISCARD])
+def test_cards_must_be_in_the_hand(action_type):
+    session = _drawn_session()
+    player = session.to_act
+    rank = next(rank for rank in range(1, 14) if len(_not_held(player, rank)) >= 3)
+    cards = _not_held(player, rank)[:3 if action_type == PlayerActionType.DECLARE_SET else 1]
+    hand, turns = player.get_hand(), session.turns
+    for play in (session.step, lambda action: session.game.play_turn(player, action)):
+        with pytest.raises(ValueError):
+            play(PlayerAction(action_type, cards))
+    assert player.get_hand() == hand and session.turns == turns
+    assert turns not in session.actions
+
+def test_a_card_cannot_be_named_twice():
+    session = _drawn_session()
+    card = session.to_act.get_hand()[0]
+    with pytest.raises(ValueError):
+        session.step(PlayerAction(PlayerActionType.DECLARE_SET, [card, card, card]))
+
+def test_held_cards_are_discarded():
+    session = _drawn_session()
+    player = session.to_act
+    card = player.get_hand()[0]
+    session.step(PlayerAction(PlayerActionType.DISCARD, [card]))
+    assert not player.has_card(card.id) and session.game.discard_pile[-1] == card
@@ -0,0 +1,136 @@
+import random
+import pytest
+from src.games.rummy import Rummy
+from src.games.rummy_melds import (FULL_DECK, MELDS, RUNS, SETS, best_discard, card_points, completing_draws,
+                                   deadwood, expected_draw_deadwood, hand_mask, is_meld, is_run_mask, is_set_mask,
+                                   mask_points, melded_cards, potential_meld_cards, rank_counts_at_least,
+                                   run_starts, solve_melds)
+from src.models.card import STANDARD_CARDS, Card
+from test_hand_evaluator import codes
+
+JOKER = Card('joker', 'Joker', 'None', 0, 'joker')
+
+def mask(hand: str) -> int:
+    return sum(1 << code for code in codes(hand))
+
+def cards(hand: str):
+    return [STANDARD_CARDS[code] for code in codes(hand)]
+
+def _brute_force_deadwood(hand: int) -> int:
+    """Least deadwood over every set of disjoint melds within the hand"""
+    inside = [meld for meld in MELDS if meld & hand == meld]
+
+    def best(remaining: int, start: int) -> int:
+        points = mask_points(remaining)
+        for i in range(start, len(inside)):
+            if inside[i] & remaining == inside[i]:
+                points = min(points, best(remaining ^ inside[i], i + 1))
+        return points
+    return best(hand, 0)
+
+def test_meld_tables():
+    assert len(SETS) == 13 * 5 and len(RUNS) == 4 * 66
+    assert all(is_meld(meld) for meld in MELDS)
+
+@pytest.mark.parametrize('hand, points', [
+    ('3h 4h 5h 7h 7d 7c Kc', 10),
+    ('Ah 2h 3h 4h 4d 4c', 0),          # 4h fits the run or the set, not both
+    ('Ah 2h 3h 4h 4d 4c 4s', 0),       # With the fourth 4 it can go in the run
+    ('5h 6h 7h 7d 7c 7s 8h', 0),
+    ('2h 2d 3h 3d 4h 4d', 0),          # Two runs
+    ('Kh Kd Qc Js 9h', 49),
+    ('', 0),
+])
+def test_known_hands(hand, points):
+    assert deadwood(mask(hand)) == points
+
+def test_solver_matches_brute_force():
+    rng = random.Random(18)
+    for _ in range(200):
+        hand = sum(1 << code for code in rng.sample(range(52), rng.randint(3, 11)))
+        points, melds = solve_melds(hand)
+        assert points == _brute_force_deadwood(hand)
+        # The melds are disjoint, in the hand and account for the rest
+        used = 0
+        for meld in melds:
+            assert is_meld(meld) and meld & hand == meld and not meld & used
+            used |= meld
+        assert mask_points(hand & ~used) == points
+
+def test_every_card_needs_a_bit():
+    game = Rummy(2, seed=1, headless=True)
+    sevens = cards('7h 7d')
+    assert game.is_set(sevens + cards('7c'))
+    assert not game.is_set(sevens + [JOKER])
+    assert not game.is_set(sevens + cards('7h'))
+    assert hand_mask(sevens + [JOKER]) == mask('7h 7d')
+    run = cards('4s 5s')
+    assert game.is_run(run + cards('6s'))
+    assert not game.is_run(run + [JOKER])
+
+THREE_CARD_MELDS = [meld for meld in MELDS if meld.bit_count() == 3]
+
+def _union(masks) -> int:
+    union = 0
+    for meld in masks:
+        union |= meld
+    return union
+
+def test_bitboard_queries_match_the_meld_tables():
+    rng = random.Random(19)
+    for _ in range(300):
+        hand = sum(1 << code for code in rng.sample(range(52), rng.randint(0, 14)))
+        in_melds = 0
+        for meld in MELDS:
+            if meld & hand == meld:
+                in_melds |= meld
+        assert melded_cards(hand) == in_melds
+        near = [meld for meld in THREE_CARD_MELDS if (meld & hand).bit_count() >= 2]
+        assert potential_meld_cards(hand) == hand & _union(near)
+        completing = [meld for meld in near if (meld & hand).bit_count() == 2]
+        assert completing_draws(hand) == _union(meld & ~hand for meld in completing)
+        for n in range(1, 5):
+            ranks = sum(1 << rank for rank in range(13)
+                        if sum(hand >> (suit * 13 + rank) & 1 for suit in range(4)) >= n)
+            assert rank_counts_at_least(hand, n) == ranks
+
+def test_run_starts():
+    row = 0b1110111011  # Held ranks A, 2, 4, 5, 6, 8, 9, 10
+    assert run_starts(row, 3) == 0b0010001000  # 4-5-6 and 8-9-10
+    assert run_starts(row, 2) == 0b0110011001
+    assert run_starts(row, 4) == 0
+
+def test_mask_shapes():
+    assert is_set_mask(mask('9h 9c 9s')) and not is_set_mask(mask('9h 9c Ts'))
+    assert is_run_mask(mask('Jd Qd Kd')) and not is_run_mask(mask('Jd Qd Ah'))
+    assert not is_run_mask(mask('Qd Kd Ad'))  # Aces are low only
+    assert not is_run_mask(mask('2d 3d 5d'))
+
+def test_best_discard_leaves_the_least_deadwood():
+    rng = random.Random(20)
+    for _ in range(100):
+        hand = sum(1 << code for code in rng.sample(range(52), 8))
+        options = [(deadwood(hand & ~(1 << code)), -card_points(code)) for code in range(52) if hand >> code & 1]
+        points, code = best_discard(hand)
+        assert (points, -card_points(code)) == min(options)
+    assert best_discard(mask('Kh 5c'), keep=mask('Kh')) == (10, codes('5c')[0])
+    assert best_discard(0) == (0, -1)
+
+def test_expected_draw_matches_every_draw():
+    rng = random.Random(21)
+    for _ in range(20):
+        dealt = rng.sample(range(52), 17)
+        hand = sum(1 << code for code in dealt[:7])
+        unseen = FULL_DECK & ~sum(1 << code for code in dealt)
+        draws = [best_discard(hand | 1 << code)[0] for code in range(52) if unseen >> code & 1]
+        assert expected_draw_deadwood(hand, unseen) == pytest.approx(sum(draws) / len(draws))
+
+def test_ai_takes_a_discard_that_completes_a_set():
+    game = Rummy(2, seed=1, headless=True)
+    player = game.game_state.players[1]
+    player.clear_hand()
+    player.add_to_hand(cards('7h 7d Kc Qs 2c 9d 4s'))
+    game.discard_pile = cards('7c')
+    game._play_ai_turn(player)
+    assert player.has_card(STANDARD_CARDS[codes('7c')[0]].id)
+    assert player.hand_size == 7 and game.discard_pile[-1] == STANDARD_CARDS[codes('Kc')[0]]
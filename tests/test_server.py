@@ -0,0 +1,120 @@
+import asyncio
+import json
+from src.games.blackjack import Blackjack
+from src.games.session import new_session
+from src.models.events import EventSink, GameEvent, GameEventType
+from src.server import SERVER_AI_SAMPLES, GameServer, event_message
+
+class _Recorder(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def handle_event(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+def _dealer_deals(messages):
+    return [m for m in messages if m['type'] == 'event' and m['event'] == GameEventType.CARDS_DEALT
+            and m['player'] is None]
+
+def test_hole_card_is_hidden_from_every_seat():
+    recorder = _Recorder()
+    game = Blackjack(3, seed=5, headless=True, sinks=[recorder])
+    up_card, hole_card = game.dealer_hand
+    for viewer in ('p0', 'p1', None):
+        dealt = _dealer_deals([event_message(event, viewer) for event in recorder.events])
+        assert [m['cards'] for m in dealt] == [[up_card.code], [None]]
+        assert dealt[1]['details'] == {'target': 'dealer', 'hole': True}
+
+async def _play_one_round(path):
+    reader, writer = await asyncio.open_unix_connection(path)
+
+    async def send(message):
+        writer.write(json.dumps(message).encode() + b'\n')
+        await writer.drain()
+
+    async def receive_until(kind):
+        messages = []
+        while not messages or messages[-1]['type'] != kind:
+            messages.append(json.loads(await reader.readline()))
+        return messages
+
+    await send({'type': 'join', 'table': 't', 'game': 'blackjack', 'players': 3, 'seed': 8})
+    before_turn = await receive_until('turn')
+    await send({'type': 'action', 'action': 'stand'})
+    round_messages = await receive_until('event')
+    while round_messages[-1].get('event') != GameEventType.ROUND_ENDED:
+        round_messages += await receive_until('event')
+    await send({'type': 'leave'})
+    writer.close()
+    return before_turn, round_messages
+
+def test_client_sees_the_hole_card_only_after_the_dealer_plays(tmp_path):
+    async def main():
+        server = GameServer(action_timeout=5.0, max_rounds=2)
+        path = str(tmp_path / 'cards.sock')
+        await server.start_unix(path)
+        play = asyncio.create_task(_play_one_round(path))
+        while 't' not in server.tables:
+            await asyncio.sleep(0)
+        hole_card = server.tables['t'].session.game.dealer_hand[1]
+        before_turn, round_messages = await asyncio.wait_for(play, 10)
+        await server.close()
+        return hole_card, before_turn, round_messages
+
+    hole_card, before_turn, round_messages = asyncio.run(main())
+    dealt = _dealer_deals(before_turn)
+    assert len(dealt) == 2 and dealt[1]['cards'] == [None]
+    # The card shows up nowhere before the client's turn, even as someone else's card
+    seen = [code for m in before_turn if m['type'] == 'event' for code in m['cards']]
+    assert hole_card.code not in seen
+    assert round_messages[-1]['cards'][1] == hole_card.code
+
+def test_poker_tables_use_the_server_sample_budget():
+    async def main():
+        server = GameServer()
+        table = server.open_table('t', 'poker', 4)
+        samples = table.session.game.ai_max_samples
+        await server.close()
+        return samples
+
+    assert asyncio.run(main()) == SERVER_AI_SAMPLES
+
+def test_uncontested_winner_keeps_their_cards_hidden():
+    recorder = _Recorder()
+    session = new_session('poker', 5, 20, seed=4, sinks=[recorder], ai_max_samples=50)
+    session.run()
+    won = [event for event in recorder.events if event.event_type == GameEventType.ROUND_WON]
+    uncontested = [event for event in won if not event.details['showdown']]
+    shown = [event for event in won if event.details['showdown']]
+    assert uncontested and shown
+    for event in uncontested:
+        assert event_message(event, event.player.id)['cards'] == [card.code for card in event.cards]
+        assert event_message(event, None)['cards'] == [None, None]
+    for event in shown:
+        assert event_message(event, None)['cards'] == [card.code for card in event.cards]
+
+def test_a_failing_table_is_closed_with_the_error(tmp_path, caplog):
+    async def main():
+        server = GameServer(action_timeout=5.0)
+        path = str(tmp_path / 'cards.sock')
+        await server.start_unix(path)
+        table = server.open_table('t', 'rummy', 2, seed=1)
+
+        def broken_step(action=None):
+            raise RuntimeError("corrupt state")
+        table.session.step = broken_step
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b'{"type": "join", "table": "t"}\n')
+        messages = []
+        while not messages or messages[-1]['type'] != 'table_closed':
+            messages.append(json.loads(await asyncio.wait_for(reader.readline(), 5)))
+            if messages[-1]['type'] == 'turn':
+                writer.write(b'{"type": "action", "action": "draw_deck"}\n')
+        writer.close()
+        await server.close()
+        return messages[-1], server.tables
+
+    closed, tables = asyncio.run(main())
+    assert closed['reason'] == "Table failed: RuntimeError: corrupt state"
+    assert not tables
+    assert any(record.exc_info and "Table t failed" in record.getMessage() for record in caplog.records)
@@ -0,0 +1,55 @@
+import pytest
+from src.games.blackjack import Blackjack
+from src.games.session import new_session
+from src.models.events import EventSink, GameEvent, GameEventType
+from src.models.player_action import PlayerAction, PlayerActionType
+from src.ui.terminal_ui import TerminalEventSink
+
+GAMES = [('poker', 4, {'ai_max_samples': 50}), ('blackjack', 3, {}), ('rummy', 3, {})]
+
+class _Recorder(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def handle_event(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+@pytest.mark.parametrize('game_type, num_players, config', GAMES)
+def test_headless_games_only_talk_to_sinks(game_type, num_players, config, capsys):
+    recorder = _Recorder()
+    session = new_session(game_type, num_players, 3, seed=2, sinks=[recorder], **config)
+    session.run()
+    assert session.over
+    assert capsys.readouterr().out == ""
+    kinds = [event.event_type for event in recorder.events]
+    assert kinds[0] == GameEventType.GAME_STARTED and GameEventType.PLAYER_ACTED in kinds
+    assert recorder.events[0].details['seed'] == 2
+
+def test_interactive_games_print_events(capsys):
+    game = Blackjack(2, seed=1)
+    assert any(isinstance(sink, TerminalEventSink) for sink in game._event_sinks)
+    game.play_turn(game.game_state.players[1])  # An AI seat, so no prompt
+    assert capsys.readouterr().out
+
+def test_unsubscribed_sinks_hear_nothing_more():
+    recorder = _Recorder()
+    session = new_session('rummy', 2, 3, seed=4, sinks=[recorder])
+    session.game.unsubscribe(recorder)
+    heard = len(recorder.events)
+    session.run()
+    assert len(recorder.events) == heard
+
+def test_external_seats_wait_for_an_action():
+    session = new_session('blackjack', 3, 2, seed=3, external=('p1',))
+    session.run()
+    assert session.awaiting_action and session.to_act.id == 'p1'
+    with pytest.raises(ValueError):
+        session.step()
+    with pytest.raises(ValueError):
+        session.step(PlayerAction(PlayerActionType.DRAW_DECK))  # Not a Blackjack action
+    session.step(PlayerAction(PlayerActionType.STAND))
+    session.run()
+    while not session.over:
+        session.step(PlayerAction(PlayerActionType.STAND) if session.awaiting_action else None)
+    with pytest.raises(RuntimeError):
+        session.step()
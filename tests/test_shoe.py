@@ -0,0 +1,53 @@
+import random
+from src.models.card import standard_deck
+from src.models.shoe import HI_LO, Shoe
+
+def _shoe(decks=2, seed=1):
+    shoe = Shoe('shoe', standard_deck() * decks, penetration=0.75, rng=random.Random(seed))
+    shoe.shuffle()
+    return shoe
+
+def _count(cards):
+    return sum(HI_LO[card.rank - 1] for card in cards)
+
+def test_count_follows_the_cards_dealt():
+    shoe = _shoe()
+    assert shoe.running_count == 0 and shoe.rank_counts == (8,) * 13
+    dealt = []
+    for size in (1, 5, 20, 33):
+        dealt += shoe.draw(size)
+        assert shoe.running_count == _count(dealt)
+        undealt = shoe.undealt()
+        assert shoe.rank_counts == tuple(sum(card.rank == rank for card in undealt) for rank in range(1, 14))
+    assert shoe.true_count == shoe.running_count / (shoe.remaining_cards / 52)
+
+def test_composition_groups_ten_valued_cards():
+    shoe = _shoe(decks=1)
+    assert shoe.composition == [4] * 9 + [16]
+    dealt = shoe.draw(10)
+    tens = sum(card.rank >= 10 for card in dealt)
+    assert sum(shoe.composition) == 42 and shoe.composition[9] == 16 - tens
+
+def test_reshuffled_discards_leave_the_count():
+    shoe = _shoe()
+    dealt = shoe.draw(60)
+    shoe.add_to_discard(dealt[:30])
+    shoe.reshuffle()
+    assert shoe.running_count == _count(dealt[30:])
+    assert sum(shoe.rank_counts) == shoe.remaining_cards == 104 - 30
+
+def test_count_tags_are_configurable():
+    hi_opt = (0, 0, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1)
+    shoe = Shoe('shoe', standard_deck(), rng=random.Random(2), count_tags=hi_opt)
+    shoe.shuffle()
+    dealt = shoe.draw(7)
+    assert shoe.running_count == sum(hi_opt[card.rank - 1] for card in dealt)
+
+def test_snapshot_restores_the_count():
+    shoe = _shoe()
+    shoe.draw(12)
+    snapshot = shoe.snapshot()
+    count, ranks = shoe.running_count, shoe.rank_counts
+    shoe.draw(40)
+    shoe.restore(snapshot)
+    assert (shoe.running_count, shoe.rank_counts) == (count, ranks)
@@ -0,0 +1,37 @@
+import json
+from dataclasses import asdict
+import pytest
+from src.games.autoplay import GameResult
+from src.simulate import SimulationSummary, main, simulate
+
+def test_summary_aggregates_results():
+    summary = SimulationSummary()
+    summary.add(GameResult('poker', 0, 1, winner='p0', rounds=2, turns=10, seats=('p0', 'p1'),
+                           trajectory=[(120, 80), (200, 0)], round_wins={'p0': 2}))
+    summary.add(GameResult('poker', 1, 2, winner='p1', rounds=1, turns=4, seats=('p0', 'p1'),
+                           trajectory=[(60, 140)], round_wins={'p1': 1}))
+    report = summary.to_dict()
+    assert (report['games'], report['hands'], report['turns']) == (2, 3, 14)
+    assert report['hands_per_game'] == 1.5
+    assert report['game_win_rate'] == {'p0': 0.5, 'p1': 0.5}
+    assert report['hand_win_rate'] == {'p0': 2 / 3, 'p1': 1 / 3}
+    # The second round only counts the game that reached it
+    assert report['mean_trajectory'] == [[90.0, 110.0], [200.0, 0.0]]
+
+def test_results_do_not_depend_on_how_work_is_split():
+    inline = sorted(simulate('rummy', 6, 3, 20, root_seed=5, processes=0, chunk_size=4), key=lambda r: r.index)
+    pooled = sorted(simulate('rummy', 6, 3, 20, root_seed=5, processes=2, chunk_size=1), key=lambda r: r.index)
+    assert [asdict(result) for result in pooled] == [asdict(result) for result in inline]
+    assert [result.index for result in inline] == list(range(6))
+
+def test_cli_reports_and_streams_results(tmp_path, capsys):
+    results_path = tmp_path / 'games.jsonl'
+    main(['blackjack', '-n', '5', '-p', '3', '--rounds', '4', '--seed', '9', '--processes', '0',
+          '--chunk-size', '2', '--results', str(results_path), '--quiet'])
+    report = json.loads(capsys.readouterr().out)
+    results = [json.loads(line) for line in results_path.read_text().splitlines()]
+    assert report['game'] == 'blackjack' and report['seed'] == 9
+    assert report['games'] == len(results) == 5
+    assert report['hands'] == sum(result['rounds'] for result in results) == 20
+    wins = sum(sum(result['round_wins'].values()) for result in results)
+    assert sum(report['hand_win_rate'].values()) == pytest.approx(wins / report['hands'])
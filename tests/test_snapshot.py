@@ -0,0 +1,47 @@
+import random
+import pytest
+from src.games.game_codec import serialize_game
+from src.games.session import new_session
+
+GAMES = [('poker', 6), ('blackjack', 5), ('rummy', 4)]
+
+def _session(game_type, num_players, seed):
+    session = new_session(game_type, num_players, 8, seed=seed)
+    if game_type == 'poker':
+        session.game.ai_max_samples = 50  # Fewer equity rollouts keep the test fast
+    return session
+
+@pytest.mark.parametrize('game_type, num_players', GAMES)
+def test_restore_undoes_moves(game_type, num_players):
+    session = _session(game_type, num_players, 21)
+    rng = random.Random(1)
+    while not session.over:
+        if rng.random() < 0.3:
+            game = session.game
+            snapshot = game.snapshot()
+            before = serialize_game(game)
+            for player in game.game_state.players[:3]:
+                game.play_turn(player)
+            game.restore(snapshot)
+            assert serialize_game(game) == before
+        session.step()
+
+@pytest.mark.parametrize('game_type, num_players', GAMES)
+def test_game_continues_identically_after_restores(game_type, num_players):
+    plain = _session(game_type, num_players, 33)
+    plain.run()
+    branched = _session(game_type, num_players, 33)
+    rng = random.Random(2)
+    while not branched.over:
+        if rng.random() < 0.5:
+            game = branched.game
+            snapshot = game.snapshot()
+            for player in game.game_state.players:
+                game.play_turn(player)
+            game.check_win_condition()
+            game.restore(snapshot)
+            # The same snapshot can be restored again
+            game.restore(snapshot)
+        branched.step()
+    assert branched.turns == plain.turns
+    assert serialize_game(branched.game) == serialize_game(plain.game)